@@ -68,14 +68,7 @@ class BuildPanel(QWidget):
         btn_row = QHBoxLayout()
         self._build_btn = QPushButton("Build")
         self._build_btn.setFixedHeight(40)
-        self._build_btn.setStyleSheet("""
-            QPushButton {
-                font-size: 14px; background-color: #28a745; color: white;
-                border: none; border-radius: 6px; padding: 0 20px;
-            }
-            QPushButton:hover { background-color: #218838; }
-            QPushButton:disabled { background-color: #999; }
-        """)
+        self._build_btn.setObjectName("buildBtn")
         self._build_btn.clicked.connect(self._start_build)
         btn_row.addWidget(self._build_btn)
 
@@ -120,14 +113,7 @@ class BuildPanel(QWidget):
         serve_btns = QHBoxLayout()
         self._serve_btn = QPushButton("Start Server")
         self._serve_btn.setFixedHeight(40)
-        self._serve_btn.setStyleSheet("""
-            QPushButton {
-                font-size: 14px; background-color: #0078d4; color: white;
-                border: none; border-radius: 6px; padding: 0 20px;
-            }
-            QPushButton:hover { background-color: #106ebe; }
-            QPushButton:disabled { background-color: #999; }
-        """)
+        self._serve_btn.setObjectName("serveBtn")
         self._serve_btn.clicked.connect(self._start_serve)
         serve_btns.addWidget(self._serve_btn)
 
@@ -139,18 +139,7 @@ class GitHubDialog(QDialog):
         btn_row = QHBoxLayout()
         self._publish_btn = QPushButton("Publish to GitHub Pages")
         self._publish_btn.setFixedHeight(40)
-        self._publish_btn.setStyleSheet("""
-            QPushButton {
-                font-size: 14px;
-                background-color: #28a745;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 0 24px;
-            }
-            QPushButton:hover { background-color: #218838; }
-            QPushButton:disabled { background-color: #666; color: #aaa; }
-        """)
+        self._publish_btn.setObjectName("publishBtn")
         self._publish_btn.clicked.connect(self._publish)
         btn_row.addWidget(self._publish_btn)
         pl.addLayout(btn_row)
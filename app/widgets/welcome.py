@@ -37,12 +37,12 @@ class WelcomeWidget(QWidget):
 
         # Title
         title = QLabel("Web Novel Studio")
-        title.setStyleSheet("font-size: 28px; font-weight: bold;")
+        title.setObjectName("welcomeTitle")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
 
         subtitle = QLabel("Create and manage static web novel sites")
-        subtitle.setStyleSheet("font-size: 14px; color: #666;")
+        subtitle.setObjectName("welcomeSubtitle")
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(subtitle)
 
@@ -54,32 +54,13 @@ class WelcomeWidget(QWidget):
 
         new_btn = QPushButton("New Project")
         new_btn.setFixedSize(180, 50)
-        new_btn.setStyleSheet("""
-            QPushButton {
-                font-size: 15px;
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                border-radius: 6px;
-            }
-            QPushButton:hover { background-color: #106ebe; }
-        """)
+        new_btn.setObjectName("newBtn")
         new_btn.clicked.connect(self.new_project_requested)
         btn_layout.addWidget(new_btn)
 
         open_btn = QPushButton("Open Existing")
         open_btn.setFixedSize(180, 50)
         open_btn.setObjectName("openBtn")
-        open_btn.setStyleSheet("""
-            QPushButton#openBtn {
-                font-size: 15px;
-                background-color: palette(button);
-                color: palette(button-text);
-                border: 1px solid palette(mid);
-                border-radius: 6px;
-            }
-            QPushButton#openBtn:hover { background-color: palette(midlight); }
-        """)
         open_btn.clicked.connect(self.open_project_requested)
         btn_layout.addWidget(open_btn)
 
@@ -1,20 +1,47 @@
 import os
 import shutil
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
 import markdown
 import yaml
 import re
 import glob
 from pathlib import Path
 import hashlib
+import hmac
 import base64
 import json
+import html
+import queue
+import threading
 import datetime
 import argparse
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import multiprocessing
+from functools import lru_cache
+from http.server import HTTPServer
 from urllib.parse import urljoin, urlparse
 from urllib.request import urlopen
 from urllib.error import URLError, HTTPError
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+# Prefer the C-backed lxml parser for HTML scanning, falling back to the stdlib parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+# selectolax (lexbor C backend) is used for attribute extraction when installed
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+# AES (OpenSSL, AES-NI where available) for password-protected chapters; XOR fallback without it
+try:
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+    CRYPTOGRAPHY_AVAILABLE = True
+except ImportError:
+    CRYPTOGRAPHY_AVAILABLE = False
 # Lazy import for optional dependencies
 EBOOKLIB_AVAILABLE = False
 MINIFICATION_AVAILABLE = False
@@ -53,8 +80,51 @@ PAGES_DIR = "./pages"
 TEMPLATES_DIR = "./templates"
 STATIC_DIR = "./static"
 
+# libyaml's C loader when PyYAML was built with it; same safe semantics either way
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Post-build reports are written next to the build directory
+_REPORTS_DIR = os.path.dirname(BUILD_DIR)
+_BROKEN_LINKS_REPORT = os.path.join(_REPORTS_DIR, "broken_links_report.md")
+_ALT_TEXT_REPORT = os.path.join(_REPORTS_DIR, "images_missing_alt_text_report.md")
+_STATS_REPORT = os.path.join(_REPORTS_DIR, "stats_report.md")
+
+# On-disk cache of compiled templates, shared by every template environment so
+# warm builds skip Jinja parsing entirely (entries are keyed on template source)
+TEMPLATE_CACHE_DIR = "./.wngen-jinja-cache"
+
+# Search excerpts keyed on chapter source mtime/size; lives outside BUILD_DIR,
+# which full builds wipe
+SEARCH_EXCERPT_CACHE_FILE = "./.wngen-search-cache.json"
+
+# Link references of built pages keyed on build-relative path, mtime and size;
+# kept out of BUILD_DIR so it is neither wiped by full builds nor published
+LINK_SCAN_CACHE_FILE = "./.wngen-link-scan-cache.json"
+
+class _TemplateBytecodeCache(FileSystemBytecodeCache):
+    """Bytecode cache that creates its directory on first write"""
+    def dump_bytecode(self, bucket):
+        os.makedirs(self.directory, exist_ok=True)
+        super().dump_bytecode(bucket)
+
+_template_bytecode_cache = _TemplateBytecodeCache(TEMPLATE_CACHE_DIR)
+
+def create_template_env(loader):
+    """Create a Jinja2 environment that never re-stats templates and keeps every compiled template"""
+    return Environment(loader=loader, auto_reload=False, cache_size=-1,
+                       bytecode_cache=_template_bytecode_cache)
+
+def reset_template_caches():
+    """Drop in-memory compiled templates so edited templates are picked up on the next render"""
+    env.cache.clear()
+    _novel_template_envs.clear()
+
+def reset_config_caches():
+    """Drop memoized configs (edits are already detected by mtime; this also frees stale entries)"""
+    _load_yaml_config.cache_clear()
+
 # Global template environment (will be enhanced with novel-specific support)
-env = Environment(loader=FileSystemLoader(TEMPLATES_DIR))
+env = create_template_env(FileSystemLoader(TEMPLATES_DIR))
 
 # Global asset map for cache busting
 ASSET_MAP = {}
@@ -65,18 +135,45 @@ def asset_url(filename):
     return ASSET_MAP.get(filename, filename)
 
 
-def _iter_files_for_fingerprint(paths):
-    """Yield file paths for build fingerprinting."""
-    for path in paths:
-        if os.path.isfile(path):
-            yield os.path.abspath(path)
-            continue
-        if not os.path.isdir(path):
+def _scan_fingerprint_dir(dir_path, rel_dir):
+    """Yield (relative path, stat) for files under dir_path, a folder's own files before its subfolders.
+
+    os.scandir supplies entry types from the listing itself (and the stat too on
+    Windows), so a no-change check costs at most one stat per file.
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return
+
+    subdirs = []
+    for entry in entries:
+        try:
+            if entry.is_dir():
+                # Like os.walk, symlinked folders are not descended into
+                if not entry.is_symlink():
+                    subdirs.append(entry)
+                continue
+            yield os.path.join(rel_dir, entry.name), entry.stat()
+        except OSError:
             continue
 
-        for root, _, files in os.walk(path):
-            for name in sorted(files):
-                yield os.path.abspath(os.path.join(root, name))
+    for entry in subdirs:
+        yield from _scan_fingerprint_dir(entry.path, os.path.join(rel_dir, entry.name))
+
+
+def _iter_files_for_fingerprint(paths):
+    """Yield (path relative to the working directory, stat) for build fingerprinting."""
+    for path in paths:
+        rel_path = os.path.relpath(path)
+        if os.path.isdir(path):
+            yield from _scan_fingerprint_dir(path, rel_path)
+        elif os.path.isfile(path):
+            try:
+                yield rel_path, os.stat(path)
+            except OSError:
+                continue
 
 
 def compute_build_fingerprint(include_drafts=False, include_scheduled=False, no_epub=False,
@@ -94,15 +191,10 @@ def compute_build_fingerprint(include_drafts=False, include_scheduled=False, no_
     }
     hash_obj.update(json.dumps(flags, sort_keys=True).encode('utf-8'))
 
-    for file_path in _iter_files_for_fingerprint(tracked_paths):
-        try:
-            stat = os.stat(file_path)
-            rel_path = os.path.relpath(file_path, start=os.getcwd())
-            hash_obj.update(rel_path.encode('utf-8'))
-            hash_obj.update(str(stat.st_size).encode('utf-8'))
-            hash_obj.update(str(int(stat.st_mtime_ns)).encode('utf-8'))
-        except OSError:
-            continue
+    for rel_path, stat in _iter_files_for_fingerprint(tracked_paths):
+        hash_obj.update(rel_path.encode('utf-8'))
+        hash_obj.update(str(stat.st_size).encode('utf-8'))
+        hash_obj.update(str(int(stat.st_mtime_ns)).encode('utf-8'))
 
     return hash_obj.hexdigest()
 
@@ -155,7 +247,7 @@ def get_novel_template_env(novel_slug):
     if novel_slug not in _novel_template_envs:
         template_dirs = get_novel_template_directories(novel_slug)
         loader = FileSystemLoader(template_dirs)
-        novel_env = Environment(loader=loader)
+        novel_env = create_template_env(loader)
         
         # Add the same filters as the global environment
         novel_env.filters['slugify_tag'] = slugify_tag
@@ -187,26 +279,52 @@ def list_novel_custom_templates(novel_slug):
     
     return sorted(custom_templates)
 
+def xor_with_key(data, key):
+    """XOR data with a repeating key as one big-integer operation instead of a per-byte loop"""
+    if not data:
+        return b''
+    key_stream = (key * (len(data) // len(key) + 1))[:len(data)]
+    return (int.from_bytes(data, 'little') ^ int.from_bytes(key_stream, 'little')).to_bytes(len(data), 'little')
+
+# PBKDF2-HMAC-SHA256 work factor for chapter passwords; password-unlock.js uses the same value
+PASSWORD_KDF_ITERATIONS = 200000
+
+def derive_password_keys(password, salt):
+    """Derive (encryption key, verification hash) for a chapter password and salt
+
+    Both come from one salted PBKDF2 master key through HMAC with distinct labels,
+    so the verification hash published in the page reveals nothing about the key.
+    """
+    master_key = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, PASSWORD_KDF_ITERATIONS)
+    encryption_key = hmac.new(master_key, b'wngen chapter encryption', hashlib.sha256).digest()
+    verification_hash = hmac.new(master_key, b'wngen chapter verification', hashlib.sha256).hexdigest()[:32]
+    return encryption_key, verification_hash
+
+def sha256_keystream(key, length):
+    """SHA256(key + 32-bit big-endian block counter) blocks, cut to length bytes"""
+    blocks = (hashlib.sha256(key + i.to_bytes(4, 'big')).digest() for i in range((length + 31) // 32))
+    return b''.join(blocks)[:length]
+
 def encrypt_content_with_password(content, password):
-    """Encrypt content using XOR with SHA256 hash of password"""
-    # Create SHA256 hash of password for consistent key
-    key = hashlib.sha256(password.encode('utf-8')).digest()
-    
-    # Convert content to bytes
-    content_bytes = content.encode('utf-8')
-    
-    # XOR encrypt
-    encrypted = bytearray()
-    for i, byte in enumerate(content_bytes):
-        encrypted.append(byte ^ key[i % len(key)])
-    
-    # Return base64 encoded encrypted content
-    return base64.b64encode(encrypted).decode('utf-8')
+    """Encrypt content for password-unlock.js and return (encrypted content, verification hash)
 
-def create_password_verification_hash(password):
-    """Create a verification hash that can be checked client-side"""
-    # Use a simple hash that can be reproduced in JavaScript
-    return hashlib.sha256(password.encode('utf-8')).hexdigest()[:16]
+    A random 16-byte salt per chapter feeds derive_password_keys. With the cryptography
+    package the result is "aes-ctr-v2:" + base64(salt + counter block + ciphertext);
+    without it, "xor-v2:" + base64(salt + content XOR sha256_keystream).
+    """
+    salt = os.urandom(16)
+    key, verification_hash = derive_password_keys(password, salt)
+    data = content.encode('utf-8')
+    
+    if CRYPTOGRAPHY_AVAILABLE:
+        counter_block = os.urandom(16)
+        encryptor = Cipher(algorithms.AES(key), modes.CTR(counter_block)).encryptor()
+        ciphertext = encryptor.update(data) + encryptor.finalize()
+        payload = 'aes-ctr-v2:' + base64.b64encode(salt + counter_block + ciphertext).decode('ascii')
+    else:
+        encrypted = xor_with_key(data, sha256_keystream(key, len(data)))
+        payload = 'xor-v2:' + base64.b64encode(salt + encrypted).decode('ascii')
+    return payload, verification_hash
 
 def build_footer_content(site_config, novel_config=None, page_type='site'):
     """Build footer content based on site and story configurations"""
@@ -669,13 +787,31 @@ def generate_robots_txt(site_config, novels_data):
     
     return "\n".join(robots_content)
 
+def _config_file_stamp(config_file):
+    """Return (mtime_ns, size) for a config file, or None when it does not exist"""
+    try:
+        stat = os.stat(config_file)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+@lru_cache(maxsize=256)
+def _load_yaml_config(config_path, stamp):
+    """Parse a YAML config file; the stamp is part of the cache key so an edited file is re-read"""
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=YAML_LOADER)
+
+def load_yaml_config(config_file):
+    """Load a YAML config file, reusing the parsed result until the file changes on disk"""
+    stamp = _config_file_stamp(config_file)
+    if stamp is None:
+        return None
+    return _load_yaml_config(os.path.abspath(config_file), stamp)
+
 def load_site_config():
     """Load global site configuration"""
-    config_file = "site_config.yaml"
-    if os.path.exists(config_file):
-        with open(config_file, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
-    return {}
+    config = load_yaml_config("site_config.yaml")
+    return {} if config is None else config
 
 def build_social_meta(site_config, novel_config, chapter_metadata, page_type, title, url):
     """Build social media metadata for a page"""
@@ -888,11 +1024,9 @@ def process_cover_art(novel_slug, novel_config):
 
 def load_authors_config():
     """Load authors configuration from authors.yaml"""
-    authors_file = "authors.yaml"
-    if os.path.exists(authors_file):
-        with open(authors_file, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
-            return config.get('authors', {})
+    config = load_yaml_config("authors.yaml")
+    if config is not None:
+        return config.get('authors', {})
     return {}
 
 def find_author_username(author_name, authors_config):
@@ -1959,11 +2093,8 @@ def generate_download_links(novel_slug, novel_config, site_config, language='en'
 
 def load_novel_config(novel_slug):
     """Load configuration for a specific novel"""
-    config_file = os.path.join(CONTENT_DIR, novel_slug, "config.yaml")
-    if os.path.exists(config_file):
-        with open(config_file, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
-    return {}
+    config = load_yaml_config(os.path.join(CONTENT_DIR, novel_slug, "config.yaml"))
+    return {} if config is None else config
 
 def should_show_tags(novel_config, chapter_front_matter, translation_missing=False):
     """Determine if tags should be shown based on config and front matter"""
@@ -2468,8 +2599,13 @@ def filter_hidden_chapters_from_novel(novel, novel_slug, lang):
     filtered_novel['arcs'] = filtered_arcs
     return filtered_novel
 
+@lru_cache(maxsize=None)
 def load_chapter_content(novel_slug, chapter_id, language='en'):
-    """Load chapter content from markdown file with language support and front matter parsing"""
+    """Load chapter content from markdown file with language support and front matter parsing
+
+    Memoized per build (callers treat the returned metadata as read-only); build_site and
+    perform_incremental_rebuild clear the cache so edited chapters are re-read.
+    """
     # Try language-specific file first
     chapter_file = os.path.join(CONTENT_DIR, novel_slug, "chapters", language, f"{chapter_id}.md")
     if os.path.exists(chapter_file):
@@ -2506,6 +2642,17 @@ def chapter_translation_exists(novel_slug, chapter_id, language):
     chapter_file = os.path.join(CONTENT_DIR, novel_slug, "chapters", language, f"{chapter_id}.md")
     return os.path.exists(chapter_file)
 
+def list_chapter_languages(novel_slug, chapter_id):
+    """List the languages with a translation file for a chapter, from one scan of the chapters folder"""
+    chapters_dir = os.path.join(CONTENT_DIR, novel_slug, "chapters")
+    filename = f"{chapter_id}.md"
+    try:
+        with os.scandir(chapters_dir) as entries:
+            return [entry.name for entry in entries
+                    if entry.is_dir() and os.path.isfile(os.path.join(entry.path, filename))]
+    except OSError:
+        return []
+
 def parse_front_matter(content):
     """Parse YAML front matter from markdown content"""
     front_matter_pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
@@ -2523,8 +2670,9 @@ def parse_front_matter(content):
         # No front matter found
         return {}, content
 
+@lru_cache(maxsize=4096)
 def slugify_tag(tag):
-    """Convert tag to filesystem-safe slug"""
+    """Convert tag to filesystem-safe slug (memoized, tags repeat across novels/languages)"""
     import unicodedata
     # Normalize unicode characters and convert to ASCII where possible
     normalized = unicodedata.normalize('NFKD', tag.lower().strip())
@@ -2862,8 +3010,23 @@ def load_all_novels_data():
     
     return novels
 
+# Rendered markdown keyed on a digest of its source. Chapters are converted again
+# for the search index and on every live-reload rebuild, so most lookups hit
+_markdown_html_cache = {}
+MARKDOWN_CACHE_SIZE = 2048
 
 def convert_markdown_to_html(md_content):
+    key = hashlib.blake2b(md_content.encode('utf-8'), digest_size=16).digest()
+    html_content = _markdown_html_cache.get(key)
+    if html_content is None:
+        html_content = _render_markdown(md_content)
+        if len(_markdown_html_cache) >= MARKDOWN_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _markdown_html_cache[next(iter(_markdown_html_cache))]
+        _markdown_html_cache[key] = html_content
+    return html_content
+
+def _render_markdown(md_content):
     # Hybrid approach: preserve line breaks using a different strategy
     import re
     
@@ -3036,17 +3199,16 @@ def generate_static_pages(site_config):
             breadcrumb_depth = page_slug.count('/') + 2  # +2 for lang and page itself
             
             # Build breadcrumbs
-            breadcrumbs = [{'title': 'Home', 'url': '../' * breadcrumb_depth}]
+            root_url = '../' * breadcrumb_depth
+            breadcrumbs = [{'title': 'Home', 'url': root_url}]
             if '/' in page_slug:
-                parts = page_slug.split('/')
-                url_parts = []
-                for i, part in enumerate(parts[:-1]):
-                    url_parts.append(part)
-                    # Need to go up the full breadcrumb_depth, then navigate to the parent page
-                    parent_url = '../' * breadcrumb_depth + '/'.join(url_parts) + f'/{lang}/'
+                # Need to go up the full breadcrumb_depth, then navigate to each parent page
+                parent_path = ''
+                for part in page_slug.split('/')[:-1]:
+                    parent_path += f'{part}/'
                     breadcrumbs.append({
                         'title': part.title(),
-                        'url': parent_url
+                        'url': f'{root_url}{parent_path}{lang}/'
                     })
             breadcrumbs.append({'title': page_metadata.get('title', page_slug)})
             
@@ -3267,6 +3429,728 @@ def render_template(template_name, novel_slug=None, site_config=None, novel_conf
     
     return template.render(**kwargs)
 
+def render_pages_parallel(template, pages, max_workers=8):
+    """Render (page_dir, context) pairs with one shared template on a thread pool"""
+    def _write_page(page):
+        page_dir, context = page
+        os.makedirs(page_dir, exist_ok=True)
+        with open(os.path.join(page_dir, "index.html"), "w", encoding='utf-8') as f:
+            f.write(template.render(**context))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consume the iterator so worker exceptions propagate
+        list(executor.map(_write_page, pages))
+
+# Build-wide inputs shared by every chapter render, including the per-novel/language
+# chapter groups; set per process by _init_chapter_worker
+_chapter_build_context = {}
+
+# Below this many chapters, worker start-up costs more than rendering in-process saves
+PARALLEL_RENDER_MIN_CHAPTERS = 32
+
+def _init_chapter_worker(include_drafts, include_scheduled, asset_map, build_context):
+    """Mirror build_site's globals in a chapter render process (spawned workers start from a fresh import)"""
+    global INCLUDE_DRAFTS, INCLUDE_SCHEDULED, ASSET_MAP, _chapter_build_context
+    INCLUDE_DRAFTS = include_drafts
+    INCLUDE_SCHEDULED = include_scheduled
+    ASSET_MAP = asset_map
+    _chapter_build_context = build_context
+
+def _render_chapter_worker(task):
+    """Render and write one chapter page (module-level so ProcessPoolExecutor can pickle it)
+
+    task is (group index, chapter index). The novel/language group it points
+    into and the build-wide settings come from _init_chapter_worker, so each
+    worker receives them once instead of with every chapter.
+    """
+    group_index, chapter_index = task
+    site_config = _chapter_build_context['site_config']
+    authors_config = _chapter_build_context['authors_config']
+    serve_mode = _chapter_build_context['serve_mode']
+    serve_port = _chapter_build_context['serve_port']
+    group = _chapter_build_context['chapter_groups'][group_index]
+    novel_slug = group['novel_slug']
+    novel = group['novel']
+    novel_config = group['novel_config']
+    lang = group['lang']
+    lang_dir = group['lang_dir']
+    available_languages = group['available_languages']
+    all_chapters = group['all_chapters']
+    all_chapters_metadata = group['all_chapters_metadata']
+    chapter = all_chapters[chapter_index]
+    chapter_id = chapter["id"]
+    chapter_title = chapter["title"]
+    primary_lang = novel.get('primary_language', 'en')
+    
+    # Check if translation exists for this language
+    translation_exists = (lang == primary_lang) or chapter_translation_exists(novel_slug, chapter_id, lang)
+    
+    if translation_exists:
+        # Generate normal chapter page
+        chapter_content_md, chapter_metadata = load_chapter_content(novel_slug, chapter_id, lang)
+        
+        # Skip draft/scheduled chapters unless flags are set
+        if should_skip_chapter(chapter_metadata, INCLUDE_DRAFTS, INCLUDE_SCHEDULED):
+            # Safe printing that handles Unicode issues
+            safe_title = chapter_title.encode('ascii', errors='replace').decode('ascii')
+            if is_chapter_draft(chapter_metadata):
+                print(f"      Skipping draft chapter: {chapter_id} - {safe_title}")
+            elif is_chapter_scheduled_future(chapter_metadata):
+                publish_date = chapter_metadata.get('published', 'Unknown')
+                print(f"      Skipping scheduled chapter: {chapter_id} - {safe_title} (publish: {publish_date})")
+            else:
+                print(f"      Skipping chapter: {chapter_id} - {safe_title}")
+            return
+        
+        # Determine if this is a manga chapter
+        story_chapter_type = novel_config.get('chapter_type')
+        chapter_type = chapter_metadata.get('type', story_chapter_type)
+        is_manga_chapter = chapter_type == 'manga'
+        
+        # Initialize manga data
+        manga_data = None
+        
+        if is_manga_chapter:
+            # Process manga pages instead of regular content
+            print(f"      Processing manga chapter: {chapter_id}")
+            manga_data = process_manga_pages(novel_slug, chapter_id, lang, chapter_metadata, novel_config)
+            
+            if not manga_data:
+                print(f"      Error: No manga pages found for {chapter_id}, skipping...")
+                return
+            
+            # For manga chapters, still process the markdown content for display below images
+            chapter_content_html = convert_markdown_to_html(chapter_content_md)
+        else:
+            # Process regular chapter images and update markdown
+            chapter_content_md = process_chapter_images(novel_slug, chapter_id, lang, chapter_content_md)
+        
+        # Handle password protection
+        is_password_protected = 'password' in chapter_metadata and chapter_metadata['password']
+        encrypted_content = None
+        password_hash = None
+        password_hint = None
+        
+        if is_password_protected:
+            if not is_manga_chapter:
+                # Convert markdown to HTML first for regular chapters
+                chapter_content_html = convert_markdown_to_html(chapter_content_md)
+            else:
+                # For manga chapters, we'll handle this in the template
+                chapter_content_html = ""
+            
+            # Build the complete content to be encrypted including comments
+            complete_content = f'<div class="chapter-content">\n{chapter_content_html}\n</div>'
+            
+            # Add translator commentary if present
+            if chapter_metadata.get('translator_commentary'):
+                complete_content += f'''
+                        <div class="translator-commentary">
+                            <h3>Translator's Commentary</h3>
+                            <div class="commentary-content">
+                                {chapter_metadata['translator_commentary']}
+                            </div>
+                        </div>'''
+            
+            # Add comments section if enabled
+            comments_enabled = should_enable_comments(site_config, novel_config, chapter_metadata, 'chapter')
+            if comments_enabled:
+                comments_config = build_comments_config(site_config)
+                complete_content += f'''
+                        <div class="comments-section">
+                            <h3>Comments</h3>
+                            <script src="https://utteranc.es/client.js"
+                                    repo="{comments_config['repo']}"
+                                    issue-term="{comments_config['issue_term']}"
+                                    label="{comments_config['label']}"
+                                    theme="{comments_config['theme']}"
+                                    crossorigin="anonymous"
+                                    async>
+                            </script>
+                        </div>'''
+            
+            # Encrypt the complete content
+            encrypted_content, password_hash = encrypt_content_with_password(complete_content, chapter_metadata['password'])
+            password_hint = chapter_metadata.get('password_hint', 'This chapter is password protected.')
+            # Set content to placeholder for password-protected chapters
+            chapter_content_html = '<div id="password-protected-content" style="text-align: center; padding: 2rem;"><p>This chapter is password protected.</p></div>'
+        else:
+            if not is_manga_chapter:
+                # Only convert markdown for non-manga chapters
+                chapter_content_html = convert_markdown_to_html(chapter_content_md)
+
+                # Auto-link glossary terms if enabled
+                if novel_config.get('glossary', {}).get('auto_link', False):
+                    try:
+                        from modules.glossary import load_glossary as _load_gl, auto_link_terms as _auto_link
+                        _gl_data = _load_gl(novel_slug, CONTENT_DIR, lang)
+                        if _gl_data:
+                            chapter_content_html = _auto_link(chapter_content_html, _gl_data)
+                    except Exception:
+                        pass
+
+        # Use navigation function to skip hidden chapters
+        prev_chapter, next_chapter = get_navigation_chapters(novel_slug, all_chapters, chapter_id, lang)
+
+        # Use front matter title if available, otherwise use chapter title from config
+        display_title = chapter_metadata.get('title', chapter_title)
+
+        # Determine what to display based on config and front matter
+        show_tags = should_show_tags(novel_config, chapter_metadata, translation_missing=False)
+        show_metadata = should_show_metadata(novel_config, chapter_metadata)
+        show_translation_notes = should_show_translation_notes(novel_config, chapter_metadata)
+        
+        # Build social metadata for chapter
+        chapter_url = f"{site_config.get('site_url', '').rstrip('/')}/{novel_slug}/{lang}/{chapter_id}/"
+        chapter_social_meta = build_social_meta(site_config, novel_config, chapter_metadata, 'chapter', display_title, chapter_url)
+        chapter_seo_meta = build_seo_meta(site_config, novel_config, chapter_metadata, 'chapter')
+        
+        # Build footer data for chapter
+        footer_data = build_footer_content(site_config, novel_config, 'chapter')
+        
+        # Build comments configuration
+        comments_enabled = should_enable_comments(site_config, novel_config, chapter_metadata, 'chapter')
+        comments_config = build_comments_config(site_config)
+        
+        chapter_dir = os.path.normpath(os.path.join(lang_dir, chapter_id))
+        os.makedirs(chapter_dir, exist_ok=True)
+        with open(os.path.join(chapter_dir, "index.html"), "w", encoding='utf-8') as f:
+            # Filter out hidden chapters for chapter dropdown
+            filtered_novel = filter_hidden_chapters_from_novel(novel, novel_slug, lang)
+            f.write(render_template("chapter.html", 
+                                    novel_slug=novel_slug,
+                                    site_config=site_config,
+                                    novel_config=novel_config,
+                                    novel=filtered_novel,
+                                    novel_title=novel['title'],
+                                    arcs=novel['arcs'],
+                                    chapter=chapter,
+                                    chapter_id=chapter_id,
+                                    chapter_title=display_title,
+                                    chapter_content=chapter_content_html,
+                                    chapter_metadata=chapter_metadata,
+                                    prev_chapter=prev_chapter,
+                                    next_chapter=next_chapter,
+                                    language=lang,
+                                    current_language=lang,
+                                    available_languages=available_languages,
+                                    show_tags=show_tags,
+                                    show_metadata=show_metadata,
+                                    show_translation_notes=show_translation_notes,
+                                    password_protected=is_password_protected,
+                                    is_password_protected=is_password_protected,
+                                    encrypted_content=encrypted_content,
+                                    password_hash=password_hash,
+                                    password_hint=password_hint,
+                                    authors_config=authors_config,
+                                    site_name=site_config.get('site_name', 'Web Novel Collection'),
+                                    social_title=chapter_social_meta['title'],
+                                    social_description=chapter_social_meta['description'],
+                                    social_image=chapter_social_meta['image'],
+                                    social_url=chapter_social_meta['url'],
+                                    seo_meta_description=chapter_seo_meta.get('meta_description'),
+                                    seo_keywords=chapter_social_meta.get('keywords'),
+                                    allow_indexing=chapter_seo_meta.get('allow_indexing', True),
+                                    twitter_handle=site_config.get('social_embeds', {}).get('twitter_handle'),
+                                    footer_copyright=footer_data['copyright'],
+                                    footer_links=footer_data['links'],
+                                    footer_data=footer_data,
+                                    comments_enabled=comments_enabled,
+                                    comments_repo=comments_config['repo'],
+                                    comments_issue_term=comments_config['issue_term'],
+                                    comments_label=comments_config['label'],
+                                    comments_theme=comments_config['theme'],
+                                    is_serve_mode=serve_mode,
+                                    serve_port=serve_port if serve_mode else None,
+                                    is_manga_chapter=is_manga_chapter,
+                                    manga_data=manga_data,
+                                    related_chapters=find_related_chapters(chapter_id, chapter_metadata.get('tags', []), all_chapters_metadata),
+                                    all_chapter_ids=[ch['id'] for ch in all_chapters_metadata],
+                                    typography=novel_config.get('typography'),
+                                    ))
+    else:
+        # Generate chapter page showing "not translated" message in primary language
+        chapter_content_md, chapter_metadata = load_chapter_content(novel_slug, chapter_id, primary_lang)
+        
+        # Skip draft/scheduled chapters unless flags are set (same check as above)
+        if should_skip_chapter(chapter_metadata, INCLUDE_DRAFTS, INCLUDE_SCHEDULED):
+            # Safe printing that handles Unicode issues
+            safe_title = chapter_title.encode('ascii', errors='replace').decode('ascii')
+            if is_chapter_draft(chapter_metadata):
+                print(f"      Skipping draft chapter: {chapter_id} - {safe_title}")
+            elif is_chapter_scheduled_future(chapter_metadata):
+                publish_date = chapter_metadata.get('published', 'Unknown')
+                print(f"      Skipping scheduled chapter: {chapter_id} - {safe_title} (publish: {publish_date})")
+            else:
+                print(f"      Skipping chapter: {chapter_id} - {safe_title}")
+            return
+        
+        # Determine if this is a manga chapter
+        story_chapter_type = novel_config.get('chapter_type')
+        chapter_type = chapter_metadata.get('type', story_chapter_type)
+        is_manga_chapter = chapter_type == 'manga'
+        
+        # Initialize manga data
+        manga_data = None
+        
+        if is_manga_chapter:
+            # Process manga pages instead of regular content (using primary language)
+            print(f"      Processing manga chapter (untranslated): {chapter_id}")
+            manga_data = process_manga_pages(novel_slug, chapter_id, primary_lang, chapter_metadata, novel_config)
+            
+            if not manga_data:
+                print(f"      Error: No manga pages found for {chapter_id}, skipping...")
+                return
+            
+            # For manga chapters, still process the markdown content for display below images
+            chapter_content_html = convert_markdown_to_html(chapter_content_md)
+        else:
+            # Process regular chapter images and update markdown (using primary language)
+            chapter_content_md = process_chapter_images(novel_slug, chapter_id, primary_lang, chapter_content_md)
+        
+        # Handle password protection (same as above)
+        is_password_protected = 'password' in chapter_metadata and chapter_metadata['password']
+        encrypted_content = None
+        password_hash = None
+        password_hint = None
+        
+        if is_password_protected:
+            if not is_manga_chapter:
+                # Convert markdown to HTML first for regular chapters
+                chapter_content_html = convert_markdown_to_html(chapter_content_md)
+            else:
+                # For manga chapters, we'll handle this in the template
+                chapter_content_html = ""
+            
+            # Build the complete content to be encrypted including comments
+            complete_content = f'<div class="chapter-content">\n{chapter_content_html}\n</div>'
+            
+            # Add translator commentary if present
+            if chapter_metadata.get('translator_commentary'):
+                complete_content += f'''
+                        <div class="translator-commentary">
+                            <h3>Translator's Commentary</h3>
+                            <div class="commentary-content">
+                                {chapter_metadata['translator_commentary']}
+                            </div>
+                        </div>'''
+            
+            # Add comments section if enabled
+            comments_enabled = should_enable_comments(site_config, novel_config, chapter_metadata, 'chapter')
+            if comments_enabled:
+                comments_config = build_comments_config(site_config)
+                complete_content += f'''
+                        <div class="comments-section">
+                            <h3>Comments</h3>
+                            <script src="https://utteranc.es/client.js"
+                                    repo="{comments_config['repo']}"
+                                    issue-term="{comments_config['issue_term']}"
+                                    label="{comments_config['label']}"
+                                    theme="{comments_config['theme']}"
+                                    crossorigin="anonymous"
+                                    async>
+                            </script>
+                        </div>'''
+            
+            # Encrypt the complete content
+            encrypted_content, password_hash = encrypt_content_with_password(complete_content, chapter_metadata['password'])
+            password_hint = chapter_metadata.get('password_hint', 'This chapter is password protected.')
+            # Set content to placeholder for password-protected chapters
+            chapter_content_html = '<div id="password-protected-content" style="text-align: center; padding: 2rem;"><p>This chapter is password protected.</p></div>'
+        else:
+            if not is_manga_chapter:
+                # Only convert markdown for non-manga chapters
+                chapter_content_html = convert_markdown_to_html(chapter_content_md)
+        
+        # Use navigation function to skip hidden chapters
+        prev_chapter, next_chapter = get_navigation_chapters(novel_slug, all_chapters, chapter_id, lang)
+
+        # Use front matter title if available, otherwise use chapter title from config
+        display_title = chapter_metadata.get('title', chapter_title)
+        
+        # Determine what to display based on config and front matter
+        show_tags = should_show_tags(novel_config, chapter_metadata, translation_missing=True)
+        show_metadata = should_show_metadata(novel_config, chapter_metadata)
+        show_translation_notes = should_show_translation_notes(novel_config, chapter_metadata)
+        
+        # Build social metadata for chapter (using primary language metadata)
+        chapter_url = f"{site_config.get('site_url', '').rstrip('/')}/{novel_slug}/{lang}/{chapter_id}/"
+        chapter_social_meta = build_social_meta(site_config, novel_config, chapter_metadata, 'chapter', display_title, chapter_url)
+        chapter_seo_meta = build_seo_meta(site_config, novel_config, chapter_metadata, 'chapter')
+        
+        # Build footer data for chapter (missing translation case)
+        footer_data = build_footer_content(site_config, novel_config, 'chapter')
+        
+        # Build comments configuration (missing translation case)
+        comments_enabled = should_enable_comments(site_config, novel_config, chapter_metadata, 'chapter')
+        comments_config = build_comments_config(site_config)
+        
+        chapter_dir = os.path.normpath(os.path.join(lang_dir, chapter_id))
+        os.makedirs(chapter_dir, exist_ok=True)
+        with open(os.path.join(chapter_dir, "index.html"), "w", encoding='utf-8') as f:
+            # Filter out hidden chapters for chapter dropdown
+            filtered_novel = filter_hidden_chapters_from_novel(novel, novel_slug, lang)
+            f.write(render_template("chapter.html", 
+                                    novel_slug=novel_slug,
+                                    site_config=site_config,
+                                    novel_config=novel_config,
+                                    novel=filtered_novel,
+                                    novel_title=novel['title'],
+                                    arcs=novel['arcs'],
+                                    chapter=chapter,
+                                    chapter_id=chapter_id,
+                                    chapter_title=display_title,
+                                    chapter_content=chapter_content_html,
+                                    chapter_metadata=chapter_metadata,
+                                    prev_chapter=prev_chapter,
+                                    next_chapter=next_chapter,
+                                    language=lang,
+                                    current_language=lang,
+                                    primary_language=primary_lang,
+                                    requested_language=lang,
+                                    translation_missing=True,
+                                    available_languages=available_languages,
+                                    show_tags=show_tags,
+                                    show_metadata=show_metadata,
+                                    show_translation_notes=show_translation_notes,
+                                    password_protected=is_password_protected,
+                                    is_password_protected=is_password_protected,
+                                    encrypted_content=encrypted_content,
+                                    password_hash=password_hash,
+                                    password_hint=password_hint,
+                                    authors_config=authors_config,
+                                    site_name=site_config.get('site_name', 'Web Novel Collection'),
+                                    social_title=chapter_social_meta['title'],
+                                    social_description=chapter_social_meta['description'],
+                                    social_image=chapter_social_meta['image'],
+                                    social_url=chapter_social_meta['url'],
+                                    seo_meta_description=chapter_seo_meta.get('meta_description'),
+                                    seo_keywords=chapter_social_meta.get('keywords'),
+                                    allow_indexing=chapter_seo_meta.get('allow_indexing', True),
+                                    twitter_handle=site_config.get('social_embeds', {}).get('twitter_handle'),
+                                    footer_copyright=footer_data['copyright'],
+                                    footer_links=footer_data['links'],
+                                    footer_data=footer_data,
+                                    comments_enabled=comments_enabled,
+                                    comments_repo=comments_config['repo'],
+                                    comments_issue_term=comments_config['issue_term'],
+                                    comments_label=comments_config['label'],
+                                    comments_theme=comments_config['theme'],
+                                    is_serve_mode=serve_mode,
+                                    serve_port=serve_port if serve_mode else None,
+                                    is_manga_chapter=is_manga_chapter,
+                                    manga_data=manga_data,
+                                    related_chapters=find_related_chapters(chapter_id, chapter_metadata.get('tags', []), all_chapters_metadata),
+                                    all_chapter_ids=[ch['id'] for ch in all_chapters_metadata],
+                                    typography=novel_config.get('typography'),
+                                    ))
+
+def _process_pool_context():
+    """Start method for the build's process pools
+
+    Forking copies locks held by other threads, so once the dev server or file
+    watcher threads exist, workers come from a forkserver instead. Single-threaded
+    builds keep the platform default.
+    """
+    if threading.active_count() > 1 and 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return None
+
+def render_chapter_pages(chapter_groups, site_config, authors_config, serve_mode=False, serve_port=8000):
+    """Render every queued chapter page, spread across CPU cores for larger sites"""
+    init_args = (INCLUDE_DRAFTS, INCLUDE_SCHEDULED, ASSET_MAP, {
+        'site_config': site_config,
+        'authors_config': authors_config,
+        'serve_mode': serve_mode,
+        'serve_port': serve_port,
+        'chapter_groups': chapter_groups,
+    })
+    chapter_tasks = [(group_index, chapter_index)
+                     for group_index, group in enumerate(chapter_groups)
+                     for chapter_index in range(len(group['all_chapters']))]
+    if len(chapter_tasks) < PARALLEL_RENDER_MIN_CHAPTERS:
+        _init_chapter_worker(*init_args)
+        for task in chapter_tasks:
+            _render_chapter_worker(task)
+        return
+    
+    print(f"  Rendering {len(chapter_tasks)} chapter pages across {os.cpu_count()} processes...")
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=_process_pool_context(),
+                             initializer=_init_chapter_worker, initargs=init_args) as executor:
+        # Consume the results so a failed chapter still aborts the build
+        for _ in executor.map(_render_chapter_worker, chapter_tasks, chunksize=8):
+            pass
+
+def apply_processed_cover_art(novel):
+    """Process a novel's cover art and point its front page and arc data at the results"""
+    novel_slug = novel['slug']
+    novel_config = load_novel_config(novel_slug)
+    
+    # Process cover art images and get processed paths
+    processed_images = process_cover_art(novel_slug, novel_config)
+    
+    # Update novel data with processed image paths
+    if processed_images.get('story_cover'):
+        if 'front_page' not in novel:
+            novel['front_page'] = {}
+        novel['front_page']['cover_art'] = processed_images['story_cover']
+    
+    # Update arc data with processed image paths
+    if novel_config.get('arcs') and novel.get('arcs'):
+        for i, arc in enumerate(novel_config['arcs']):
+            if i < len(novel['arcs']):  # Safety check
+                arc_cover_key = f'arc_{i}_cover'
+                if processed_images.get(arc_cover_key):
+                    novel['arcs'][i]['cover_art'] = processed_images[arc_cover_key]
+
+def queue_novel_pages(novel, site_config, all_novels_data, chapter_groups):
+    """Write a novel's RSS feed, TOC and tag pages, queueing its chapter pages onto chapter_groups
+
+    One group per language holds the inputs its chapter pages share.
+    """
+    novel_slug = novel['slug']
+    novel_config = load_novel_config(novel_slug)
+    available_languages = get_available_languages(novel_slug)
+    novel['languages'] = available_languages
+    
+    # Create novel directory
+    novel_dir = os.path.normpath(os.path.join(BUILD_DIR, novel_slug))
+    os.makedirs(novel_dir, exist_ok=True)
+
+    # Generate story-specific RSS feed
+    story_rss_content = generate_rss_feed(site_config, all_novels_data, novel_config, novel_slug)
+    with open(os.path.join(novel_dir, "rss.xml"), "w", encoding='utf-8') as f:
+        f.write(story_rss_content)
+
+    # Process each language
+    for lang in available_languages:
+        lang_dir = os.path.normpath(os.path.join(novel_dir, lang))
+        os.makedirs(lang_dir, exist_ok=True)
+
+        # Render table of contents page for this novel/language
+        toc_dir = os.path.normpath(os.path.join(lang_dir, "toc"))
+        os.makedirs(toc_dir, exist_ok=True)
+        
+        # Build social metadata for TOC
+        toc_url = f"{site_config.get('site_url', '').rstrip('/')}/{novel_slug}/{lang}/toc/"
+        toc_social_meta = build_social_meta(site_config, novel_config, {}, 'toc', f"{novel.get('title', '')} - Table of Contents", toc_url)
+        toc_seo_meta = build_seo_meta(site_config, novel_config, {}, 'toc')
+        
+        # Build footer data for TOC
+        footer_data = build_footer_content(site_config, novel_config, 'toc')
+        
+        # Build comments configuration for TOC
+        toc_comments_enabled = should_enable_comments(site_config, novel_config, {}, 'toc')
+        comments_config = build_comments_config(site_config)
+        
+        # Filter out hidden chapters for TOC display
+        filtered_novel = filter_hidden_chapters_from_novel(novel, novel_slug, lang)
+        
+        # Calculate story length statistics
+        story_length_stats = calculate_story_length_stats(novel_slug, lang)
+        
+        # Determine which unit to display based on configuration
+        length_config = novel_config.get('length_display', {})
+        language_units = length_config.get('language_units', {})
+        default_unit = length_config.get('default_unit', 'words')
+        
+        # Check for language-specific override, fall back to default
+        display_unit = language_units.get(lang, default_unit)
+        
+        if display_unit == 'characters':
+            story_length_count = story_length_stats['characters']
+            story_length_unit = 'characters'
+        else:
+            story_length_count = story_length_stats['words']
+            story_length_unit = 'words'
+        
+        # Process story metadata with the correct display unit
+        story_metadata = process_story_metadata(novel_config, story_length_stats, site_config, novel_slug, lang, story_length_unit, story_length_count)
+        
+        # Generate download links for this story
+        download_links = generate_download_links(novel_slug, novel_config, site_config, lang)
+        
+        # Collect all chapter IDs for client-side progress features
+        toc_all_chapter_ids = []
+        for arc in filtered_novel.get("arcs", []):
+            for ch in arc.get("chapters", []):
+                toc_all_chapter_ids.append(ch["id"])
+
+        with open(os.path.join(toc_dir, "index.html"), "w", encoding='utf-8') as f:
+            f.write(render_template("toc.html",
+                                   novel_slug=novel_slug,
+                                   site_config=site_config,
+                                   novel_config=novel_config,
+                                   novel=filtered_novel,
+                                   current_language=lang,
+                                   available_languages=available_languages,
+                                   all_chapter_ids=toc_all_chapter_ids,
+                                   story_length_count=story_length_count,
+                                   story_length_unit=story_length_unit,
+                                   site_name=site_config.get('site_name', 'Web Novel Collection'),
+                                   social_title=toc_social_meta['title'],
+                                   social_description=toc_social_meta['description'],
+                                   social_image=toc_social_meta['image'],
+                                   social_url=toc_social_meta['url'],
+                                   seo_meta_description=toc_seo_meta.get('meta_description'),
+                                   seo_keywords=toc_social_meta.get('keywords'),
+                                   allow_indexing=toc_seo_meta.get('allow_indexing', True),
+                                   twitter_handle=site_config.get('social_embeds', {}).get('twitter_handle'),
+                                   footer_data=footer_data,
+                                   download_links=download_links,
+                                   comments_enabled=toc_comments_enabled,
+                                   comments_repo=comments_config['repo'],
+                                   comments_issue_term=comments_config['issue_term'],
+                                   comments_label=comments_config['label'],
+                                   comments_theme=comments_config['theme'],
+                                   story_metadata=story_metadata,
+                                   glossary_enabled=novel_config.get('glossary', {}).get('enabled', False),
+                                   characters_enabled=os.path.exists(os.path.join(CONTENT_DIR, novel_slug, 'characters.yaml'))))
+
+        # Queue chapter pages for this novel/language
+        all_chapters = []
+        for arc in filtered_novel.get("arcs", []):
+            all_chapters.extend(arc.get("chapters", []))
+
+        # Pre-load chapter metadata for related chapters and TOC tag chips
+        all_chapters_metadata = []
+        primary_lang = novel.get('primary_language', 'en')
+        for ch in all_chapters:
+            ch_lang = lang if ((lang == primary_lang) or chapter_translation_exists(novel_slug, ch["id"], lang)) else primary_lang
+            try:
+                _, ch_meta = load_chapter_content(novel_slug, ch["id"], ch_lang)
+                if not should_skip_chapter(ch_meta, INCLUDE_DRAFTS, INCLUDE_SCHEDULED):
+                    all_chapters_metadata.append({
+                        'id': ch['id'],
+                        'title': ch_meta.get('title', ch['title']),
+                        'tags': ch_meta.get('tags', []) or [],
+                    })
+            except Exception:
+                pass
+
+        chapter_groups.append({
+            'novel_slug': novel_slug,
+            'novel': novel,
+            'novel_config': novel_config,
+            'lang': lang,
+            'lang_dir': lang_dir,
+            'available_languages': available_languages,
+            'all_chapters': all_chapters,
+            'all_chapters_metadata': all_chapters_metadata,
+        })
+
+    # Generate tag pages for this language (after all chapters are processed)
+    for lang in available_languages:
+        lang_dir = os.path.join(novel_dir, lang)
+        tags_data = collect_tags_for_novel(novel_slug, lang)
+        if tags_data:
+            # Create tags directory
+            tags_dir = os.path.normpath(os.path.join(lang_dir, "tags"))
+            os.makedirs(tags_dir, exist_ok=True)
+            
+            # Create tag slug mapping for templates
+            tag_slug_map = {tag: slugify_tag(tag) for tag in tags_data.keys()}
+            
+            # Generate main tags index page
+            with open(os.path.join(tags_dir, "index.html"), "w", encoding='utf-8') as f:
+                f.write(render_template("tags_index.html",
+                                        novel_slug=novel_slug,
+                                        novel=novel,
+                                        tags_data=tags_data,
+                                        tag_slug_map=tag_slug_map,
+                                        current_language=lang,
+                                        available_languages=available_languages))
+            
+            # Build cross-language tag mapping (identical for every tag in this language)
+            cross_lang_tags = {}
+            for other_lang in available_languages:
+                if other_lang != lang:
+                    other_tags_data = collect_tags_for_novel(novel_slug, other_lang)
+                    # For now, just check if any tags exist in other language
+                    # (proper cross-language tag mapping would require more complex logic)
+                    if other_tags_data:
+                        cross_lang_tags[other_lang] = None  # Don't show cross-language links for now
+            
+            # Generate individual tag pages with a single compiled template
+            tag_template = get_novel_template_env(novel_slug).get_template("tag_page.html")
+            tag_pages = []
+            for tag, chapters in tags_data.items():
+                tag_slug = tag_slug_map[tag]
+                tag_page_dir = os.path.normpath(os.path.join(tags_dir, tag_slug))
+                tag_pages.append((tag_page_dir, {
+                    'novel_slug': novel_slug,
+                    'novel': novel,
+                    'tag_name': tag,
+                    'tag_slug': tag_slug,
+                    'chapters': chapters,
+                    'current_language': lang,
+                    'available_languages': available_languages,
+                    'cross_lang_tags': cross_lang_tags,
+                }))
+            render_pages_parallel(tag_template, tag_pages)
+
+def generate_novel_reference_pages(novel, site_config):
+    """Write a novel's glossary and character pages"""
+    from modules.glossary import load_glossary, group_terms_by_category
+    from modules.characters import load_characters
+
+    novel_slug = novel['slug']
+    novel_config = load_novel_config(novel_slug)
+    available_languages = novel_config.get('languages', {}).get('available', ['en'])
+    novel_dir = os.path.join(BUILD_DIR, novel_slug)
+    footer_data = build_footer_content(site_config, novel_config, 'page')
+
+    # Glossary pages
+    if novel_config.get('glossary', {}).get('enabled', False):
+        for lang in available_languages:
+            glossary_data = load_glossary(novel_slug, CONTENT_DIR, lang)
+            if glossary_data:
+                grouped = group_terms_by_category(glossary_data)
+                glossary_dir = os.path.normpath(os.path.join(novel_dir, lang, "glossary"))
+                os.makedirs(glossary_dir, exist_ok=True)
+                with open(os.path.join(glossary_dir, "index.html"), "w", encoding='utf-8') as f:
+                    f.write(render_template("glossary.html",
+                                            novel=novel,
+                                            novel_slug=novel_slug,
+                                            grouped_terms=grouped,
+                                            current_language=lang,
+                                            available_languages=available_languages,
+                                            footer_data=footer_data))
+                print(f"  Generated glossary page for {novel_slug}/{lang}")
+
+    # Character pages
+    chars_data = load_characters(novel_slug, CONTENT_DIR)
+    if chars_data and chars_data.get('characters'):
+        for lang in available_languages:
+            chars_dir = os.path.normpath(os.path.join(novel_dir, lang, "characters"))
+            os.makedirs(chars_dir, exist_ok=True)
+
+            # Character index page
+            with open(os.path.join(chars_dir, "index.html"), "w", encoding='utf-8') as f:
+                f.write(render_template("characters.html",
+                                        novel=novel,
+                                        novel_slug=novel_slug,
+                                        characters=chars_data['characters'],
+                                        current_language=lang,
+                                        footer_data=footer_data))
+
+            # Individual character detail pages
+            char_template = get_novel_template_env(novel_slug).get_template("character_detail.html")
+            char_pages = []
+            for char in chars_data['characters']:
+                char_slug = char.get('slug', char.get('name', '').lower().replace(' ', '-'))
+                char_dir = os.path.normpath(os.path.join(chars_dir, char_slug))
+                char_pages.append((char_dir, {
+                    'novel': novel,
+                    'novel_slug': novel_slug,
+                    'character': char,
+                    'current_language': lang,
+                    'footer_data': footer_data,
+                }))
+            render_pages_parallel(char_template, char_pages)
+
+            print(f"  Generated character pages for {novel_slug}/{lang}")
+
 def build_site(include_drafts=False, include_scheduled=False, no_epub=False, optimize_images=False,
                serve_mode=False, serve_port=8000, no_minify=False, incremental=False):
     global INCLUDE_DRAFTS, INCLUDE_SCHEDULED, ASSET_MAP
@@ -3301,6 +4185,10 @@ def build_site(include_drafts=False, include_scheduled=False, no_epub=False, opt
             return
 
     print("Building site...")
+    # Templates and configs are memoized, so start every full build from clean caches
+    reset_template_caches()
+    reset_config_caches()
+    load_chapter_content.cache_clear()
     if os.path.exists(BUILD_DIR):
         # On Windows, retry deletion if it fails due to file locks
         import time
@@ -3337,25 +4225,7 @@ def build_site(include_drafts=False, include_scheduled=False, no_epub=False, opt
     
     # Process cover art for all novels first
     for novel in all_novels_data:
-        novel_slug = novel['slug']
-        novel_config = load_novel_config(novel_slug)
-        
-        # Process cover art images and get processed paths
-        processed_images = process_cover_art(novel_slug, novel_config)
-        
-        # Update novel data with processed image paths
-        if processed_images.get('story_cover'):
-            if 'front_page' not in novel:
-                novel['front_page'] = {}
-            novel['front_page']['cover_art'] = processed_images['story_cover']
-        
-        # Update arc data with processed image paths
-        if novel_config.get('arcs') and novel.get('arcs'):
-            for i, arc in enumerate(novel_config['arcs']):
-                if i < len(novel['arcs']):  # Safety check
-                    arc_cover_key = f'arc_{i}_cover'
-                    if processed_images.get(arc_cover_key):
-                        novel['arcs'][i]['cover_art'] = processed_images[arc_cover_key]
+        apply_processed_cover_art(novel)
     
     # Filter novels for front page display
     front_page_novels_data = []
@@ -3626,606 +4496,18 @@ def build_site(include_drafts=False, include_scheduled=False, no_epub=False, opt
                                        twitter_handle=site_config.get('social_embeds', {}).get('twitter_handle'),
                                        footer_data=footer_data))
 
+    # Chapter pages are queued per novel/language and rendered together after this loop
+    chapter_groups = []
+
     # Process each novel (including hidden ones)
     for novel in all_novels_data:
-        novel_slug = novel['slug']
-        novel_config = load_novel_config(novel_slug)
-        available_languages = get_available_languages(novel_slug)
-        novel['languages'] = available_languages
-        
-        # Create novel directory
-        novel_dir = os.path.normpath(os.path.join(BUILD_DIR, novel_slug))
-        os.makedirs(novel_dir, exist_ok=True)
+        queue_novel_pages(novel, site_config, all_novels_data, chapter_groups)
 
-        # Generate story-specific RSS feed
-        story_rss_content = generate_rss_feed(site_config, all_novels_data, novel_config, novel_slug)
-        with open(os.path.join(novel_dir, "rss.xml"), "w", encoding='utf-8') as f:
-            f.write(story_rss_content)
+    render_chapter_pages(chapter_groups, site_config, authors_config, serve_mode=serve_mode, serve_port=serve_port)
 
-        # Process each language
-        for lang in available_languages:
-            lang_dir = os.path.normpath(os.path.join(novel_dir, lang))
-            os.makedirs(lang_dir, exist_ok=True)
-
-            # Render table of contents page for this novel/language
-            toc_dir = os.path.normpath(os.path.join(lang_dir, "toc"))
-            os.makedirs(toc_dir, exist_ok=True)
-            
-            # Build social metadata for TOC
-            toc_url = f"{site_config.get('site_url', '').rstrip('/')}/{novel_slug}/{lang}/toc/"
-            toc_social_meta = build_social_meta(site_config, novel_config, {}, 'toc', f"{novel.get('title', '')} - Table of Contents", toc_url)
-            toc_seo_meta = build_seo_meta(site_config, novel_config, {}, 'toc')
-            
-            # Build footer data for TOC
-            footer_data = build_footer_content(site_config, novel_config, 'toc')
-            
-            # Build comments configuration for TOC
-            toc_comments_enabled = should_enable_comments(site_config, novel_config, {}, 'toc')
-            comments_config = build_comments_config(site_config)
-            
-            # Filter out hidden chapters for TOC display
-            filtered_novel = filter_hidden_chapters_from_novel(novel, novel_slug, lang)
-            
-            # Calculate story length statistics
-            story_length_stats = calculate_story_length_stats(novel_slug, lang)
-            
-            # Determine which unit to display based on configuration
-            length_config = novel_config.get('length_display', {})
-            language_units = length_config.get('language_units', {})
-            default_unit = length_config.get('default_unit', 'words')
-            
-            # Check for language-specific override, fall back to default
-            display_unit = language_units.get(lang, default_unit)
-            
-            if display_unit == 'characters':
-                story_length_count = story_length_stats['characters']
-                story_length_unit = 'characters'
-            else:
-                story_length_count = story_length_stats['words']
-                story_length_unit = 'words'
-            
-            # Process story metadata with the correct display unit
-            story_metadata = process_story_metadata(novel_config, story_length_stats, site_config, novel_slug, lang, story_length_unit, story_length_count)
-            
-            # Generate download links for this story
-            download_links = generate_download_links(novel_slug, novel_config, site_config, lang)
-            
-            # Collect all chapter IDs for client-side progress features
-            toc_all_chapter_ids = []
-            for arc in filtered_novel.get("arcs", []):
-                for ch in arc.get("chapters", []):
-                    toc_all_chapter_ids.append(ch["id"])
-
-            with open(os.path.join(toc_dir, "index.html"), "w", encoding='utf-8') as f:
-                f.write(render_template("toc.html",
-                                       novel_slug=novel_slug,
-                                       site_config=site_config,
-                                       novel_config=novel_config,
-                                       novel=filtered_novel,
-                                       current_language=lang,
-                                       available_languages=available_languages,
-                                       all_chapter_ids=toc_all_chapter_ids,
-                                       story_length_count=story_length_count,
-                                       story_length_unit=story_length_unit,
-                                       site_name=site_config.get('site_name', 'Web Novel Collection'),
-                                       social_title=toc_social_meta['title'],
-                                       social_description=toc_social_meta['description'],
-                                       social_image=toc_social_meta['image'],
-                                       social_url=toc_social_meta['url'],
-                                       seo_meta_description=toc_seo_meta.get('meta_description'),
-                                       seo_keywords=toc_social_meta.get('keywords'),
-                                       allow_indexing=toc_seo_meta.get('allow_indexing', True),
-                                       twitter_handle=site_config.get('social_embeds', {}).get('twitter_handle'),
-                                       footer_data=footer_data,
-                                       download_links=download_links,
-                                       comments_enabled=toc_comments_enabled,
-                                       comments_repo=comments_config['repo'],
-                                       comments_issue_term=comments_config['issue_term'],
-                                       comments_label=comments_config['label'],
-                                       comments_theme=comments_config['theme'],
-                                       story_metadata=story_metadata,
-                                       glossary_enabled=novel_config.get('glossary', {}).get('enabled', False),
-                                       characters_enabled=os.path.exists(os.path.join(CONTENT_DIR, novel_slug, 'characters.yaml'))))
-
-            # Render chapter pages for this novel/language
-            all_chapters = []
-            for arc in filtered_novel.get("arcs", []):
-                all_chapters.extend(arc.get("chapters", []))
-
-            # Pre-load chapter metadata for related chapters and TOC tag chips
-            all_chapters_metadata = []
-            primary_lang = novel.get('primary_language', 'en')
-            for ch in all_chapters:
-                ch_lang = lang if ((lang == primary_lang) or chapter_translation_exists(novel_slug, ch["id"], lang)) else primary_lang
-                try:
-                    _, ch_meta = load_chapter_content(novel_slug, ch["id"], ch_lang)
-                    if not should_skip_chapter(ch_meta, INCLUDE_DRAFTS, INCLUDE_SCHEDULED):
-                        all_chapters_metadata.append({
-                            'id': ch['id'],
-                            'title': ch_meta.get('title', ch['title']),
-                            'tags': ch_meta.get('tags', []) or [],
-                        })
-                except Exception:
-                    pass
-
-            for i, chapter in enumerate(all_chapters):
-                chapter_id = chapter["id"]
-                chapter_title = chapter["title"]
-                primary_lang = novel.get('primary_language', 'en')
-                
-                # Check if translation exists for this language
-                translation_exists = (lang == primary_lang) or chapter_translation_exists(novel_slug, chapter_id, lang)
-                
-                if translation_exists:
-                    # Generate normal chapter page
-                    chapter_content_md, chapter_metadata = load_chapter_content(novel_slug, chapter_id, lang)
-                    
-                    # Skip draft/scheduled chapters unless flags are set
-                    if should_skip_chapter(chapter_metadata, INCLUDE_DRAFTS, INCLUDE_SCHEDULED):
-                        # Safe printing that handles Unicode issues
-                        safe_title = chapter_title.encode('ascii', errors='replace').decode('ascii')
-                        if is_chapter_draft(chapter_metadata):
-                            print(f"      Skipping draft chapter: {chapter_id} - {safe_title}")
-                        elif is_chapter_scheduled_future(chapter_metadata):
-                            publish_date = chapter_metadata.get('published', 'Unknown')
-                            print(f"      Skipping scheduled chapter: {chapter_id} - {safe_title} (publish: {publish_date})")
-                        else:
-                            print(f"      Skipping chapter: {chapter_id} - {safe_title}")
-                        continue
-                    
-                    # Determine if this is a manga chapter
-                    story_chapter_type = novel_config.get('chapter_type')
-                    chapter_type = chapter_metadata.get('type', story_chapter_type)
-                    is_manga_chapter = chapter_type == 'manga'
-                    
-                    # Initialize manga data
-                    manga_data = None
-                    
-                    if is_manga_chapter:
-                        # Process manga pages instead of regular content
-                        print(f"      Processing manga chapter: {chapter_id}")
-                        manga_data = process_manga_pages(novel_slug, chapter_id, lang, chapter_metadata, novel_config)
-                        
-                        if not manga_data:
-                            print(f"      Error: No manga pages found for {chapter_id}, skipping...")
-                            continue
-                        
-                        # For manga chapters, still process the markdown content for display below images
-                        chapter_content_html = convert_markdown_to_html(chapter_content_md)
-                    else:
-                        # Process regular chapter images and update markdown
-                        chapter_content_md = process_chapter_images(novel_slug, chapter_id, lang, chapter_content_md)
-                    
-                    # Handle password protection
-                    is_password_protected = 'password' in chapter_metadata and chapter_metadata['password']
-                    encrypted_content = None
-                    password_hash = None
-                    password_hint = None
-                    
-                    if is_password_protected:
-                        if not is_manga_chapter:
-                            # Convert markdown to HTML first for regular chapters
-                            chapter_content_html = convert_markdown_to_html(chapter_content_md)
-                        else:
-                            # For manga chapters, we'll handle this in the template
-                            chapter_content_html = ""
-                        
-                        # Build the complete content to be encrypted including comments
-                        complete_content = f'<div class="chapter-content">\n{chapter_content_html}\n</div>'
-                        
-                        # Add translator commentary if present
-                        if chapter_metadata.get('translator_commentary'):
-                            complete_content += f'''
-                        <div class="translator-commentary">
-                            <h3>Translator's Commentary</h3>
-                            <div class="commentary-content">
-                                {chapter_metadata['translator_commentary']}
-                            </div>
-                        </div>'''
-                        
-                        # Add comments section if enabled
-                        comments_enabled = should_enable_comments(site_config, novel_config, chapter_metadata, 'chapter')
-                        if comments_enabled:
-                            comments_config = build_comments_config(site_config)
-                            complete_content += f'''
-                        <div class="comments-section">
-                            <h3>Comments</h3>
-                            <script src="https://utteranc.es/client.js"
-                                    repo="{comments_config['repo']}"
-                                    issue-term="{comments_config['issue_term']}"
-                                    label="{comments_config['label']}"
-                                    theme="{comments_config['theme']}"
-                                    crossorigin="anonymous"
-                                    async>
-                            </script>
-                        </div>'''
-                        
-                        # Encrypt the complete content
-                        encrypted_content = encrypt_content_with_password(complete_content, chapter_metadata['password'])
-                        password_hash = create_password_verification_hash(chapter_metadata['password'])
-                        password_hint = chapter_metadata.get('password_hint', 'This chapter is password protected.')
-                        # Set content to placeholder for password-protected chapters
-                        chapter_content_html = '<div id="password-protected-content" style="text-align: center; padding: 2rem;"><p>This chapter is password protected.</p></div>'
-                    else:
-                        if not is_manga_chapter:
-                            # Only convert markdown for non-manga chapters
-                            chapter_content_html = convert_markdown_to_html(chapter_content_md)
-
-                            # Auto-link glossary terms if enabled
-                            if novel_config.get('glossary', {}).get('auto_link', False):
-                                try:
-                                    from modules.glossary import load_glossary as _load_gl, auto_link_terms as _auto_link
-                                    _gl_data = _load_gl(novel_slug, CONTENT_DIR, lang)
-                                    if _gl_data:
-                                        chapter_content_html = _auto_link(chapter_content_html, _gl_data)
-                                except Exception:
-                                    pass
-
-                    # Use navigation function to skip hidden chapters
-                    prev_chapter, next_chapter = get_navigation_chapters(novel_slug, all_chapters, chapter_id, lang)
-
-                    # Use front matter title if available, otherwise use chapter title from config
-                    display_title = chapter_metadata.get('title', chapter_title)
-
-                    # Determine what to display based on config and front matter
-                    show_tags = should_show_tags(novel_config, chapter_metadata, translation_missing=False)
-                    show_metadata = should_show_metadata(novel_config, chapter_metadata)
-                    show_translation_notes = should_show_translation_notes(novel_config, chapter_metadata)
-                    
-                    # Build social metadata for chapter
-                    chapter_url = f"{site_config.get('site_url', '').rstrip('/')}/{novel_slug}/{lang}/{chapter_id}/"
-                    chapter_social_meta = build_social_meta(site_config, novel_config, chapter_metadata, 'chapter', display_title, chapter_url)
-                    chapter_seo_meta = build_seo_meta(site_config, novel_config, chapter_metadata, 'chapter')
-                    
-                    # Build footer data for chapter
-                    footer_data = build_footer_content(site_config, novel_config, 'chapter')
-                    
-                    # Build comments configuration
-                    comments_enabled = should_enable_comments(site_config, novel_config, chapter_metadata, 'chapter')
-                    comments_config = build_comments_config(site_config)
-                    
-                    chapter_dir = os.path.normpath(os.path.join(lang_dir, chapter_id))
-                    os.makedirs(chapter_dir, exist_ok=True)
-                    with open(os.path.join(chapter_dir, "index.html"), "w", encoding='utf-8') as f:
-                        # Filter out hidden chapters for chapter dropdown
-                        filtered_novel = filter_hidden_chapters_from_novel(novel, novel_slug, lang)
-                        f.write(render_template("chapter.html", 
-                                                novel_slug=novel_slug,
-                                                site_config=site_config,
-                                                novel_config=novel_config,
-                                                novel=filtered_novel,
-                                                novel_title=novel['title'],
-                                                arcs=novel['arcs'],
-                                                chapter=chapter,
-                                                chapter_id=chapter_id,
-                                                chapter_title=display_title,
-                                                chapter_content=chapter_content_html,
-                                                chapter_metadata=chapter_metadata,
-                                                prev_chapter=prev_chapter,
-                                                next_chapter=next_chapter,
-                                                language=lang,
-                                                current_language=lang,
-                                                available_languages=available_languages,
-                                                show_tags=show_tags,
-                                                show_metadata=show_metadata,
-                                                show_translation_notes=show_translation_notes,
-                                                password_protected=is_password_protected,
-                                                is_password_protected=is_password_protected,
-                                                encrypted_content=encrypted_content,
-                                                password_hash=password_hash,
-                                                password_hint=password_hint,
-                                                authors_config=authors_config,
-                                                site_name=site_config.get('site_name', 'Web Novel Collection'),
-                                                social_title=chapter_social_meta['title'],
-                                                social_description=chapter_social_meta['description'],
-                                                social_image=chapter_social_meta['image'],
-                                                social_url=chapter_social_meta['url'],
-                                                seo_meta_description=chapter_seo_meta.get('meta_description'),
-                                                seo_keywords=chapter_social_meta.get('keywords'),
-                                                allow_indexing=chapter_seo_meta.get('allow_indexing', True),
-                                                twitter_handle=site_config.get('social_embeds', {}).get('twitter_handle'),
-                                                footer_copyright=footer_data['copyright'],
-                                                footer_links=footer_data['links'],
-                                                footer_data=footer_data,
-                                                comments_enabled=comments_enabled,
-                                                comments_repo=comments_config['repo'],
-                                                comments_issue_term=comments_config['issue_term'],
-                                                comments_label=comments_config['label'],
-                                                comments_theme=comments_config['theme'],
-                                                is_serve_mode=serve_mode,
-                                                serve_port=serve_port if serve_mode else None,
-                                                is_manga_chapter=is_manga_chapter,
-                                                manga_data=manga_data,
-                                                related_chapters=find_related_chapters(chapter_id, chapter_metadata.get('tags', []), all_chapters_metadata),
-                                                all_chapter_ids=[ch['id'] for ch in all_chapters_metadata],
-                                                typography=novel_config.get('typography'),
-                                                ))
-                else:
-                    # Generate chapter page showing "not translated" message in primary language
-                    chapter_content_md, chapter_metadata = load_chapter_content(novel_slug, chapter_id, primary_lang)
-                    
-                    # Skip draft/scheduled chapters unless flags are set (same check as above)
-                    if should_skip_chapter(chapter_metadata, INCLUDE_DRAFTS, INCLUDE_SCHEDULED):
-                        # Safe printing that handles Unicode issues
-                        safe_title = chapter_title.encode('ascii', errors='replace').decode('ascii')
-                        if is_chapter_draft(chapter_metadata):
-                            print(f"      Skipping draft chapter: {chapter_id} - {safe_title}")
-                        elif is_chapter_scheduled_future(chapter_metadata):
-                            publish_date = chapter_metadata.get('published', 'Unknown')
-                            print(f"      Skipping scheduled chapter: {chapter_id} - {safe_title} (publish: {publish_date})")
-                        else:
-                            print(f"      Skipping chapter: {chapter_id} - {safe_title}")
-                        continue
-                    
-                    # Determine if this is a manga chapter
-                    story_chapter_type = novel_config.get('chapter_type')
-                    chapter_type = chapter_metadata.get('type', story_chapter_type)
-                    is_manga_chapter = chapter_type == 'manga'
-                    
-                    # Initialize manga data
-                    manga_data = None
-                    
-                    if is_manga_chapter:
-                        # Process manga pages instead of regular content (using primary language)
-                        print(f"      Processing manga chapter (untranslated): {chapter_id}")
-                        manga_data = process_manga_pages(novel_slug, chapter_id, primary_lang, chapter_metadata, novel_config)
-                        
-                        if not manga_data:
-                            print(f"      Error: No manga pages found for {chapter_id}, skipping...")
-                            continue
-                        
-                        # For manga chapters, still process the markdown content for display below images
-                        chapter_content_html = convert_markdown_to_html(chapter_content_md)
-                    else:
-                        # Process regular chapter images and update markdown (using primary language)
-                        chapter_content_md = process_chapter_images(novel_slug, chapter_id, primary_lang, chapter_content_md)
-                    
-                    # Handle password protection (same as above)
-                    is_password_protected = 'password' in chapter_metadata and chapter_metadata['password']
-                    encrypted_content = None
-                    password_hash = None
-                    password_hint = None
-                    
-                    if is_password_protected:
-                        if not is_manga_chapter:
-                            # Convert markdown to HTML first for regular chapters
-                            chapter_content_html = convert_markdown_to_html(chapter_content_md)
-                        else:
-                            # For manga chapters, we'll handle this in the template
-                            chapter_content_html = ""
-                        
-                        # Build the complete content to be encrypted including comments
-                        complete_content = f'<div class="chapter-content">\n{chapter_content_html}\n</div>'
-                        
-                        # Add translator commentary if present
-                        if chapter_metadata.get('translator_commentary'):
-                            complete_content += f'''
-                        <div class="translator-commentary">
-                            <h3>Translator's Commentary</h3>
-                            <div class="commentary-content">
-                                {chapter_metadata['translator_commentary']}
-                            </div>
-                        </div>'''
-                        
-                        # Add comments section if enabled
-                        comments_enabled = should_enable_comments(site_config, novel_config, chapter_metadata, 'chapter')
-                        if comments_enabled:
-                            comments_config = build_comments_config(site_config)
-                            complete_content += f'''
-                        <div class="comments-section">
-                            <h3>Comments</h3>
-                            <script src="https://utteranc.es/client.js"
-                                    repo="{comments_config['repo']}"
-                                    issue-term="{comments_config['issue_term']}"
-                                    label="{comments_config['label']}"
-                                    theme="{comments_config['theme']}"
-                                    crossorigin="anonymous"
-                                    async>
-                            </script>
-                        </div>'''
-                        
-                        # Encrypt the complete content
-                        encrypted_content = encrypt_content_with_password(complete_content, chapter_metadata['password'])
-                        password_hash = create_password_verification_hash(chapter_metadata['password'])
-                        password_hint = chapter_metadata.get('password_hint', 'This chapter is password protected.')
-                        # Set content to placeholder for password-protected chapters
-                        chapter_content_html = '<div id="password-protected-content" style="text-align: center; padding: 2rem;"><p>This chapter is password protected.</p></div>'
-                    else:
-                        if not is_manga_chapter:
-                            # Only convert markdown for non-manga chapters
-                            chapter_content_html = convert_markdown_to_html(chapter_content_md)
-                    
-                    # Use navigation function to skip hidden chapters
-                    prev_chapter, next_chapter = get_navigation_chapters(novel_slug, all_chapters, chapter_id, lang)
-
-                    # Use front matter title if available, otherwise use chapter title from config
-                    display_title = chapter_metadata.get('title', chapter_title)
-                    
-                    # Determine what to display based on config and front matter
-                    show_tags = should_show_tags(novel_config, chapter_metadata, translation_missing=True)
-                    show_metadata = should_show_metadata(novel_config, chapter_metadata)
-                    show_translation_notes = should_show_translation_notes(novel_config, chapter_metadata)
-                    
-                    # Build social metadata for chapter (using primary language metadata)
-                    chapter_url = f"{site_config.get('site_url', '').rstrip('/')}/{novel_slug}/{lang}/{chapter_id}/"
-                    chapter_social_meta = build_social_meta(site_config, novel_config, chapter_metadata, 'chapter', display_title, chapter_url)
-                    chapter_seo_meta = build_seo_meta(site_config, novel_config, chapter_metadata, 'chapter')
-                    
-                    # Build footer data for chapter (missing translation case)
-                    footer_data = build_footer_content(site_config, novel_config, 'chapter')
-                    
-                    # Build comments configuration (missing translation case)
-                    comments_enabled = should_enable_comments(site_config, novel_config, chapter_metadata, 'chapter')
-                    comments_config = build_comments_config(site_config)
-                    
-                    chapter_dir = os.path.normpath(os.path.join(lang_dir, chapter_id))
-                    os.makedirs(chapter_dir, exist_ok=True)
-                    with open(os.path.join(chapter_dir, "index.html"), "w", encoding='utf-8') as f:
-                        # Filter out hidden chapters for chapter dropdown
-                        filtered_novel = filter_hidden_chapters_from_novel(novel, novel_slug, lang)
-                        f.write(render_template("chapter.html", 
-                                                novel_slug=novel_slug,
-                                                site_config=site_config,
-                                                novel_config=novel_config,
-                                                novel=filtered_novel,
-                                                novel_title=novel['title'],
-                                                arcs=novel['arcs'],
-                                                chapter=chapter,
-                                                chapter_id=chapter_id,
-                                                chapter_title=display_title,
-                                                chapter_content=chapter_content_html,
-                                                chapter_metadata=chapter_metadata,
-                                                prev_chapter=prev_chapter,
-                                                next_chapter=next_chapter,
-                                                language=lang,
-                                                current_language=lang,
-                                                primary_language=primary_lang,
-                                                requested_language=lang,
-                                                translation_missing=True,
-                                                available_languages=available_languages,
-                                                show_tags=show_tags,
-                                                show_metadata=show_metadata,
-                                                show_translation_notes=show_translation_notes,
-                                                password_protected=is_password_protected,
-                                                is_password_protected=is_password_protected,
-                                                encrypted_content=encrypted_content,
-                                                password_hash=password_hash,
-                                                password_hint=password_hint,
-                                                authors_config=authors_config,
-                                                site_name=site_config.get('site_name', 'Web Novel Collection'),
-                                                social_title=chapter_social_meta['title'],
-                                                social_description=chapter_social_meta['description'],
-                                                social_image=chapter_social_meta['image'],
-                                                social_url=chapter_social_meta['url'],
-                                                seo_meta_description=chapter_seo_meta.get('meta_description'),
-                                                seo_keywords=chapter_social_meta.get('keywords'),
-                                                allow_indexing=chapter_seo_meta.get('allow_indexing', True),
-                                                twitter_handle=site_config.get('social_embeds', {}).get('twitter_handle'),
-                                                footer_copyright=footer_data['copyright'],
-                                                footer_links=footer_data['links'],
-                                                footer_data=footer_data,
-                                                comments_enabled=comments_enabled,
-                                                comments_repo=comments_config['repo'],
-                                                comments_issue_term=comments_config['issue_term'],
-                                                comments_label=comments_config['label'],
-                                                comments_theme=comments_config['theme'],
-                                                is_serve_mode=serve_mode,
-                                                serve_port=serve_port if serve_mode else None,
-                                                is_manga_chapter=is_manga_chapter,
-                                                manga_data=manga_data,
-                                                related_chapters=find_related_chapters(chapter_id, chapter_metadata.get('tags', []), all_chapters_metadata),
-                                                all_chapter_ids=[ch['id'] for ch in all_chapters_metadata],
-                                                typography=novel_config.get('typography'),
-                                                ))
-
-        # Generate tag pages for this language (after all chapters are processed)
-        for lang in available_languages:
-            lang_dir = os.path.join(novel_dir, lang)
-            tags_data = collect_tags_for_novel(novel_slug, lang)
-            if tags_data:
-                # Create tags directory
-                tags_dir = os.path.normpath(os.path.join(lang_dir, "tags"))
-                os.makedirs(tags_dir, exist_ok=True)
-                
-                # Create tag slug mapping for templates
-                tag_slug_map = {tag: slugify_tag(tag) for tag in tags_data.keys()}
-                
-                # Generate main tags index page
-                with open(os.path.join(tags_dir, "index.html"), "w", encoding='utf-8') as f:
-                    f.write(render_template("tags_index.html",
-                                            novel_slug=novel_slug,
-                                            novel=novel,
-                                            tags_data=tags_data,
-                                            tag_slug_map=tag_slug_map,
-                                            current_language=lang,
-                                            available_languages=available_languages))
-                
-                # Generate individual tag pages
-                for tag, chapters in tags_data.items():
-                    tag_slug = slugify_tag(tag)
-                    tag_page_dir = os.path.normpath(os.path.join(tags_dir, tag_slug))
-                    os.makedirs(tag_page_dir, exist_ok=True)
-                    
-                    # Build cross-language tag mapping for this tag
-                    cross_lang_tags = {}
-                    for other_lang in available_languages:
-                        if other_lang != lang:
-                            other_tags_data = collect_tags_for_novel(novel_slug, other_lang)
-                            # For now, just check if any tags exist in other language
-                            # (proper cross-language tag mapping would require more complex logic)
-                            if other_tags_data:
-                                cross_lang_tags[other_lang] = None  # Don't show cross-language links for now
-                    
-                    with open(os.path.join(tag_page_dir, "index.html"), "w", encoding='utf-8') as f:
-                        f.write(render_template("tag_page.html",
-                                                novel_slug=novel_slug,
-                                                novel=novel,
-                                                tag_name=tag,
-                                                tag_slug=tag_slug,
-                                                chapters=chapters,
-                                                current_language=lang,
-                                                available_languages=available_languages,
-                                                cross_lang_tags=cross_lang_tags))
-
-    # Generate glossary and character pages for each novel
-    from modules.glossary import load_glossary, group_terms_by_category
-    from modules.characters import load_characters
-
-    for novel in all_novels_data:
-        novel_slug = novel['slug']
-        novel_config = load_novel_config(novel_slug)
-        available_languages = novel_config.get('languages', {}).get('available', ['en'])
-        novel_dir = os.path.join(BUILD_DIR, novel_slug)
-        footer_data = build_footer_content(site_config, novel_config, 'page')
-
-        # Glossary pages
-        if novel_config.get('glossary', {}).get('enabled', False):
-            for lang in available_languages:
-                glossary_data = load_glossary(novel_slug, CONTENT_DIR, lang)
-                if glossary_data:
-                    grouped = group_terms_by_category(glossary_data)
-                    glossary_dir = os.path.normpath(os.path.join(novel_dir, lang, "glossary"))
-                    os.makedirs(glossary_dir, exist_ok=True)
-                    with open(os.path.join(glossary_dir, "index.html"), "w", encoding='utf-8') as f:
-                        f.write(render_template("glossary.html",
-                                                novel=novel,
-                                                novel_slug=novel_slug,
-                                                grouped_terms=grouped,
-                                                current_language=lang,
-                                                available_languages=available_languages,
-                                                footer_data=footer_data))
-                    print(f"  Generated glossary page for {novel_slug}/{lang}")
-
-        # Character pages
-        chars_data = load_characters(novel_slug, CONTENT_DIR)
-        if chars_data and chars_data.get('characters'):
-            for lang in available_languages:
-                chars_dir = os.path.normpath(os.path.join(novel_dir, lang, "characters"))
-                os.makedirs(chars_dir, exist_ok=True)
-
-                # Character index page
-                with open(os.path.join(chars_dir, "index.html"), "w", encoding='utf-8') as f:
-                    f.write(render_template("characters.html",
-                                            novel=novel,
-                                            novel_slug=novel_slug,
-                                            characters=chars_data['characters'],
-                                            current_language=lang,
-                                            footer_data=footer_data))
-
-                # Individual character detail pages
-                for char in chars_data['characters']:
-                    char_slug = char.get('slug', char.get('name', '').lower().replace(' ', '-'))
-                    char_dir = os.path.normpath(os.path.join(chars_dir, char_slug))
-                    os.makedirs(char_dir, exist_ok=True)
-                    with open(os.path.join(char_dir, "index.html"), "w", encoding='utf-8') as f:
-                        f.write(render_template("character_detail.html",
-                                                novel=novel,
-                                                novel_slug=novel_slug,
-                                                character=char,
-                                                current_language=lang,
-                                                footer_data=footer_data))
-
-                print(f"  Generated character pages for {novel_slug}/{lang}")
+    # Generate glossary and character pages for each novel
+    for novel in all_novels_data:
+        generate_novel_reference_pages(novel, site_config)
 
     # Generate EPUB downloads after all HTML is built (unless --no-epub)
     if not no_epub:
@@ -4274,17 +4556,18 @@ def build_site(include_drafts=False, include_scheduled=False, no_epub=False, opt
     # Generate search index and search page
     from modules.search import generate_search_index
     print("Generating search index...")
-    search_entries = generate_search_index(
-        all_novels_data, CONTENT_DIR,
-        load_chapter_content, should_skip_chapter,
-        convert_markdown_to_html,
-        include_drafts=INCLUDE_DRAFTS,
-        include_scheduled=INCLUDE_SCHEDULED
-    )
     search_index_path = os.path.join(BUILD_DIR, "search_index.json")
     with open(search_index_path, 'w', encoding='utf-8') as f:
-        json.dump(search_entries, f, ensure_ascii=False)
-    print(f"  Generated search index with {len(search_entries)} entries")
+        search_entry_count = generate_search_index(
+            all_novels_data, CONTENT_DIR,
+            load_chapter_content, should_skip_chapter,
+            include_drafts=INCLUDE_DRAFTS,
+            include_scheduled=INCLUDE_SCHEDULED,
+            cache_file=SEARCH_EXCERPT_CACHE_FILE,
+            out_fp=f,
+            list_chapter_languages_fn=list_chapter_languages
+        )
+    print(f"  Generated search index with {search_entry_count} entries")
 
     # Collect unique languages from all novels
     all_languages = set()
@@ -4310,8 +4593,153 @@ def build_site(include_drafts=False, include_scheduled=False, no_epub=False, opt
         persist_build_fingerprint(fingerprint)
     print("Site built.")
 
-def check_broken_links():
-    """Check for broken internal links in the generated site"""
+# Pre-filters that let the link checker skip tag walks for pages without the relevant tags
+# (attribute quotes are optional because minified HTML may drop them)
+# (patterns are bytes because pages are scanned undecoded; the parsers decode in C)
+_SOCIAL_META_RE = re.compile(rb'<meta[^>]+(?:property\s*=\s*["\']?og:image|name\s*=\s*["\']?twitter:image)', re.IGNORECASE)
+_IMG_TAG_RE = re.compile(rb'<img\b', re.IGNORECASE)
+_LINK_TAG_RE = re.compile(rb'<link\b', re.IGNORECASE)
+
+# Only build tree nodes for the tags each scan inspects
+_LINK_CHECK_STRAINER = SoupStrainer(['a', 'img', 'meta', 'link', 'script'])
+_ALT_TEXT_STRAINER = SoupStrainer('img')
+
+def extract_link_references(content):
+    """Return (link type, url) pairs for every link, image, social image, stylesheet and script in raw page bytes"""
+    has_images = _IMG_TAG_RE.search(content) is not None
+    has_social_meta = _SOCIAL_META_RE.search(content) is not None
+    has_link_tags = _LINK_TAG_RE.search(content) is not None
+    references = []
+    
+    if SELECTOLAX_AVAILABLE:
+        tree = LexborHTMLParser(content)
+        
+        def select(selector, attribute):
+            return [node.attributes.get(attribute) or '' for node in tree.css(selector)]
+        
+        references.extend(('Internal Link', href) for href in select('a[href]', 'href'))
+        if has_images:
+            references.extend(('Image', src) for src in select('img[src]', 'src'))
+        if has_social_meta:
+            references.extend(('Social Embed Image', image) for image in
+                              select('meta[property="og:image"], meta[name="twitter:image"]', 'content'))
+        if has_link_tags:
+            references.extend(('CSS File', href) for href in select('link[rel~="stylesheet"][href]', 'href'))
+        references.extend(('JavaScript File', src) for src in select('script[src]', 'src'))
+        return references
+    
+    soup = BeautifulSoup(content, HTML_PARSER, parse_only=_LINK_CHECK_STRAINER, from_encoding='utf-8')
+    references.extend(('Internal Link', link['href']) for link in soup.find_all('a', href=True))
+    if has_images:
+        references.extend(('Image', img['src']) for img in soup.find_all('img', src=True))
+    if has_social_meta:
+        references.extend(('Social Embed Image', meta.get('content', '')) for meta in soup.find_all('meta')
+                          if meta.get('property') == 'og:image' or meta.get('name') == 'twitter:image')
+    if has_link_tags:
+        references.extend(('CSS File', link_tag['href']) for link_tag in soup.find_all('link', href=True)
+                          if 'stylesheet' in link_tag.get('rel', []))
+    references.extend(('JavaScript File', script['src']) for script in soup.find_all('script', src=True))
+    return references
+
+def extract_image_attributes(content):
+    """Return (src, alt) pairs for every <img> tag in raw page bytes"""
+    if SELECTOLAX_AVAILABLE:
+        return [(node.attributes.get('src') or '', node.attributes.get('alt') or '')
+                for node in LexborHTMLParser(content).css('img')]
+    
+    soup = BeautifulSoup(content, HTML_PARSER, parse_only=_ALT_TEXT_STRAINER, from_encoding='utf-8')
+    return [(img.get('src', ''), img.get('alt', '')) for img in soup.find_all('img')]
+
+# Alt-text fast path: only <img> tags are tokenized, no document tree is built
+_IMG_RE = re.compile(rb'<img\b([^>]*)>', re.IGNORECASE)
+_ATTR_RE = re.compile(rb'''([\w:-]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+)))?''')
+
+def scan_image_attributes(content):
+    """Return (src, alt) pairs for every <img> tag in raw page bytes without parsing the document"""
+    images = []
+    for img_match in _IMG_RE.finditer(content):
+        attributes = {}
+        for name, double_quoted, single_quoted, unquoted in _ATTR_RE.findall(img_match.group(1)):
+            attributes.setdefault(name.lower(), double_quoted or single_quoted or unquoted)
+        images.append((html.unescape(attributes.get(b'src', b'').decode('utf-8', 'replace')),
+                       html.unescape(attributes.get(b'alt', b'').decode('utf-8', 'replace'))))
+    return images
+
+def scan_build_directory(build_dir):
+    """Walk the build directory once, returning (sorted HTML files, set of every existing path)"""
+    html_files = []
+    existing_paths = set()
+    pending_dirs = [str(build_dir)]
+    while pending_dirs:
+        with os.scandir(pending_dirs.pop()) as entries:
+            for entry in entries:
+                entry_path = Path(entry.path)
+                existing_paths.add(entry_path)
+                # DirEntry caches the file type, so no extra stat per entry
+                if entry.is_dir(follow_symlinks=False):
+                    pending_dirs.append(entry.path)
+                elif entry.name.endswith('.html'):
+                    html_files.append(entry_path)
+    html_files.sort()
+    return html_files, existing_paths
+
+# Broken-links report cell escaping: pipes in URLs, Windows separators in paths
+_URL_TR = str.maketrans({'|': '\\|'})
+_PATH_TR = str.maketrans({'\\': '/'})
+
+# Below this many pages, process start-up costs more than parsing in-process saves
+PARALLEL_SCAN_MIN_FILES = 64
+
+def _scan_file_links(html_file):
+    """Process-pool worker: return (link references, error) for one page"""
+    try:
+        return extract_link_references(html_file.read_bytes()), None
+    except Exception as e:
+        return [], e
+
+def _scan_file_images(html_file):
+    """Process-pool worker: return ((src, alt) pairs, error) for one page"""
+    try:
+        return extract_image_attributes(html_file.read_bytes()), None
+    except Exception as e:
+        return [], e
+
+def _scan_file_images_fast(html_file):
+    """Process-pool worker: like _scan_file_images, but with the regex tag scanner"""
+    try:
+        return scan_image_attributes(html_file.read_bytes()), None
+    except Exception as e:
+        return [], e
+
+def scan_html_files(worker, html_files):
+    """Run a per-page worker over html_files in order, using every core for larger sites"""
+    if len(html_files) < PARALLEL_SCAN_MIN_FILES:
+        return map(worker, html_files)
+    with ProcessPoolExecutor(mp_context=_process_pool_context()) as executor:
+        return list(executor.map(worker, html_files, chunksize=16))
+
+def load_link_scan_cache():
+    """Load page link references from the previous link check, keyed by build-relative path"""
+    try:
+        with open(LINK_SCAN_CACHE_FILE, 'r', encoding='utf-8') as cache_file:
+            return json.load(cache_file).get('pages', {})
+    except (OSError, json.JSONDecodeError, AttributeError):
+        return {}
+
+def persist_link_scan_cache(pages):
+    """Persist page link references so unchanged pages skip parsing on the next link check"""
+    try:
+        with open(LINK_SCAN_CACHE_FILE, 'w', encoding='utf-8') as cache_file:
+            json.dump({'pages': pages}, cache_file)
+    except OSError as e:
+        print(f"[WARNING] Could not write link scan cache: {e}")
+
+def check_broken_links(build_scan=None):
+    """Check for broken internal links in the generated site
+
+    build_scan is an optional (html_files, existing_paths) result of scan_build_directory
+    to share one directory walk with the accessibility check.
+    """
     print("\n" + "="*50)
     print("BROKEN LINK CHECK")
     print("="*50)
@@ -4320,6 +4748,8 @@ def check_broken_links():
     if not build_dir.exists():
         print("[ERROR] Build directory not found. Please generate the site first.")
         return
+    # Resolved so relative links (which go through Path.resolve) match the existence set below
+    build_dir = build_dir.resolve()
     
     # Load site config for URL validation
     site_config = load_site_config()
@@ -4327,115 +4757,87 @@ def check_broken_links():
     broken_links = []
     total_files_checked = 0
     
-    # Find all HTML files in build directory
-    html_files = list(build_dir.rglob("*.html"))
+    # One directory walk replaces a stat() per link; shared assets resolve once per scan
+    html_files, existing_paths = build_scan or scan_build_directory(build_dir)
+    resolved_links = {}
+    
+    def resolve_cached(file_dir, url):
+        # Site-root links resolve the same from every page, so they share one cache entry
+        cache_key = ('', url) if url.startswith('/') else (str(file_dir), url)
+        if cache_key not in resolved_links:
+            resolved_links[cache_key] = resolve_link_path(file_dir, url, build_dir, existing_paths)
+        return resolved_links[cache_key]
     
     print(f"[INFO] Checking {len(html_files)} HTML files for broken links...")
     
+    # Pages whose size and mtime match the previous check reuse its references. Only
+    # parsing is skipped: every reference is still resolved against the current build,
+    # so an unchanged page linking to a removed file is still reported
+    previous_scan = load_link_scan_cache()
+    current_scan = {}
+    scan_results = {}
+    stale_files = []
+    for html_file in html_files:
+        cache_key = html_file.relative_to(build_dir).as_posix()
+        file_stat = html_file.stat()
+        cached = previous_scan.get(cache_key)
+        if cached and cached['mtime_ns'] == file_stat.st_mtime_ns and cached['size'] == file_stat.st_size:
+            scan_results[html_file] = ([tuple(reference) for reference in cached['references']], None)
+            current_scan[cache_key] = cached
+        else:
+            stale_files.append((html_file, cache_key, file_stat))
+    
+    reused_count = len(html_files) - len(stale_files)
+    if reused_count:
+        print(f"[INFO] {reused_count} unchanged files reuse the previous scan")
+    
+    # Parsing runs in worker processes; resolution stays here to share the link cache
+    parsed = scan_html_files(_scan_file_links, [html_file for html_file, _, _ in stale_files])
+    for (html_file, cache_key, file_stat), (references, error) in zip(stale_files, parsed):
+        scan_results[html_file] = (references, error)
+        if error is None:
+            current_scan[cache_key] = {
+                'mtime_ns': file_stat.st_mtime_ns,
+                'size': file_stat.st_size,
+                'references': references,
+            }
+    persist_link_scan_cache(current_scan)
+    
     for html_file in html_files:
+        references, error = scan_results[html_file]
         total_files_checked += 1
         relative_path = html_file.relative_to(build_dir)
         
         try:
-            with open(html_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            if error is not None:
+                raise error
             
-            soup = BeautifulSoup(content, 'html.parser')
             file_dir = html_file.parent
             
-            # Check internal links (<a href="">)
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                if is_internal_link(href):
-                    target_path = resolve_link_path(file_dir, href, build_dir)
-                    if target_path and not target_path.exists():
-                        try:
-                            target_rel = str(target_path.relative_to(build_dir))
-                        except ValueError:
-                            target_rel = str(target_path)
-                        broken_links.append({
-                            'type': 'Internal Link',
-                            'url': href,
-                            'source_file': str(relative_path),
-                            'target_path': target_rel
-                        })
-            
-            # Check images (<img src="">)
-            for img in soup.find_all('img', src=True):
-                src = img['src']
-                if is_internal_link(src):
-                    target_path = resolve_link_path(file_dir, src, build_dir)
-                    if target_path and not target_path.exists():
-                        try:
-                            target_rel = str(target_path.relative_to(build_dir))
-                        except ValueError:
-                            target_rel = str(target_path)
-                        broken_links.append({
-                            'type': 'Image',
-                            'url': src,
-                            'source_file': str(relative_path),
-                            'target_path': target_rel
-                        })
-            
-            # Check social embed images (og:image, twitter:image)
-            for meta in soup.find_all('meta'):
-                if meta.get('property') == 'og:image' or meta.get('name') == 'twitter:image':
-                    content_attr = meta.get('content', '')
-                    target_path = None
-                    
-                    if content_attr and is_internal_link(content_attr):
+            for link_type, url in references:
+                target_path = None
+                
+                if link_type == 'Social Embed Image':
+                    if url and is_internal_link(url):
                         # Handle relative/absolute internal links
-                        target_path = resolve_link_path(file_dir, content_attr, build_dir)
-                    elif content_attr and is_local_site_url(content_attr, site_config):
+                        target_path = resolve_cached(file_dir, url)
+                    elif url and is_local_site_url(url, site_config):
                         # Handle site URLs (https://site.com/path/to/file.jpg)
-                        target_path = convert_site_url_to_local_path(content_attr, site_config, build_dir)
-                    
-                    if target_path and not target_path.exists():
-                        try:
-                            target_rel = str(target_path.relative_to(build_dir))
-                        except ValueError:
-                            target_rel = str(target_path)
-                        broken_links.append({
-                            'type': 'Social Embed Image',
-                            'url': content_attr,
-                            'source_file': str(relative_path),
-                            'target_path': target_rel
-                        })
-            
-            # Check CSS files
-            for link_tag in soup.find_all('link', href=True):
-                if 'stylesheet' in link_tag.get('rel', []):
-                    href = link_tag['href']
-                    if is_internal_link(href):
-                        target_path = resolve_link_path(file_dir, href, build_dir)
-                        if target_path and not target_path.exists():
-                            try:
-                                target_rel = str(target_path.relative_to(build_dir))
-                            except ValueError:
-                                target_rel = str(target_path)
-                            broken_links.append({
-                                'type': 'CSS File',
-                                'url': href,
-                                'source_file': str(relative_path),
-                                'target_path': target_rel
-                            })
-            
-            # Check JavaScript files
-            for script in soup.find_all('script', src=True):
-                src = script['src']
-                if is_internal_link(src):
-                    target_path = resolve_link_path(file_dir, src, build_dir)
-                    if target_path and not target_path.exists():
-                        try:
-                            target_rel = str(target_path.relative_to(build_dir))
-                        except ValueError:
-                            target_rel = str(target_path)
-                        broken_links.append({
-                            'type': 'JavaScript File',
-                            'url': src,
-                            'source_file': str(relative_path),
-                            'target_path': target_rel
-                        })
+                        target_path = convert_site_url_to_local_path(url, site_config, build_dir)
+                elif is_internal_link(url):
+                    target_path = resolve_cached(file_dir, url)
+                
+                if target_path and target_path not in existing_paths:
+                    try:
+                        target_rel = str(target_path.relative_to(build_dir))
+                    except ValueError:
+                        target_rel = str(target_path)
+                    broken_links.append({
+                        'type': link_type,
+                        'url': url,
+                        'source_file': str(relative_path),
+                        'target_path': target_rel
+                    })
                         
         except Exception as e:
             try:
@@ -4461,35 +4863,45 @@ def check_broken_links():
             by_type[link_type].append(link)
         
         # Generate markdown report
-        report_path = os.path.join(os.path.dirname(BUILD_DIR), "broken_links_report.md")
-        with open(report_path, 'w', encoding='utf-8') as report_file:
-            report_file.write("# Broken Links Report\n\n")
-            report_file.write(f"**Generated:** {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            report_file.write(f"**Files Checked:** {total_files_checked}\n")
-            report_file.write(f"**Broken Links Found:** {len(broken_links)}\n\n")
-            
-            report_file.write("## Summary by Type\n\n")
-            report_file.write("| Link Type | Count |\n")
-            report_file.write("|-----------|-------|\n")
-            for link_type, links in by_type.items():
-                report_file.write(f"| {link_type} | {len(links)} |\n")
-            report_file.write("\n")
+        report_path = _BROKEN_LINKS_REPORT
+        report_content = []
+        report_content.append("# Broken Links Report")
+        report_content.append("")
+        report_content.append(f"**Generated:** {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        report_content.append("")
+        report_content.append(f"**Files Checked:** {total_files_checked}")
+        report_content.append(f"**Broken Links Found:** {len(broken_links)}")
+        report_content.append("")
+        
+        report_content.append("## Summary by Type")
+        report_content.append("")
+        report_content.append("| Link Type | Count |")
+        report_content.append("|-----------|-------|")
+        for link_type, links in by_type.items():
+            report_content.append(f"| {link_type} | {len(links)} |")
+        report_content.append("")
+        
+        report_content.append("## Detailed Report")
+        report_content.append("")
+        
+        for link_type, links in by_type.items():
+            report_content.append(f"### {link_type} ({len(links)} broken)")
+            report_content.append("")
+            report_content.append("| URL | Source File | Target Path |")
+            report_content.append("|-----|-------------|-------------|")
             
-            report_file.write("## Detailed Report\n\n")
+            for link in links:
+                # Escape pipe characters in URLs
+                url = link['url'].translate(_URL_TR)
+                source = link['source_file'].translate(_PATH_TR)
+                target = link['target_path'].translate(_PATH_TR)
+                report_content.append(f"| `{url}` | `{source}` | `{target}` |")
             
-            for link_type, links in by_type.items():
-                report_file.write(f"### {link_type} ({len(links)} broken)\n\n")
-                report_file.write("| URL | Source File | Target Path |\n")
-                report_file.write("|-----|-------------|-------------|\n")
-                
-                for link in links:
-                    # Escape pipe characters in URLs
-                    url = link['url'].replace('|', '\\|')
-                    source = link['source_file'].replace('\\', '/')
-                    target = link['target_path'].replace('\\', '/')
-                    report_file.write(f"| `{url}` | `{source}` | `{target}` |\n")
-                
-                report_file.write("\n")
+            report_content.append("")
+        
+        # Build the report in memory and write it in one call
+        with open(report_path, 'w', encoding='utf-8') as report_file:
+            report_file.write('\n'.join(report_content) + '\n')
         
         print(f"\n[INFO] Detailed report written to: {report_path}")
         
@@ -4512,20 +4924,23 @@ def check_broken_links():
         print("[PASSED] Link check PASSED!")
         
         # Remove any existing report file if all links are good
-        report_path = os.path.join(os.path.dirname(BUILD_DIR), "broken_links_report.md")
-        if os.path.exists(report_path):
+        report_path = _BROKEN_LINKS_REPORT
+        try:
             os.remove(report_path)
             print(f"[INFO] Removed old broken links report: {report_path}")
+        except FileNotFoundError:
+            pass
         
         return True
 
-def check_accessibility_issues(site_config):
+def check_accessibility_issues(site_config, build_scan=None):
     """Check for accessibility issues in the generated site"""
     if not site_config.get('accessibility', {}).get('enabled', True):
         return True
     
     accessibility_config = site_config.get('accessibility', {})
     enforce_alt_text = accessibility_config.get('enforce_alt_text', True)
+    strict_html_parsing = accessibility_config.get('strict_html_parsing', False)
     build_reports = accessibility_config.get('build_reports', True)
     
     # Skip report generation in GitHub Actions unless explicitly enabled
@@ -4541,7 +4956,7 @@ def check_accessibility_issues(site_config):
     accessibility_issues = []
     
     if enforce_alt_text:
-        alt_text_issues = check_missing_alt_text()
+        alt_text_issues = check_missing_alt_text(build_scan, strict_html_parsing)
         accessibility_issues.extend(alt_text_issues)
     
     # Future: Add more accessibility checks here
@@ -4562,37 +4977,40 @@ def check_accessibility_issues(site_config):
         print("[PASSED] Accessibility check PASSED!")
         
         # Remove any existing accessibility report if no issues
-        report_path = os.path.join(os.path.dirname(BUILD_DIR), "images_missing_alt_text_report.md")
-        if os.path.exists(report_path):
+        report_path = _ALT_TEXT_REPORT
+        try:
             os.remove(report_path)
             print(f"[INFO] Removed old accessibility report: {report_path}")
+        except FileNotFoundError:
+            pass
         
         return True
 
-def check_missing_alt_text():
-    """Check for images missing alt text in the generated site"""
+def check_missing_alt_text(build_scan=None, strict_html_parsing=False):
+    """Check for images missing alt text in the generated site
+
+    Uses the regex tag scanner unless strict_html_parsing asks for a full HTML parse.
+    """
     missing_alt_issues = []
     build_dir = Path(BUILD_DIR)
     
     if not build_dir.exists():
         print("[ERROR] Build directory not found. Run a build first.")
         return missing_alt_issues
+    build_dir = build_dir.resolve()
     
     # Find all HTML files
-    html_files = list(build_dir.glob("**/*.html"))
+    html_files, _ = build_scan or scan_build_directory(build_dir)
     print(f"[INFO] Checking {len(html_files)} HTML files for images missing alt text...")
     
-    for html_file in html_files:
+    scan_worker = _scan_file_images if strict_html_parsing else _scan_file_images_fast
+    for html_file, (images, error) in zip(html_files, scan_html_files(scan_worker, html_files)):
         try:
-            with open(html_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            if error is not None:
+                raise error
             
-            soup = BeautifulSoup(content, 'html.parser')
-            images = soup.find_all('img')
-            
-            for img in images:
-                src = img.get('src', '')
-                alt = img.get('alt', '').strip()
+            for src, alt in images:
+                alt = alt.strip()
                 
                 # Skip if no src
                 if not src:
@@ -4619,7 +5037,7 @@ def check_missing_alt_text():
 
 def generate_accessibility_report(issues):
     """Generate a markdown report of accessibility issues"""
-    report_path = os.path.join(os.path.dirname(BUILD_DIR), "images_missing_alt_text_report.md")
+    report_path = _ALT_TEXT_REPORT
     
     # Group issues by type
     alt_text_issues = [issue for issue in issues if 'alt text' in issue['issue']]
@@ -4673,20 +5091,12 @@ def generate_accessibility_report(issues):
     except Exception as e:
         print(f"[ERROR] Could not generate accessibility report: {e}")
 
+# External URLs, data URLs, mailto, etc. and anchor-only links
+_EXTERNAL_RE = re.compile(r'(?:https?://|mailto:|tel:|data:|//|#)')
+
 def is_internal_link(url):
     """Check if a URL is an internal link (not external or data/mailto/etc)"""
-    if not url:
-        return False
-    
-    # Skip external URLs, data URLs, mailto, etc.
-    if url.startswith(('http://', 'https://', 'mailto:', 'tel:', 'data:', '//', '#')):
-        return False
-    
-    # Skip anchor-only links
-    if url.startswith('#'):
-        return False
-        
-    return True
+    return bool(url) and not _EXTERNAL_RE.match(url)
 
 def is_local_site_url(url, site_config):
     """Check if a URL belongs to the local site domain"""
@@ -4709,8 +5119,17 @@ def convert_site_url_to_local_path(url, site_config, build_dir):
     relative_path = url[len(site_url) + 1:]
     return Path(build_dir) / relative_path
 
-def resolve_link_path(current_file_dir, link_url, build_dir):
-    """Resolve a relative or absolute link to a file path in the build directory"""
+def resolve_link_path(current_file_dir, link_url, build_dir, existing_paths=None):
+    """Resolve a relative or absolute link to a file path in the build directory
+
+    When existing_paths (a set of every path under build_dir) is given, it is used
+    for existence checks instead of hitting the filesystem.
+    """
+    if existing_paths is not None:
+        exists = existing_paths.__contains__
+    else:
+        exists = Path.exists
+    
     try:
         # Handle absolute paths from site root
         if link_url.startswith('/'):
@@ -4726,20 +5145,14 @@ def resolve_link_path(current_file_dir, link_url, build_dir):
         # If path doesn't exist but ends with /, try with index.html first
         if str(link_url).endswith('/'):
             index_path = target_path / 'index.html'
-            if index_path.exists():
+            if exists(index_path):
                 return index_path
         
-        # If path doesn't exist as-is, try with index.html appended (for directory links)
-        if not target_path.exists():
-            if target_path.is_dir():
-                index_path = target_path / 'index.html'
-                if index_path.exists():
-                    return index_path
-            else:
-                # Try treating as directory and adding index.html
-                index_path = target_path / 'index.html'
-                if index_path.exists():
-                    return index_path
+        # If path doesn't exist as-is, try treating it as a directory with index.html
+        if not exists(target_path):
+            index_path = target_path / 'index.html'
+            if exists(index_path):
+                return index_path
         
         return target_path
         
@@ -4987,7 +5400,7 @@ def generate_stats_report():
     
     stats = collect_site_statistics()
     
-    report_path = os.path.join(os.path.dirname(BUILD_DIR), "stats_report.md")
+    report_path = _STATS_REPORT
     with open(report_path, 'w', encoding='utf-8') as report_file:
         write_stats_report(report_file, stats)
     
@@ -5020,6 +5433,19 @@ def collect_template_override_stats():
     
     return template_stats
 
+def count_build_files(root):
+    """Count files with an extension under root using scandir's cached entry types"""
+    file_count = 0
+    pending_dirs = [root]
+    while pending_dirs:
+        with os.scandir(pending_dirs.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending_dirs.append(entry.path)
+                elif '.' in entry.name:
+                    file_count += 1
+    return file_count
+
 def collect_site_statistics():
     """Collect comprehensive statistics about the generated site"""
     stats = {
@@ -5029,7 +5455,7 @@ def collect_site_statistics():
         'total_words': 0,
         'total_characters': 0,
         'languages': set(),
-        'tags': {},
+        'tags': Counter(),
         'images': 0,
         'build_files': 0
     }
@@ -5042,11 +5468,21 @@ def collect_site_statistics():
     if content_dir.exists():
         novel_dirs = [d for d in content_dir.iterdir() if d.is_dir()]
         
-        for novel_dir in novel_dirs:
+        def collect_for_novel(novel_dir):
+            try:
+                return collect_novel_statistics(novel_dir.name, load_novel_config(novel_dir.name)), None
+            except Exception as e:
+                return None, e
+        
+        # Stats collection is dominated by file reads, which release the GIL
+        with ThreadPoolExecutor(max_workers=max(1, min(16, len(novel_dirs)))) as executor:
+            novel_results = list(executor.map(collect_for_novel, novel_dirs))
+        
+        for novel_dir, (novel_stats, error) in zip(novel_dirs, novel_results):
             novel_slug = novel_dir.name
             try:
-                novel_config = load_novel_config(novel_slug)
-                novel_stats = collect_novel_statistics(novel_slug, novel_config)
+                if error is not None:
+                    raise error
                 stats['novels'].append(novel_stats)
                 
                 # Aggregate totals
@@ -5056,8 +5492,7 @@ def collect_site_statistics():
                 stats['languages'].update(novel_stats['languages'])
                 
                 # Aggregate tags
-                for tag, count in novel_stats['tags'].items():
-                    stats['tags'][tag] = stats['tags'].get(tag, 0) + count
+                stats['tags'].update(novel_stats['tags'])
                     
                 stats['images'] += novel_stats['images']
                 
@@ -5065,9 +5500,8 @@ def collect_site_statistics():
                 print(f"[WARNING] Error collecting stats for {novel_slug}: {e}")
     
     # Count build files
-    build_dir = Path(BUILD_DIR)
-    if build_dir.exists():
-        stats['build_files'] = len(list(build_dir.rglob("*.*")))
+    if os.path.isdir(BUILD_DIR):
+        stats['build_files'] = count_build_files(BUILD_DIR)
     
     stats['languages'] = sorted(list(stats['languages']))
     
@@ -5076,6 +5510,24 @@ def collect_site_statistics():
     
     return stats
 
+# Markdown images; negated classes instead of lazy .*? so a miss cannot backtrack
+_IMG_MD_RE = re.compile(r'!\[[^\]\n]*\]\([^)\n]*\)')
+
+def _fast_chapter_stats(path):
+    """Return (words, characters, images, tags) for a chapter file
+
+    Reads the file directly rather than through load_chapter_content. Text mode
+    turns CRLF into LF, so Windows line endings don't count as characters.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        metadata, body = parse_front_matter(f.read())
+    tags = (metadata.get('tags') or []) if isinstance(metadata, dict) else []
+    
+    if not body:
+        return 0, 0, 0, []
+    images = sum(1 for _ in _IMG_MD_RE.finditer(body))
+    return len(body.split()), len(body), images, tags
+
 def collect_novel_statistics(novel_slug, novel_config):
     """Collect statistics for a single novel"""
     novel_stats = {
@@ -5087,23 +5539,24 @@ def collect_novel_statistics(novel_slug, novel_config):
         'total_characters': 0,
         'languages': set(),
         'arcs': [],
-        'tags': {},
+        'tags': Counter(),
         'images': 0,
-        'translation_progress': {}
+        'translation_progress': Counter()
     }
     
     # Get available languages
     available_languages = novel_config.get('languages', {}).get('available', ['en'])
     novel_stats['languages'].update(available_languages)
     
+    # Stats come from the primary language (usually English), falling back
+    # to the root chapters folder like load_chapter_content does
+    primary_lang = novel_config.get('primary_language', 'en')
+    chapters_dir = os.path.join(CONTENT_DIR, novel_slug, "chapters")
+    
     # Process each arc
     for arc in novel_config.get('arcs', []):
-        arc_stats = {
-            'title': arc.get('title', 'Unnamed Arc'),
-            'chapters': len(arc.get('chapters', [])),
-            'words': 0,
-            'characters': 0
-        }
+        # (words, characters, images) per chapter, summed per column once the arc is read
+        chapter_metrics = []
         
         # Process each chapter
         for chapter in arc.get('chapters', []):
@@ -5111,117 +5564,122 @@ def collect_novel_statistics(novel_slug, novel_config):
             if chapter_id:
                 novel_stats['total_chapters'] += 1
                 
-                # Get stats for primary language (usually English)
-                primary_lang = novel_config.get('primary_language', 'en')
-                content_md, metadata = load_chapter_content(novel_slug, chapter_id, primary_lang)
+                chapter_file = os.path.join(chapters_dir, primary_lang, f"{chapter_id}.md")
+                if not os.path.exists(chapter_file):
+                    chapter_file = os.path.join(chapters_dir, f"{chapter_id}.md")
                 
-                if content_md:
-                    word_count = len(content_md.split())
-                    char_count = len(content_md)
-                    
-                    arc_stats['words'] += word_count
-                    arc_stats['characters'] += char_count
-                    novel_stats['total_words'] += word_count
-                    novel_stats['total_characters'] += char_count
+                if os.path.exists(chapter_file):
+                    word_count, char_count, image_count, chapter_tags = _fast_chapter_stats(chapter_file)
+                    chapter_metrics.append((word_count, char_count, image_count))
                     
                     # Count tags
-                    chapter_tags = metadata.get('tags', [])
-                    for tag in chapter_tags:
-                        novel_stats['tags'][tag] = novel_stats['tags'].get(tag, 0) + 1
-                    
-                    # Count images in chapter
-                    image_count = len(re.findall(r'!\[.*?\]\(.*?\)', content_md))
-                    novel_stats['images'] += image_count
+                    novel_stats['tags'].update(chapter_tags)
                 
                 # Check translation progress
                 for lang in available_languages:
                     if lang != primary_lang:
                         if chapter_translation_exists(novel_slug, chapter_id, lang):
-                            if lang not in novel_stats['translation_progress']:
-                                novel_stats['translation_progress'][lang] = 0
                             novel_stats['translation_progress'][lang] += 1
         
-        novel_stats['arcs'].append(arc_stats)
+        arc_words, arc_characters, arc_images = (map(sum, zip(*chapter_metrics)) if chapter_metrics else (0, 0, 0))
+        novel_stats['total_words'] += arc_words
+        novel_stats['total_characters'] += arc_characters
+        novel_stats['images'] += arc_images
+        novel_stats['arcs'].append({
+            'title': arc.get('title', 'Unnamed Arc'),
+            'chapters': len(arc.get('chapters', [])),
+            'words': arc_words,
+            'characters': arc_characters
+        })
     
     return novel_stats
 
 def write_stats_report(report_file, stats):
     """Write the statistics report to a markdown file"""
-    report_file.write("# Site Statistics Report\n\n")
-    report_file.write(f"**Generated:** {stats['generated_at']}\n\n")
+    # Sections are collected in memory and written with a single call
+    report_parts = []
+    write = report_parts.append
+    
+    write("# Site Statistics Report\n\n")
+    write(f"**Generated:** {stats['generated_at']}\n\n")
     
     # Overview section
-    report_file.write("## Overview\n\n")
-    report_file.write("| Metric | Value |\n")
-    report_file.write("|--------|-------|\n")
-    report_file.write(f"| Total Novels | {len(stats['novels'])} |\n")
-    report_file.write(f"| Total Chapters | {stats['total_chapters']:,} |\n")
-    report_file.write(f"| Total Words | {stats['total_words']:,} |\n")
-    report_file.write(f"| Total Characters | {stats['total_characters']:,} |\n")
-    report_file.write(f"| Available Languages | {len(stats['languages'])} ({', '.join(stats['languages'])}) |\n")
-    report_file.write(f"| Unique Tags | {len(stats['tags'])} |\n")
-    report_file.write(f"| Images | {stats['images']} |\n")
-    report_file.write(f"| Build Files | {stats['build_files']:,} |\n\n")
+    write("## Overview\n\n")
+    write("| Metric | Value |\n")
+    write("|--------|-------|\n")
+    write(f"| Total Novels | {len(stats['novels'])} |\n")
+    write(f"| Total Chapters | {stats['total_chapters']:,} |\n")
+    write(f"| Total Words | {stats['total_words']:,} |\n")
+    write(f"| Total Characters | {stats['total_characters']:,} |\n")
+    write(f"| Available Languages | {len(stats['languages'])} ({', '.join(stats['languages'])}) |\n")
+    write(f"| Unique Tags | {len(stats['tags'])} |\n")
+    write(f"| Images | {stats['images']} |\n")
+    write(f"| Build Files | {stats['build_files']:,} |\n\n")
     
     # Novels section
     if stats['novels']:
-        report_file.write("## Novels\n\n")
+        write("## Novels\n\n")
         for novel in stats['novels']:
-            report_file.write(f"### {novel['title']} (`{novel['slug']}`)\n\n")
-            report_file.write("| Metric | Value |\n")
-            report_file.write("|--------|-------|\n")
-            report_file.write(f"| Status | {novel['status'].title()} |\n")
-            report_file.write(f"| Chapters | {novel['total_chapters']} |\n")
-            report_file.write(f"| Words | {novel['total_words']:,} |\n")
-            report_file.write(f"| Characters | {novel['total_characters']:,} |\n")
-            report_file.write(f"| Languages | {', '.join(sorted(novel['languages']))} |\n")
-            report_file.write(f"| Images | {novel['images']} |\n")
+            write(f"### {novel['title']} (`{novel['slug']}`)\n\n")
+            write("| Metric | Value |\n")
+            write("|--------|-------|\n")
+            write(f"| Status | {novel['status'].title()} |\n")
+            write(f"| Chapters | {novel['total_chapters']} |\n")
+            write(f"| Words | {novel['total_words']:,} |\n")
+            write(f"| Characters | {novel['total_characters']:,} |\n")
+            write(f"| Languages | {', '.join(sorted(novel['languages']))} |\n")
+            write(f"| Images | {novel['images']} |\n")
             
             # Translation progress
             if novel['translation_progress']:
-                report_file.write("\n**Translation Progress:**\n")
+                write("\n**Translation Progress:**\n")
                 total_chapters = novel['total_chapters']
-                for lang, translated_count in novel['translation_progress'].items():
-                    percentage = (translated_count / total_chapters * 100) if total_chapters > 0 else 0
-                    report_file.write(f"- {lang.upper()}: {translated_count}/{total_chapters} chapters ({percentage:.1f}%)\n")
+                write(''.join(
+                    f"- {lang.upper()}: {translated_count}/{total_chapters} chapters "
+                    f"({(translated_count / total_chapters * 100) if total_chapters > 0 else 0:.1f}%)\n"
+                    for lang, translated_count in novel['translation_progress'].items()
+                ))
             
             # Arc breakdown
             if novel['arcs']:
-                report_file.write("\n**Arc Breakdown:**\n")
-                report_file.write("| Arc | Chapters | Words | Characters |\n")
-                report_file.write("|-----|----------|-------|------------|\n")
-                for arc in novel['arcs']:
-                    report_file.write(f"| {arc['title']} | {arc['chapters']} | {arc['words']:,} | {arc['characters']:,} |\n")
+                write("\n**Arc Breakdown:**\n")
+                write("| Arc | Chapters | Words | Characters |\n")
+                write("|-----|----------|-------|------------|\n")
+                write(''.join(f"| {arc['title']} | {arc['chapters']} | {arc['words']:,} | {arc['characters']:,} |\n"
+                              for arc in novel['arcs']))
             
-            report_file.write("\n")
+            write("\n")
     
     # Tags section
     if stats['tags']:
-        report_file.write("## Popular Tags\n\n")
-        sorted_tags = sorted(stats['tags'].items(), key=lambda x: x[1], reverse=True)
-        report_file.write("| Tag | Usage Count |\n")
-        report_file.write("|-----|-------------|\n")
-        for tag, count in sorted_tags[:20]:  # Top 20 tags
-            report_file.write(f"| {tag} | {count} |\n")
-        report_file.write("\n")
+        write("## Popular Tags\n\n")
+        write("| Tag | Usage Count |\n")
+        write("|-----|-------------|\n")
+        # Top 20 tags; most_common selects them with a heap instead of sorting every tag
+        write(''.join(f"| {tag} | {count} |\n" for tag, count in Counter(stats['tags']).most_common(20)))
+        write("\n")
     
     # Template Overrides section
     template_stats = stats.get('template_overrides', {})
     if template_stats.get('novels_with_overrides', 0) > 0:
-        report_file.write("## Template Overrides\n\n")
-        report_file.write("| Metric | Value |\n")
-        report_file.write("|--------|-------|\n")
-        report_file.write(f"| Novels with Custom Templates | {template_stats['novels_with_overrides']} |\n")
-        report_file.write(f"| Total Custom Templates | {template_stats['total_custom_templates']} |\n\n")
-        
-        report_file.write("### Novels with Custom Templates\n\n")
-        for detail in template_stats['override_details']:
-            report_file.write(f"**{detail['novel_title']}** (`{detail['novel_slug']}`)\n")
-            report_file.write(f"- Custom templates: {detail['template_count']}\n")
-            report_file.write(f"- Templates: {', '.join(detail['custom_templates'])}\n\n")
+        write("## Template Overrides\n\n")
+        write("| Metric | Value |\n")
+        write("|--------|-------|\n")
+        write(f"| Novels with Custom Templates | {template_stats['novels_with_overrides']} |\n")
+        write(f"| Total Custom Templates | {template_stats['total_custom_templates']} |\n\n")
+        
+        write("### Novels with Custom Templates\n\n")
+        write(''.join(
+            f"**{detail['novel_title']}** (`{detail['novel_slug']}`)\n"
+            f"- Custom templates: {detail['template_count']}\n"
+            f"- Templates: {', '.join(detail['custom_templates'])}\n\n"
+            for detail in template_stats['override_details']
+        ))
     else:
-        report_file.write("## Template Overrides\n\n")
-        report_file.write("No novels are using custom template overrides.\n\n")
+        write("## Template Overrides\n\n")
+        write("No novels are using custom template overrides.\n\n")
+    
+    report_file.write(''.join(report_parts))
 
 def print_stats_summary(stats):
     """Print a summary of the statistics to console"""
@@ -5240,52 +5698,44 @@ def print_stats_summary(stats):
 def determine_rebuild_scope(changed_file_path):
     """Determine what needs to be rebuilt based on the changed file"""
     changed_file_path = os.path.normpath(changed_file_path).replace('\\', '/')
+    parts = changed_file_path.split('/')
+    root = parts[0]
+    file_name = parts[-1]
     
     # Site config changes require full rebuild
-    if changed_file_path.endswith('site_config.yaml') or changed_file_path.endswith('site_config.yml'):
+    if file_name in ('site_config.yaml', 'site_config.yml'):
         return {'type': 'full', 'reason': 'Site config changed'}
     
     # Template changes require full rebuild
-    if 'templates/' in changed_file_path and changed_file_path.endswith('.html'):
-        return {'type': 'full', 'reason': 'Global template changed'}
-    
-    # Novel-specific template changes
-    if 'content/' in changed_file_path and 'templates/' in changed_file_path and changed_file_path.endswith('.html'):
-        # Extract novel slug from path (e.g., content/novel-slug/templates/chapter.html)
-        parts = changed_file_path.split('/')
-        if len(parts) >= 4 and parts[0] == 'content' and parts[2] == 'templates':
-            novel_slug = parts[1]
-            template_name = parts[3]
-            return {'type': 'novel_template', 'novel': novel_slug, 'template': template_name, 'reason': f'Novel template {template_name} changed'}
+    if root == 'templates':
+        if file_name.endswith('.html'):
+            return {'type': 'full', 'reason': 'Global template changed'}
     
     # Static file changes (CSS, JS, images)
-    if 'static/' in changed_file_path:
+    elif root == 'static':
         return {'type': 'static', 'file': changed_file_path, 'reason': 'Static asset changed'}
     
-    # Novel config changes
-    if 'content/' in changed_file_path and changed_file_path.endswith('config.yaml'):
-        # Extract novel slug from path
-        parts = changed_file_path.split('/')
-        if len(parts) >= 2 and parts[0] == 'content':
-            novel_slug = parts[1]
+    elif root == 'content' and len(parts) >= 2:
+        novel_slug = parts[1]
+        
+        # Novel-specific template changes (e.g., content/novel-slug/templates/chapter.html)
+        if len(parts) >= 4 and parts[2] == 'templates' and file_name.endswith('.html'):
+            template_name = parts[3]
+            return {'type': 'novel_template', 'novel': novel_slug, 'template': template_name, 'reason': f'Novel template {template_name} changed'}
+        
+        # Novel config changes
+        if file_name.endswith('config.yaml'):
             return {'type': 'novel_config', 'novel': novel_slug, 'reason': 'Novel config changed'}
-    
-    # Chapter markdown changes
-    if 'content/' in changed_file_path and changed_file_path.endswith('.md'):
-        # Extract novel slug and chapter info
-        parts = changed_file_path.split('/')
-        if len(parts) >= 4 and parts[0] == 'content' and parts[2] == 'chapters':
-            novel_slug = parts[1]
-            
+        
+        # Chapter markdown changes
+        if len(parts) >= 4 and parts[2] == 'chapters' and file_name.endswith('.md'):
             # Check if it's a translation (e.g., content/novel/chapters/jp/chapter-1.md)
             if len(parts) == 5:
                 language = parts[3]
-                chapter_file = parts[4]
             else:
                 language = 'en'
-                chapter_file = parts[3]
             
-            chapter_id = chapter_file[:-3] if chapter_file.endswith('.md') else chapter_file
+            chapter_id = file_name[:-3]
             return {
                 'type': 'chapter', 
                 'novel': novel_slug, 
@@ -5295,30 +5745,75 @@ def determine_rebuild_scope(changed_file_path):
             }
     
     # Static page changes
-    if 'pages/' in changed_file_path and changed_file_path.endswith('.md'):
-        # Extract page info
-        parts = changed_file_path.split('/')
-        if len(parts) >= 2 and parts[0] == 'pages':
-            
-            # Check if it's a translation (e.g., pages/jp/about.md)
-            if len(parts) == 3 and len(parts[1]) == 2:  # Language code
-                language = parts[1]
-                page_file = parts[2]
-            else:
-                language = 'en'
-                page_file = parts[1] if len(parts) == 2 else '/'.join(parts[1:])
-            
-            page_slug = page_file[:-3] if page_file.endswith('.md') else page_file
-            return {
-                'type': 'page',
-                'page': page_slug,
-                'language': language,
-                'reason': f'Static page {page_slug} changed'
-            }
+    elif root == 'pages' and len(parts) >= 2 and file_name.endswith('.md'):
+        # Check if it's a translation (e.g., pages/jp/about.md)
+        if len(parts) == 3 and len(parts[1]) == 2:  # Language code
+            language = parts[1]
+            page_file = parts[2]
+        else:
+            language = 'en'
+            page_file = parts[1] if len(parts) == 2 else '/'.join(parts[1:])
+        
+        page_slug = page_file[:-3]
+        return {
+            'type': 'page',
+            'page': page_slug,
+            'language': language,
+            'reason': f'Static page {page_slug} changed'
+        }
     
     # Default to full rebuild for unknown changes
     return {'type': 'full', 'reason': 'Unknown file type changed'}
 
+# Watched paths inside VCS/editor/build directories never trigger a rebuild
+_WATCH_IGNORE_RE = re.compile(r'(?:^|[\\/])(?:\.git|__pycache__|\.vscode|build)(?:[\\/]|$)', re.IGNORECASE)
+# Source files under the watched directories that do
+_WATCH_REBUILD_RE = re.compile(
+    r'(?:^|[\\/])(?:content|templates|static|pages)[\\/].*\.(?:md|ya?ml|css|js|html|jpe?g|png|webp)$',
+    re.IGNORECASE,
+)
+
+def should_rebuild_for_path(file_path):
+    """Check if a changed file (either path separator) should trigger a rebuild"""
+    return not _WATCH_IGNORE_RE.search(file_path) and _WATCH_REBUILD_RE.search(file_path) is not None
+
+def coalesce_rebuild_scopes(changed_file_paths):
+    """Reduce a batch of changed files to the distinct rebuilds they require"""
+    scopes = []
+    seen = set()
+    for changed_file_path in sorted(changed_file_paths):
+        rebuild_info = determine_rebuild_scope(changed_file_path)
+        # A full rebuild already covers every other change in the batch
+        if rebuild_info['type'] == 'full':
+            return [rebuild_info]
+        key = tuple(sorted(rebuild_info.items()))
+        if key not in seen:
+            seen.add(key)
+            scopes.append(rebuild_info)
+    return scopes
+
+class RebuildWorker:
+    """Run watch-mode rebuilds one at a time on a dedicated thread"""
+    def __init__(self, rebuild):
+        self._rebuild = rebuild
+        self._queue = queue.Queue()
+        threading.Thread(target=self._run, daemon=True).start()
+    
+    def submit(self, changed_paths):
+        """Queue a batch of changed paths for the worker thread"""
+        self._queue.put(changed_paths)
+    
+    def _run(self):
+        while True:
+            changed_paths = set(self._queue.get())
+            # Batches that arrived while the previous rebuild ran are merged into one pass
+            while True:
+                try:
+                    changed_paths |= self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            self._rebuild(changed_paths)
+
 def incremental_rebuild_static(file_path):
     """Copy a single static file to build directory"""
     try:
@@ -5326,12 +5821,20 @@ def incremental_rebuild_static(file_path):
         rel_path = os.path.relpath(file_path, STATIC_DIR)
         target_path = os.path.normpath(os.path.join(BUILD_DIR, "static", rel_path))
         
-        # Ensure target directory exists
-        os.makedirs(os.path.dirname(target_path), exist_ok=True)
-        
-        # Copy the file
-        import shutil
-        shutil.copy2(file_path, target_path)
+        # Editors often emit several modify events per save; skip the copy when
+        # the build copy already matches the source's size and mtime
+        src_stat = os.stat(file_path)
+        try:
+            dst_stat = os.stat(target_path)
+            if dst_stat.st_size == src_stat.st_size and dst_stat.st_mtime_ns == src_stat.st_mtime_ns:
+                return True
+        except FileNotFoundError:
+            # Ensure target directory exists
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        
+        # Copy the contents, then carry over the timestamps the check above compares
+        shutil.copyfile(file_path, target_path)
+        os.utime(target_path, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
         print(f"    Updated static file: {rel_path}")
         return True
     except Exception as e:
@@ -5366,16 +5869,15 @@ def incremental_rebuild_page(page_slug, language='en'):
         breadcrumb_depth = page_slug.count('/') + 2
         
         # Build breadcrumbs
-        breadcrumbs = [{'title': 'Home', 'url': '../' * breadcrumb_depth}]
+        root_url = '../' * breadcrumb_depth
+        breadcrumbs = [{'title': 'Home', 'url': root_url}]
         if '/' in page_slug:
-            parts = page_slug.split('/')
-            url_parts = []
-            for i, part in enumerate(parts[:-1]):
-                url_parts.append(part)
-                parent_url = '../' * breadcrumb_depth + '/'.join(url_parts) + f'/{language}/'
+            parent_path = ''
+            for part in page_slug.split('/')[:-1]:
+                parent_path += f'{part}/'
                 breadcrumbs.append({
                     'title': part.replace('-', ' ').title(),
-                    'url': parent_url
+                    'url': f'{root_url}{parent_path}{language}/'
                 })
         
         breadcrumbs.append({'title': page_metadata.get('title', page_slug.split('/')[-1].replace('-', ' ').title()), 'url': ''})
@@ -5445,9 +5947,7 @@ def incremental_rebuild_chapter(novel_slug, chapter_id, language='en'):
             return True
         
         # Create chapter directory
-        novel_dir = os.path.normpath(os.path.join(BUILD_DIR, novel_slug))
-        lang_dir = os.path.normpath(os.path.join(novel_dir, language))
-        chapter_dir = os.path.normpath(os.path.join(lang_dir, chapter_id))
+        chapter_dir = os.path.normpath(os.path.join(BUILD_DIR, novel_slug, language, chapter_id))
         os.makedirs(chapter_dir, exist_ok=True)
         
         # Process images for this chapter
@@ -5463,13 +5963,25 @@ def incremental_rebuild_chapter(novel_slug, chapter_id, language='en'):
         if 'en' not in available_languages:
             available_languages.append('en')
         
-        # Get chapter index for navigation
+        # One pass over the novel collects both the navigation order (all published chapters)
+        # and the template structure (visible arcs/chapters only, hidden chapters removed)
         all_chapters = []
+        arcs_for_template = []
         for arc in novel_config.get('arcs', []):
+            visible_chapters = []
             for chapter in arc.get('chapters', []):
                 chapter_content_check, chapter_metadata_check = load_chapter_content(novel_slug, chapter['id'], language)
-                if chapter_content_check and not should_skip_chapter(chapter_metadata_check, INCLUDE_DRAFTS, INCLUDE_SCHEDULED):
-                    all_chapters.append(chapter)
+                if not chapter_content_check or should_skip_chapter(chapter_metadata_check, INCLUDE_DRAFTS, INCLUDE_SCHEDULED):
+                    continue
+                all_chapters.append(chapter)
+                if not chapter_metadata_check.get('hidden', False):
+                    visible_chapters.append(chapter)
+            
+            if visible_chapters:  # Only include arc if it has visible chapters
+                arcs_for_template.append({
+                    'title': arc.get('title', ''),
+                    'chapters': visible_chapters
+                })
         
         current_index = next((i for i, ch in enumerate(all_chapters) if ch['id'] == chapter_id), -1)
         prev_chapter = all_chapters[current_index - 1] if current_index > 0 else None
@@ -5485,48 +5997,36 @@ def incremental_rebuild_chapter(novel_slug, chapter_id, language='en'):
         novel_for_template = {
             'title': novel_config.get('title', novel_slug),
             'slug': novel_slug,
-            'arcs': []
+            'arcs': arcs_for_template
         }
         
-        # Add only visible arcs and chapters
-        for arc in novel_config.get('arcs', []):
-            visible_chapters = []
-            for chapter in arc.get('chapters', []):
-                chapter_content_check, chapter_metadata_check = load_chapter_content(novel_slug, chapter['id'], language)
-                if (chapter_content_check and 
-                    not should_skip_chapter(chapter_metadata_check, INCLUDE_DRAFTS, INCLUDE_SCHEDULED) and 
-                    not chapter_metadata_check.get('hidden', False)):
-                    visible_chapters.append(chapter)
-            
-            if visible_chapters:  # Only include arc if it has visible chapters
-                arc_for_template = {
-                    'title': arc.get('title', ''),
-                    'chapters': visible_chapters
-                }
-                novel_for_template['arcs'].append(arc_for_template)
+        # Read each template input once
+        meta_get = chapter_metadata.get
+        chapter_title = meta_get('title', chapter_info['title'])
+        chapter_tags = meta_get('tags')
+        password = meta_get('password')
+        twitter_handle = site_config.get('social_embeds', {}).get('twitter_handle')
         
         # Build social meta and other template variables
         chapter_social_meta = build_social_meta(site_config, novel_config, chapter_metadata, 'chapter', 
-                                               chapter_metadata.get('title', chapter_info['title']), 
+                                               chapter_title, 
                                                f"{site_config.get('site_url', '').rstrip('/')}/{novel_slug}/{language}/{chapter_id}/")
         chapter_seo_meta = build_seo_meta(site_config, novel_config, chapter_metadata, 'chapter')
         footer_data = build_footer_content(site_config, novel_config, 'chapter')
         
         # Determine what to show
-        show_tags = bool(chapter_metadata.get('tags'))
-        show_metadata = bool(chapter_metadata.get('author') or chapter_metadata.get('translator') or chapter_metadata.get('published'))
-        show_translation_notes = bool(chapter_metadata.get('translation_notes') or chapter_metadata.get('translator_commentary'))
+        show_tags = bool(chapter_tags)
+        show_metadata = bool(meta_get('author') or meta_get('translator') or meta_get('published'))
+        show_translation_notes = bool(meta_get('translation_notes') or meta_get('translator_commentary'))
         
-        # Handle password protection
-        is_password_protected = bool(chapter_metadata.get('password'))
+        # Handle password protection (same scheme as build_site, which password-unlock.js decrypts)
+        chapter_content_html = convert_markdown_to_html(updated_content)
+        is_password_protected = bool(password)
         encrypted_content = None
         password_hash = None
         if is_password_protected:
-            from hashlib import sha256
-            password = chapter_metadata['password']
-            password_hash = sha256(password.encode()).hexdigest()
-            # Simple XOR encryption for demo (not secure)
-            encrypted_content = ''.join(chr(ord(c) ^ 42) for c in updated_content)
+            encrypted_content, password_hash = encrypt_content_with_password(f'<div class="chapter-content">\n{chapter_content_html}\n</div>', password)
+            chapter_content_html = '<div id="password-protected-content" style="text-align: center; padding: 2rem;"><p>This chapter is password protected.</p></div>'
         
         # Check comments
         comments_enabled = should_enable_comments(site_config, novel_config, chapter_metadata, 'chapter')
@@ -5538,8 +6038,8 @@ def incremental_rebuild_chapter(novel_slug, chapter_id, language='en'):
                                      novel_config=novel_config,
                                      novel=novel_for_template,
                                      chapter=chapter_info,
-                                     chapter_title=chapter_metadata.get('title', chapter_info['title']),
-                                     chapter_content=convert_markdown_to_html(updated_content),
+                                     chapter_title=chapter_title,
+                                     chapter_content=chapter_content_html,
                                      chapter_metadata=chapter_metadata,
                                      prev_chapter=prev_chapter,
                                      next_chapter=next_chapter,
@@ -5551,7 +6051,7 @@ def incremental_rebuild_chapter(novel_slug, chapter_id, language='en'):
                                      is_password_protected=is_password_protected,
                                      encrypted_content=encrypted_content,
                                      password_hash=password_hash,
-                                     password_hint=chapter_metadata.get('password_hint', ''),
+                                     password_hint=meta_get('password_hint', ''),
                                      site_name=site_config.get('site_name', 'Web Novel Collection'),
                                      social_title=chapter_social_meta['title'],
                                      social_description=chapter_social_meta['description'],
@@ -5560,7 +6060,7 @@ def incremental_rebuild_chapter(novel_slug, chapter_id, language='en'):
                                      seo_meta_description=chapter_seo_meta.get('meta_description'),
                                      seo_keywords=chapter_social_meta.get('keywords'),
                                      allow_indexing=chapter_seo_meta.get('allow_indexing', True),
-                                     twitter_handle=site_config.get('social_embeds', {}).get('twitter_handle'),
+                                     twitter_handle=twitter_handle,
                                      footer_data=footer_data,
                                      comments_enabled=comments_enabled,
                                      comments_repo=comments_config['repo'],
@@ -5576,7 +6076,7 @@ def incremental_rebuild_chapter(novel_slug, chapter_id, language='en'):
         print(f"    Rebuilt chapter: {novel_slug}/{chapter_id} ({language})")
         
         # Check if we need to update tag pages (if chapter tags changed)
-        if chapter_metadata.get('tags'):
+        if chapter_tags:
             print(f"    Chapter has tags, may need to rebuild tag pages")
             # For now, we'll leave tag rebuilding as a future enhancement
         
@@ -5586,12 +6086,42 @@ def incremental_rebuild_chapter(novel_slug, chapter_id, language='en'):
         print(f"    Error rebuilding chapter {novel_slug}/{chapter_id}: {e}")
         return False
 
+def rebuild_single_novel(novel_slug):
+    """Rebuild the TOC, chapter, tag, glossary and character pages of one novel"""
+    try:
+        site_config = load_site_config()
+        authors_config = load_authors_config()
+        all_novels_data = load_all_novels_data()
+        
+        novel = next((n for n in all_novels_data if n['slug'] == novel_slug), None)
+        if novel is None:
+            print(f"    Novel {novel_slug} not found")
+            return False
+        
+        apply_processed_cover_art(novel)
+        
+        chapter_groups = []
+        queue_novel_pages(novel, site_config, all_novels_data, chapter_groups)
+        render_chapter_pages(chapter_groups, site_config, authors_config, serve_mode=True)
+        generate_novel_reference_pages(novel, site_config)
+        
+        chapter_count = sum(len(group['all_chapters']) for group in chapter_groups)
+        print(f"    Rebuilt {chapter_count} chapter pages for {novel_slug}")
+        return True
+        
+    except Exception as e:
+        print(f"    Error rebuilding novel {novel_slug}: {e}")
+        return False
+
 def perform_incremental_rebuild(rebuild_info, include_drafts=False, include_scheduled=False):
     """Perform incremental rebuild based on the rebuild scope"""
     global INCLUDE_DRAFTS, INCLUDE_SCHEDULED
     INCLUDE_DRAFTS = include_drafts
     INCLUDE_SCHEDULED = include_scheduled
     
+    # The changed file may be any chapter, so drop every memoized chapter read
+    load_chapter_content.cache_clear()
+    
     rebuild_type = rebuild_info['type']
     
     if rebuild_type == 'full':
@@ -5616,8 +6146,8 @@ def perform_incremental_rebuild(rebuild_info, include_drafts=False, include_sche
         
     elif rebuild_type == 'novel_config':
         print(f"Novel rebuild needed: {rebuild_info['reason']}")
-        # For novel config changes, we need to rebuild the entire novel
-        # This is complex, so for now fall back to full rebuild
+        # Novel config also feeds the front page, feeds, sitemap and search
+        # index, so unlike template changes this still needs a full rebuild
         os.makedirs(BUILD_DIR, exist_ok=True)
         build_site(include_drafts=include_drafts, include_scheduled=include_scheduled, no_epub=True, optimize_images=False, serve_mode=True, no_minify=True)
         return True
@@ -5629,16 +6159,152 @@ def perform_incremental_rebuild(rebuild_info, include_drafts=False, include_sche
         if novel_slug in _novel_template_envs:
             del _novel_template_envs[novel_slug]
         
-        # For template changes, we need to rebuild the entire novel since 
-        # we don't know which pages use this template
-        os.makedirs(BUILD_DIR, exist_ok=True)
-        build_site(include_drafts=include_drafts, include_scheduled=include_scheduled, no_epub=True, optimize_images=False, serve_mode=True, no_minify=True)
-        return True
+        # Novel templates only render that novel's pages, but we don't know
+        # which of them use this template, so rebuild all of the novel's pages
+        return rebuild_single_novel(novel_slug)
         
     else:
         print(f"Unknown rebuild type: {rebuild_type}")
         return False
 
+class PooledHTTPServer(HTTPServer):
+    """HTTP server that handles requests on a bounded pool of reused threads
+    instead of starting a new thread per connection"""
+    def __init__(self, server_address, handler_class, max_workers=None):
+        super().__init__(server_address, handler_class)
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+    
+    def process_request(self, request, client_address):
+        self._executor.submit(self._process_request_worker, request, client_address)
+    
+    def _process_request_worker(self, request, client_address):
+        # Same as socketserver.ThreadingMixIn.process_request_thread
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+    
+    def server_close(self):
+        super().server_close()
+        self._executor.shutdown(wait=False)
+
+def make_live_reload_handler(port, build_dir):
+    """Create a request handler class that serves build_dir and injects the live reload script"""
+    import threading
+    from stat import S_ISREG
+    from http.server import SimpleHTTPRequestHandler
+    
+    class LiveReloadHandler(SimpleHTTPRequestHandler):
+        # Class-level cache of injected pages: file path -> (mtime_ns, size, bytes),
+        # least recently served first
+        _cache = OrderedDict()
+        _cache_lock = threading.Lock()
+        _cache_size = 64
+        # Generated pages end with </body></html>, so only the tail is searched
+        _body_search_window = 16 * 1024
+        # The script only depends on the port, so it is encoded once
+        _live_reload_script = f'''<script>(function(){{const ws=new WebSocket('ws://localhost:{port + 1}');ws.onmessage=function(e){{if(e.data==='reload')window.location.reload();}};ws.onclose=function(){{setTimeout(()=>window.location.reload(),2000);}};}})();</script>'''.encode('utf-8')
+        
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=build_dir, **kwargs)
+        
+        def do_GET(self):
+            try:
+                # For non-HTML files, use the fast default handler
+                if not (self.path.endswith('.html') or self.path.endswith('/')):
+                    super().do_GET()
+                    return
+                
+                # Only inject script for HTML files
+                # Get the actual file path
+                if self.path == '/':
+                    file_path = os.path.join(build_dir, 'index.html')
+                elif self.path.endswith('/'):
+                    file_path = os.path.join(build_dir, self.path.strip('/'), 'index.html')
+                else:
+                    file_path = os.path.join(build_dir, self.path.strip('/'))
+                
+                # Check if file exists
+                try:
+                    file_stat = os.stat(file_path)
+                except OSError:
+                    file_stat = None
+                if file_stat is None or not S_ISREG(file_stat.st_mode):
+                    self.send_error(404)
+                    return
+                
+                # Reuse the injected page while the file's mtime and size are unchanged
+                stamp = (file_stat.st_mtime_ns, file_stat.st_size)
+                with self._cache_lock:
+                    cached = self._cache.get(file_path)
+                    if cached and cached[:2] == stamp:
+                        self._cache.move_to_end(file_path)
+                        content = cached[2]
+                    else:
+                        content = None
+                
+                if content is None:
+                    # Read file in binary mode for better performance
+                    with open(file_path, 'rb') as f:
+                        tail_start = max(0, file_stat.st_size - self._body_search_window)
+                        f.seek(tail_start)
+                        tail = f.read()
+                        body_end = tail.rfind(b'</body>')
+                        
+                        # Only inject if we find </body>
+                        if body_end != -1:
+                            # Inject live reload script
+                            f.seek(0)
+                            content = b''.join((f.read(tail_start), tail[:body_end], self._live_reload_script, tail[body_end:]))
+                    
+                    if content is None:
+                        # Nothing to inject: the default handler streams the file without buffering it
+                        super().do_GET()
+                        return
+                    
+                    with self._cache_lock:
+                        self._cache[file_path] = (*stamp, content)
+                        self._cache.move_to_end(file_path)
+                        if len(self._cache) > self._cache_size:
+                            self._cache.popitem(last=False)
+                
+                # Send response
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+                
+            except (ConnectionAbortedError, ConnectionResetError, BrokenPipeError):
+                # Silently handle connection errors
+                pass
+            except Exception as e:
+                # Fall back to default handler on error
+                try:
+                    super().do_GET()
+                except:
+                    pass
+        
+        def log_message(self, format, *args):
+            # Suppress HTTP server logs for cleaner output
+            pass
+        
+        def handle_one_request(self):
+            # Override to add better error handling
+            try:
+                super().handle_one_request()
+            except (ConnectionAbortedError, ConnectionResetError, BrokenPipeError):
+                # Silently ignore connection errors
+                self.close_connection = True
+            except Exception:
+                self.close_connection = True
+    
+    return LiveReloadHandler
+
 def start_development_server(port=8000, include_drafts=False, include_scheduled=False):
     """Start development server with live reload"""
     try:
@@ -5648,7 +6314,6 @@ def start_development_server(port=8000, include_drafts=False, include_scheduled=
         import time
         import signal
         import sys
-        from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
         from watchdog.observers import Observer
         from watchdog.events import FileSystemEventHandler
         import os
@@ -5663,81 +6328,74 @@ def start_development_server(port=8000, include_drafts=False, include_scheduled=
         # File change handler
         class ChangeHandler(FileSystemEventHandler):
             def __init__(self):
-                self.last_rebuild = 0
-                self.rebuild_delay = 1  # Wait 1 second between rebuilds
+                self.rebuild_delay = 0.3  # Quiet period used to coalesce bursts of saves
                 self.include_drafts = include_drafts
                 self.include_scheduled = include_scheduled
+                self._pending = set()
+                self._timer = None
+                self._lock = threading.Lock()
+                self._worker = RebuildWorker(self.rebuild_site)
             
             def on_modified(self, event):
-                if event.is_directory:
-                    return
-                
+                if not event.is_directory:
+                    self._queue(event.src_path)
+            
+            def on_created(self, event):
+                if not event.is_directory:
+                    self._queue(event.src_path)
+            
+            def on_moved(self, event):
+                # Editors (and the studio) save by renaming a temp file over
+                # the original, which only reports a move to the real name
+                if not event.is_directory:
+                    self._queue(event.dest_path)
+            
+            def _queue(self, file_path):
                 # Only rebuild for relevant file changes
-                if self.should_rebuild(event.src_path):
-                    current_time = time.time()
-                    if current_time - self.last_rebuild > self.rebuild_delay:
-                        self.last_rebuild = current_time
-                        self.rebuild_site(event.src_path)
+                if self.should_rebuild(file_path):
+                    # Queue the path and restart the quiet-period timer so that
+                    # every change in a burst is picked up by a single rebuild
+                    with self._lock:
+                        self._pending.add(file_path)
+                        if self._timer:
+                            self._timer.cancel()
+                        self._timer = threading.Timer(self.rebuild_delay, self._flush)
+                        self._timer.daemon = True
+                        self._timer.start()
+            
+            def _flush(self):
+                with self._lock:
+                    changed_paths = self._pending
+                    self._pending = set()
+                    self._timer = None
+                if changed_paths:
+                    self._worker.submit(changed_paths)
             
             def should_rebuild(self, file_path):
                 """Check if file change should trigger rebuild"""
-                file_path = str(file_path).lower()
-                rebuild_extensions = {'.md', '.yaml', '.yml', '.css', '.js', '.html', '.jpg', '.jpeg', '.png', '.webp'}
-                rebuild_dirs = {'content', 'templates', 'static', 'pages'}
-                
-                # Ignore .git folder and its contents (handle both / and \ separators)
-                normalized_path = file_path.replace('/', os.sep).replace('\\', os.sep)
-                path_parts = normalized_path.split(os.sep)
-                if '.git' in path_parts or normalized_path.startswith('.git' + os.sep):
-                    return False
-                
-                # Ignore other system/build directories
-                ignore_patterns = ['__pycache__', '.vscode', 'build']
-                for pattern in ignore_patterns:
-                    if pattern in path_parts:
-                        return False
-                
-                # Check file extension
-                for ext in rebuild_extensions:
-                    if file_path.endswith(ext):
-                        break
-                else:
-                    return False
-                
-                # Check if in relevant directory
-                for dir_name in rebuild_dirs:
-                    if f'{os.sep}{dir_name}{os.sep}' in file_path or file_path.startswith(dir_name):
-                        return True
-                
-                return False
+                return should_rebuild_for_path(str(file_path))
             
-            def rebuild_site(self, changed_file_path):
+            def rebuild_site(self, changed_file_paths):
                 """Rebuild site and notify clients using incremental rebuilds"""
                 try:
-                    print("File change detected, analyzing...")
+                    print(f"{len(changed_file_paths)} file change(s) detected, analyzing...")
                     
-                    # Determine what needs to be rebuilt
-                    rebuild_info = determine_rebuild_scope(changed_file_path)
-                    
-                    # Perform incremental rebuild
-                    success = perform_incremental_rebuild(rebuild_info, include_drafts=self.include_drafts, include_scheduled=self.include_scheduled)
+                    # Determine what needs to be rebuilt, one pass per distinct scope
+                    success = True
+                    for rebuild_info in coalesce_rebuild_scopes(changed_file_paths):
+                        # Perform incremental rebuild
+                        if not perform_incremental_rebuild(rebuild_info, include_drafts=self.include_drafts, include_scheduled=self.include_scheduled):
+                            success = False
                     
                     if success:
-                        print("Rebuild completed, waiting for filesystem sync...")
-                        
-                        # Trigger browser reload after a delay to ensure files are fully written
+                        # Every output file has been written and closed by the time the
+                        # rebuild returns, so browsers can reload straight away
                         if connected_clients:
-                            # Run broadcast in a thread-safe way with delay
-                            def trigger_reload():
-                                try:
-                                    import time
-                                    time.sleep(1.5)  # Wait for filesystem operations to complete
-                                    loop = websocket_loop
-                                    asyncio.run_coroutine_threadsafe(broadcast_reload(), loop)
-                                    print("Browser refresh triggered")
-                                except:
-                                    pass
-                            threading.Thread(target=trigger_reload, daemon=True).start()
+                            try:
+                                websocket_loop.call_soon_threadsafe(broadcast_reload)
+                                print("Rebuild complete, browser refresh triggered")
+                            except Exception:
+                                pass
                         else:
                             print("Rebuild complete")
                     else:
@@ -5766,13 +6424,11 @@ def start_development_server(port=8000, include_drafts=False, include_scheduled=
                     except:
                         pass
         
-        async def broadcast_reload():
-            """Broadcast reload message to all connected clients"""
-            if connected_clients:
-                await asyncio.gather(
-                    *[client.send("reload") for client in connected_clients.copy()],
-                    return_exceptions=True
-                )
+        def broadcast_reload():
+            """Broadcast reload message to all connected clients (runs on the websocket loop)"""
+            # broadcast() encodes the frame once and writes it to every open connection
+            # without a task per client; closed or slow clients are skipped
+            websockets.broadcast(connected_clients.copy(), "reload")
         
         # WebSocket server for live reload
         async def websocket_handler(websocket, path):
@@ -5787,77 +6443,6 @@ def start_development_server(port=8000, include_drafts=False, include_scheduled=
                 connected_clients.discard(websocket)
                 print(f"Client disconnected (total: {len(connected_clients)})")
         
-        # Custom HTTP handler that injects live reload script
-        class LiveReloadHandler(SimpleHTTPRequestHandler):
-            # Class-level cache for injected scripts
-            _cache = {}
-            _cache_lock = threading.Lock()
-            
-            def __init__(self, *args, **kwargs):
-                super().__init__(*args, directory=BUILD_DIR, **kwargs)
-            
-            def do_GET(self):
-                try:
-                    # For non-HTML files, use the fast default handler
-                    if not (self.path.endswith('.html') or self.path.endswith('/')):
-                        super().do_GET()
-                        return
-                    
-                    # Only inject script for HTML files
-                    # Get the actual file path
-                    if self.path == '/':
-                        file_path = os.path.join(BUILD_DIR, 'index.html')
-                    elif self.path.endswith('/'):
-                        file_path = os.path.join(BUILD_DIR, self.path.strip('/'), 'index.html')
-                    else:
-                        file_path = os.path.join(BUILD_DIR, self.path.strip('/'))
-                    
-                    # Check if file exists
-                    if not os.path.exists(file_path):
-                        self.send_error(404)
-                        return
-                    
-                    # Read file in binary mode for better performance
-                    with open(file_path, 'rb') as f:
-                        content = f.read()
-                    
-                    # Only inject if we find </body>
-                    if b'</body>' in content:
-                        # Inject live reload script
-                        live_reload_script = f'''<script>(function(){{const ws=new WebSocket('ws://localhost:{port + 1}');ws.onmessage=function(e){{if(e.data==='reload')window.location.reload();}};ws.onclose=function(){{setTimeout(()=>window.location.reload(),2000);}};}})();</script>'''.encode('utf-8')
-                        content = content.replace(b'</body>', live_reload_script + b'</body>')
-                    
-                    # Send response
-                    self.send_response(200)
-                    self.send_header('Content-Type', 'text/html; charset=utf-8')
-                    self.send_header('Content-Length', str(len(content)))
-                    self.end_headers()
-                    self.wfile.write(content)
-                    
-                except (ConnectionAbortedError, ConnectionResetError, BrokenPipeError):
-                    # Silently handle connection errors
-                    pass
-                except Exception as e:
-                    # Fall back to default handler on error
-                    try:
-                        super().do_GET()
-                    except:
-                        pass
-            
-            def log_message(self, format, *args):
-                # Suppress HTTP server logs for cleaner output
-                pass
-            
-            def handle_one_request(self):
-                # Override to add better error handling
-                try:
-                    super().handle_one_request()
-                except (ConnectionAbortedError, ConnectionResetError, BrokenPipeError):
-                    # Silently ignore connection errors
-                    self.close_connection = True
-                except Exception:
-                    self.close_connection = True
-        
         # Start file watcher
         event_handler = ChangeHandler()
         observer = Observer()
@@ -5879,7 +6464,12 @@ def start_development_server(port=8000, include_drafts=False, include_scheduled=
         # Start WebSocket server in background
         def run_websocket_server():
             nonlocal websocket_loop
-            loop = asyncio.new_event_loop()
+            # uvloop's libuv-based loop when installed; only this thread's loop uses it
+            try:
+                import uvloop
+                loop = uvloop.new_event_loop()
+            except ImportError:
+                loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
             websocket_loop = loop
             loop.run_until_complete(start_websocket_server())
@@ -5891,11 +6481,12 @@ def start_development_server(port=8000, include_drafts=False, include_scheduled=
         # Store thread reference for cleanup
         cleanup_threads = [websocket_thread]
         
-        # Start HTTP server with threading for better performance
-        httpd = ThreadingHTTPServer(("localhost", port), LiveReloadHandler)
+        # Start HTTP server; requests are handled on a bounded thread pool
+        httpd = PooledHTTPServer(("localhost", port), make_live_reload_handler(port, BUILD_DIR))
         
         # Global shutdown flag to prevent multiple shutdown attempts
         shutdown_in_progress = False
+        shutdown_event = threading.Event()
         
         # Set up proper signal handling for graceful shutdown
         def signal_handler(signum, frame):
@@ -5906,6 +6497,7 @@ def start_development_server(port=8000, include_drafts=False, include_scheduled=
                 return
                 
             shutdown_in_progress = True
+            shutdown_event.set()
             print("\nShutting down server...")
             
             # Force exit after 1 second regardless
@@ -5931,25 +6523,10 @@ def start_development_server(port=8000, include_drafts=False, include_scheduled=
             finally:
                 os._exit(0)
         
-        # Register signal handlers for Ctrl+C (and re-register periodically)
-        def register_handlers():
-            signal.signal(signal.SIGINT, signal_handler)
-            if hasattr(signal, 'SIGTERM'):
-                signal.signal(signal.SIGTERM, signal_handler)
-        
-        register_handlers()
-        
-        # Simplified signal re-registration (less aggressive)
-        def reregister_signals():
-            while not shutdown_in_progress:
-                time.sleep(10)  # Re-register every 10 seconds
-                try:
-                    register_handlers()
-                except:
-                    pass
-        
-        signal_thread = threading.Thread(target=reregister_signals, daemon=True)
-        signal_thread.start()
+        # Register signal handlers for Ctrl+C (registrations persist, so this happens once)
+        signal.signal(signal.SIGINT, signal_handler)
+        if hasattr(signal, 'SIGTERM'):
+            signal.signal(signal.SIGTERM, signal_handler)
         
         print(f"Development server running at http://localhost:{port}/")
         print("Press Ctrl+C to stop the server")
@@ -5967,8 +6544,15 @@ def start_development_server(port=8000, include_drafts=False, include_scheduled=
         
         # Keep main thread alive and responsive to signals
         try:
-            while not shutdown_in_progress:
-                time.sleep(0.5)  # Check every 500ms
+            if hasattr(signal, 'pause'):
+                # Sleep until a signal arrives instead of polling
+                while not shutdown_event.is_set():
+                    signal.pause()
+            else:
+                # Windows has no signal.pause, and a blocking wait there only
+                # notices Ctrl+C once it returns, so it still wakes periodically
+                while not shutdown_event.wait(0.5):
+                    pass
         except KeyboardInterrupt:
             print("\nKeyboardInterrupt caught in main thread")
             signal_handler(signal.SIGINT, None)
@@ -5985,13 +6569,14 @@ def start_development_server(port=8000, include_drafts=False, include_scheduled=
             
     except ImportError as e:
         print(f"[ERROR] Missing dependencies for development server: {e}")
-        print("Install with: pip install watchdog websockets")
+        print("Install with: pip install watchdog websockets (optional: uvloop)")
     except Exception as e:
         print(f"[ERROR] Failed to start development server: {e}")
 
 def watch_and_rebuild(include_drafts=False, include_scheduled=False):
     """Watch for file changes and rebuild without serving"""
     try:
+        import threading
         import time
         from watchdog.observers import Observer
         from watchdog.events import FileSystemEventHandler
@@ -6001,64 +6586,64 @@ def watch_and_rebuild(include_drafts=False, include_scheduled=False):
         
         class ChangeHandler(FileSystemEventHandler):
             def __init__(self):
-                self.last_rebuild = 0
-                self.rebuild_delay = 1  # Wait 1 second between rebuilds
+                self.rebuild_delay = 0.3  # Quiet period used to coalesce bursts of saves
                 self.include_drafts = include_drafts
                 self.include_scheduled = include_scheduled
+                self._pending = set()
+                self._timer = None
+                self._lock = threading.Lock()
+                self._worker = RebuildWorker(self.rebuild_site)
             
             def on_modified(self, event):
-                if event.is_directory:
-                    return
-                
+                if not event.is_directory:
+                    self._queue(event.src_path)
+            
+            def on_created(self, event):
+                if not event.is_directory:
+                    self._queue(event.src_path)
+            
+            def on_moved(self, event):
+                # Editors (and the studio) save by renaming a temp file over
+                # the original, which only reports a move to the real name
+                if not event.is_directory:
+                    self._queue(event.dest_path)
+            
+            def _queue(self, file_path):
                 # Only rebuild for relevant file changes
-                if self.should_rebuild(event.src_path):
-                    current_time = time.time()
-                    if current_time - self.last_rebuild > self.rebuild_delay:
-                        self.last_rebuild = current_time
-                        self.rebuild_site(event.src_path)
+                if self.should_rebuild(file_path):
+                    # Queue the path and restart the quiet-period timer so that
+                    # every change in a burst is picked up by a single rebuild
+                    with self._lock:
+                        self._pending.add(file_path)
+                        if self._timer:
+                            self._timer.cancel()
+                        self._timer = threading.Timer(self.rebuild_delay, self._flush)
+                        self._timer.daemon = True
+                        self._timer.start()
+            
+            def _flush(self):
+                with self._lock:
+                    changed_paths = self._pending
+                    self._pending = set()
+                    self._timer = None
+                if changed_paths:
+                    self._worker.submit(changed_paths)
             
             def should_rebuild(self, file_path):
                 """Check if file change should trigger rebuild"""
-                file_path = str(file_path).lower()
-                rebuild_extensions = {'.md', '.yaml', '.yml', '.css', '.js', '.html', '.jpg', '.jpeg', '.png', '.webp'}
-                rebuild_dirs = {'content', 'templates', 'static', 'pages'}
-                
-                # Ignore .git folder and its contents (handle both / and \ separators)
-                normalized_path = file_path.replace('/', os.sep).replace('\\', os.sep)
-                path_parts = normalized_path.split(os.sep)
-                if '.git' in path_parts or normalized_path.startswith('.git' + os.sep):
-                    return False
-                
-                # Ignore other system/build directories
-                ignore_patterns = ['__pycache__', '.vscode', 'build']
-                for pattern in ignore_patterns:
-                    if pattern in path_parts:
-                        return False
-                
-                # Check file extension
-                for ext in rebuild_extensions:
-                    if file_path.endswith(ext):
-                        break
-                else:
-                    return False
-                
-                # Check if in relevant directory
-                for dir_name in rebuild_dirs:
-                    if f'{os.sep}{dir_name}{os.sep}' in file_path or file_path.startswith(dir_name):
-                        return True
-                
-                return False
+                return should_rebuild_for_path(str(file_path))
             
-            def rebuild_site(self, changed_file_path):
+            def rebuild_site(self, changed_file_paths):
                 """Rebuild site using incremental rebuilds"""
                 try:
-                    print("File change detected, analyzing...")
-                    
-                    # Determine what needs to be rebuilt
-                    rebuild_info = determine_rebuild_scope(changed_file_path)
+                    print(f"{len(changed_file_paths)} file change(s) detected, analyzing...")
                     
-                    # Perform incremental rebuild
-                    success = perform_incremental_rebuild(rebuild_info, include_drafts=self.include_drafts, include_scheduled=self.include_scheduled)
+                    # Determine what needs to be rebuilt, one pass per distinct scope
+                    success = True
+                    for rebuild_info in coalesce_rebuild_scopes(changed_file_paths):
+                        # Perform incremental rebuild
+                        if not perform_incremental_rebuild(rebuild_info, include_drafts=self.include_drafts, include_scheduled=self.include_scheduled):
+                            success = False
                     
                     if success:
                         print("Rebuild complete")
@@ -6174,14 +6759,19 @@ if __name__ == "__main__":
     if args.stats:
         generate_stats_report()
     
+    # Walk the build directory once when both post-build checks need it
+    build_scan = None
+    if args.check_links and args.check_accessibility and os.path.isdir(BUILD_DIR):
+        build_scan = scan_build_directory(Path(BUILD_DIR).resolve())
+    
     # Check for broken links if requested
     if args.check_links:
-        check_broken_links()
+        check_broken_links(build_scan)
     
     # Check for accessibility issues if requested
     if args.check_accessibility:
         # Load site config for accessibility check
         site_config = load_site_config()
-        check_accessibility_issues(site_config)
+        check_accessibility_issues(site_config, build_scan)
 
 
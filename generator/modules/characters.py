@@ -1,6 +1,8 @@
 """Character/Location index module for loading YAML data and generating index pages."""
 import os
-import yaml
+from collections import defaultdict
+
+from .yaml_cache import load_yaml_file
 
 
 def load_characters(novel_slug, content_dir):
@@ -15,10 +17,7 @@ def load_characters(novel_slug, content_dir):
     if not os.path.exists(chars_path):
         return None
 
-    with open(chars_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
-
-    return data
+    return load_yaml_file(chars_path)
 
 
 def filter_by_spoiler_level(characters_data, max_level=None):
@@ -65,14 +64,10 @@ def group_by_tags(characters_data):
     if not characters_data or not characters_data.get('characters'):
         return {}
 
-    groups = {}
+    groups = defaultdict(list)
     for char in characters_data['characters']:
-        tags = char.get('tags', [])
-        if not tags:
-            tags = ['other']
-        for tag in tags:
-            if tag not in groups:
-                groups[tag] = []
+        for tag in char.get('tags', []) or ['other']:
             groups[tag].append(char)
 
-    return groups
+    # Plain dict so template lookups of missing tags don't insert them
+    return dict(groups)
@@ -1,8 +1,37 @@
 """Glossary module for loading glossary data and auto-linking terms in chapter HTML."""
 import os
 import re
-import yaml
-from bs4 import BeautifulSoup
+from collections import defaultdict
+from functools import lru_cache
+from html import unescape
+
+from bs4 import BeautifulSoup, NavigableString
+
+from .yaml_cache import load_yaml_file
+
+# lxml's C parser is used for auto-linking when installed; BeautifulSoup is the fallback
+try:
+    from lxml import html as lxml_html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# pyahocorasick finds every term in one linear pass when installed; the regex is the fallback
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Hyperscan (SIMD multi-literal matcher) is preferred over both when installed
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# Text anywhere inside these elements is never auto-linked; their subtrees are not walked
+SKIP_TAGS = frozenset({'a', 'code', 'pre', 'script', 'style'})
 
 
 def load_glossary(novel_slug, content_dir, language='en'):
@@ -28,40 +57,51 @@ def load_glossary(novel_slug, content_dir, language='en'):
     if not glossary_path:
         return None
 
-    with open(glossary_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
+    return load_yaml_file(glossary_path)
 
-    return data
 
+def _glossary_key(glossary_data):
+    """Hashable snapshot of the fields the matcher is built from."""
+    return tuple(
+        (entry.get('term', ''), entry.get('definition', ''), tuple(entry.get('aliases', []) or ()))
+        for entry in glossary_data['terms']
+    )
 
-def auto_link_terms(html_content, glossary_data):
-    """Post-process HTML to wrap matching glossary terms with tooltip spans.
 
-    Args:
-        html_content: HTML string of chapter content
-        glossary_data: Glossary dict with 'terms' list
+@lru_cache(maxsize=32)
+def _build_glossary_matcher(glossary_key):
+    """Build the term lookup and term finder for a glossary.
+
+    Cached on the glossary contents, so every chapter of a novel reuses the
+    same compiled pattern instead of re-sorting and recompiling the terms.
 
     Returns:
-        Modified HTML string with terms wrapped in <span class="glossary-linked-term">
+        (term_lookup, find_terms) tuple, or None if the glossary has no terms.
+        find_terms(text) yields the (start, end) span of each whole-word,
+        case-insensitive, non-overlapping term match, longest term first.
     """
-    if not glossary_data or not glossary_data.get('terms'):
-        return html_content
-
-    soup = BeautifulSoup(html_content, 'html.parser')
-
     # Build lookup: term -> definition (including aliases)
     term_lookup = {}
-    for term_entry in glossary_data['terms']:
-        term = term_entry.get('term', '')
-        definition = term_entry.get('definition', '')
+    for term, definition, aliases in glossary_key:
+        # One entry per term, shared by its aliases; the span attributes are
+        # prepared here once rather than for every match in every chapter
+        info = {
+            'term': str(term),
+            'definition': '' if definition is None else str(definition),
+        }
+        info['attrs'] = {
+            'class': 'glossary-linked-term',
+            'data-term': info['term'],
+            'data-definition': info['definition'],
+        }
         if term:
-            term_lookup[term.lower()] = {'term': term, 'definition': definition}
-        for alias in term_entry.get('aliases', []):
+            term_lookup[term.lower()] = info
+        for alias in aliases:
             if alias:
-                term_lookup[alias.lower()] = {'term': term, 'definition': definition}
+                term_lookup[alias.lower()] = info
 
     if not term_lookup:
-        return html_content
+        return None
 
     # Sort by length descending to match longer terms first
     sorted_terms = sorted(term_lookup.keys(), key=len, reverse=True)
@@ -70,43 +110,253 @@ def auto_link_terms(html_content, glossary_data):
     escaped = [re.escape(t) for t in sorted_terms]
     pattern = re.compile(r'\b(' + '|'.join(escaped) + r')\b', re.IGNORECASE)
 
+    def find_terms(text):
+        return (match.span() for match in pattern.finditer(text))
+
+    if AHOCORASICK_AVAILABLE:
+        find_terms = _automaton_term_finder(sorted_terms, find_terms)
+    if HYPERSCAN_AVAILABLE:
+        find_terms = _hyperscan_term_finder(sorted_terms, find_terms) or find_terms
+    return term_lookup, find_terms
+
+
+def _is_word_char(char):
+    return char.isalnum() or char == '_'
+
+
+def _at_word_boundary(text, pos):
+    """Same test as the regex \\b assertion at pos."""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
+
+def _automaton_term_finder(terms, regex_find_terms):
+    """Aho-Corasick term finder with the same matches as the regex alternation."""
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term, len(term))
+    automaton.make_automaton()
+
+    def find_terms(text):
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Lowercasing changed the offsets (e.g. 'İ'), so spans would not line up
+            return regex_find_terms(text)
+        return _leftmost_longest_spans(text, (
+            (end - length + 1, length) for end, length in automaton.iter(lowered)
+        ))
+
+    return find_terms
+
+
+def _hyperscan_term_finder(terms, fallback_find_terms):
+    """Hyperscan term finder for ASCII glossaries; None if the terms can't be compiled.
+
+    Offsets are reported in bytes, so only ASCII text (where bytes and characters
+    line up) is scanned here; anything else goes to fallback_find_terms.
+    """
+    if not all(term.isascii() for term in terms):
+        return None
+    lengths = [len(term) for term in terms]
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=[re.escape(term).encode('ascii') for term in terms],
+            ids=list(range(len(terms))),
+            elements=len(terms),
+            flags=[hyperscan.HS_FLAG_CASELESS] * len(terms),
+        )
+    except hyperscan.error:
+        return None
+
+    def find_terms(text):
+        if not text.isascii():
+            return fallback_find_terms(text)
+        candidates = []
+
+        def on_match(term_id, start, end, flags, context):
+            candidates.append((end - lengths[term_id], lengths[term_id]))
+
+        database.scan(text.encode('ascii'), match_event_handler=on_match)
+        return _leftmost_longest_spans(text, candidates)
+
+    return find_terms
+
+
+def _leftmost_longest_spans(text, candidates):
+    """Reduce (start, length) term occurrences to the spans the regex alternation finds."""
+    # Longest whole-word match starting at each position
+    longest = {}
+    for start, length in candidates:
+        if (length > longest.get(start, 0)
+                and _at_word_boundary(text, start) and _at_word_boundary(text, start + length)):
+            longest[start] = length
+
+    # Leftmost non-overlapping matches, as re.finditer would return them
+    pos = 0
+    for start in sorted(longest):
+        if start >= pos:
+            pos = start + longest[start]
+            yield start, pos
+
+
+def _split_linked_terms(text, term_lookup, find_terms, linked_terms):
+    """Split text around the first occurrence of each not-yet-linked term.
+
+    Returns:
+        Alternating list [text, (matched_text, info), text, ...], or None if
+        nothing in the text needs linking
+    """
+    pieces = []
+    pos = 0
+    for start, end in find_terms(text):
+        matched_text = text[start:end]
+        key = matched_text.lower()
+        if key in linked_terms or key not in term_lookup:
+            continue
+        linked_terms.add(key)
+        pieces.append(text[pos:start])
+        pieces.append((matched_text, term_lookup[key]))
+        pos = end
+
+    if not pieces:
+        return None
+    pieces.append(text[pos:])
+    return pieces
+
+
+def _skip_lxml_element(element):
+    if element.tag in SKIP_TAGS:
+        return True
+    return element.tag == 'span' and 'glossary-linked-term' in element.get('class', '').split()
+
+
+def _lxml_text_slots(element):
+    """Yield (node, is_tail) for each text slot under element, pruning skipped subtrees.
+
+    (node, False) is node.text; (node, True) is node.tail, which belongs to
+    node's parent.
+    """
+    yield element, False
+    for child in element:
+        # Comments and processing instructions have no tag name; only their tail is text
+        if isinstance(child.tag, str) and not _skip_lxml_element(child):
+            yield from _lxml_text_slots(child)
+        yield child, True
+
+
+def _iter_soup_text_nodes(element):
+    """Yield the text nodes under a BeautifulSoup element, pruning skipped subtrees."""
+    for child in element.children:
+        if isinstance(child, NavigableString):
+            # Comments, CDATA and other special strings are not prose
+            if type(child) is NavigableString:
+                yield child
+        elif child.name in SKIP_TAGS:
+            continue
+        elif child.name == 'span' and 'glossary-linked-term' in child.get('class', []):
+            continue
+        else:
+            yield from _iter_soup_text_nodes(child)
+
+
+def _make_lxml_spans(root, pieces):
+    """Build glossary spans for split pieces; each span's tail is the text that follows it."""
+    spans = []
+    for i in range(1, len(pieces), 2):
+        matched_text, info = pieces[i]
+        span = root.makeelement('span', info['attrs'])
+        span.text = matched_text
+        span.tail = pieces[i + 1]
+        spans.append(span)
+    return spans
+
+
+def _auto_link_terms_lxml(html_content, term_lookup, find_terms):
+    """lxml implementation of auto_link_terms: one parse, text/tail edited in place."""
+    root = lxml_html.fragment_fromstring(html_content, create_parent='div')
+    linked_terms = set()
+
+    for element in root.iter('p', 'li', 'td', 'dd'):
+        # Snapshot the slots so inserted spans are not walked again
+        for node, is_tail in list(_lxml_text_slots(element)):
+            text = node.tail if is_tail else node.text
+            if not text:
+                continue
+            pieces = _split_linked_terms(text, term_lookup, find_terms, linked_terms)
+            if not pieces:
+                continue
+
+            spans = _make_lxml_spans(root, pieces)
+            if is_tail:
+                node.tail = pieces[0]
+                parent = node.getparent()
+                index = parent.index(node)
+                for i, span in enumerate(spans, start=1):
+                    parent.insert(index + i, span)
+            else:
+                node.text = pieces[0]
+                for i, span in enumerate(spans):
+                    node.insert(i, span)
+
+    # Strip the <div> wrapper added by create_parent
+    return lxml_html.tostring(root, encoding='unicode')[5:-6]
+
+
+def auto_link_terms(html_content, glossary_data):
+    """Post-process HTML to wrap matching glossary terms with tooltip spans.
+
+    Args:
+        html_content: HTML string of chapter content
+        glossary_data: Glossary dict with 'terms' list
+
+    Returns:
+        Modified HTML string with terms wrapped in <span class="glossary-linked-term">
+    """
+    if not glossary_data or not glossary_data.get('terms'):
+        return html_content
+
+    matcher = _build_glossary_matcher(_glossary_key(glossary_data))
+    if matcher is None:
+        return html_content
+    term_lookup, find_terms = matcher
+
+    # Most chapters mention no glossary term at all; one scan of the raw HTML
+    # is far cheaper than building and walking a tree to find that out.
+    # Unescaped so terms like "Q&A" match their escaped form (Q&amp;A)
+    if next(find_terms(unescape(html_content)), None) is None:
+        return html_content
+
+    if LXML_AVAILABLE:
+        return _auto_link_terms_lxml(html_content, term_lookup, find_terms)
+
+    soup = BeautifulSoup(html_content, 'html.parser')
+
     # Track which terms have been linked (only link first occurrence)
     linked_terms = set()
 
     # Process text nodes in <p>, <li>, <td> elements (skip headings, code, etc.)
     for element in soup.find_all(['p', 'li', 'td', 'dd']):
-        for text_node in element.find_all(string=True):
-            # Skip if inside a link, code, or already glossary-linked
-            parent = text_node.parent
-            if parent.name in ('a', 'code', 'pre', 'script', 'style', 'span'):
-                if parent.get('class') and 'glossary-linked-term' in parent.get('class', []):
-                    continue
-                if parent.name in ('a', 'code', 'pre', 'script', 'style'):
-                    continue
+        # Links, code and already glossary-linked spans are pruned from the walk
+        for text_node in list(_iter_soup_text_nodes(element)):
+            pieces = _split_linked_terms(str(text_node), term_lookup, find_terms, linked_terms)
+            if not pieces:
+                continue
 
-            original = str(text_node)
-            modified = original
-
-            def replace_term(match):
-                matched_text = match.group(0)
-                key = matched_text.lower()
-                if key in linked_terms:
-                    return matched_text
-                if key not in term_lookup:
-                    return matched_text
-                linked_terms.add(key)
-                info = term_lookup[key]
-                escaped_def = info['definition'].replace('"', '&quot;').replace("'", '&#39;')
-                return (f'<span class="glossary-linked-term" '
-                        f'data-term="{info["term"]}" '
-                        f'data-definition="{escaped_def}">'
-                        f'{matched_text}</span>')
-
-            modified = pattern.sub(replace_term, modified)
-
-            if modified != original:
-                new_content = BeautifulSoup(modified, 'html.parser')
-                text_node.replace_with(new_content)
+            # Build the replacement nodes directly; the serializer escapes attributes
+            new_nodes = []
+            for i, piece in enumerate(pieces):
+                if i % 2 == 0:
+                    if piece:
+                        new_nodes.append(NavigableString(piece))
+                    continue
+                matched_text, info = piece
+                # Copied: BeautifulSoup may rewrite multi-valued attributes in place
+                span = soup.new_tag('span', attrs=dict(info['attrs']))
+                span.string = matched_text
+                new_nodes.append(span)
+            text_node.replace_with(*new_nodes)
 
     return str(soup)
 
@@ -120,15 +370,13 @@ def group_terms_by_category(glossary_data):
     if not glossary_data or not glossary_data.get('terms'):
         return {}
 
-    groups = {}
+    groups = defaultdict(list)
     for term in glossary_data['terms']:
-        category = term.get('category', 'general')
-        if category not in groups:
-            groups[category] = []
-        groups[category].append(term)
+        groups[term.get('category', 'general')].append(term)
 
-    # Sort each group by term name
-    for category in groups:
-        groups[category].sort(key=lambda t: t.get('term', '').lower())
+    # Sort each group by term name (key= lowers each name once, not per comparison)
+    for terms in groups.values():
+        terms.sort(key=lambda t: t.get('term', '').lower())
 
-    return groups
+    # Plain dict so template lookups of missing categories don't insert them
+    return dict(groups)
@@ -5,101 +5,276 @@ Generates a JSON search index of all published chapters for client-side full-tex
 import os
 import json
 import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from itertools import chain
 from html import unescape
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-def strip_html(html_text):
-    """Remove HTML tags and decode entities."""
-    text = re.sub(r'<[^>]+>', ' ', html_text)
+# Only real tags; a bare '<' or '>' in prose ("I <3 you", "x < 5") is text
+_TAG_RE = re.compile(r'</?[A-Za-z][^<>\n]*>')
+_WS_RE = re.compile(r'\s+')
+
+# Front matter keys that exclude a chapter from the index when set
+_SKIP_KEYS = frozenset(('password', 'hidden'))
+
+# Version of the excerpt text format; bump it whenever _md_to_text's output
+# changes so cached excerpts from older builds are discarded
+EXCERPT_CACHE_VERSION = 2
+
+# Below this many (chapter, language) pairs, process start-up costs more than it saves
+PARALLEL_INDEX_MIN_TASKS = 64
+
+# Markdown syntax to drop or unwrap when building a plain-text excerpt,
+# applied in order. Roughly what rendering and then stripping tags would leave
+_MD_TEXT_RULES = (
+    (re.compile(r'^(`{3,}|~{3,})[^\n]*\n.*?^\1[ \t]*$', re.M | re.S), ' '),  # fenced code
+    (re.compile(r'`+([^`\n]+?)`+'), r'\1'),                                 # inline code
+    (re.compile(r'!\[[^\]]*\]\([^)]*\)'), ' '),                             # images
+    (re.compile(r'\[\^[^\]]+\]:?'), ' '),                                    # footnote refs
+    (re.compile(r'\[([^\]]*)\](?:\([^)]*\)|\[[^\]]*\])'), r'\1'),           # links
+    (re.compile(r'\{:?[^}\n]*\}'), ' '),                                     # attr_list
+    (re.compile(r'^[ \t]*\|?[ \t]*:?-{3,}:?[ \t]*(?:\|[ \t]*:?-{3,}:?[ \t]*)*\|?[ \t]*$', re.M), ' '),  # table rules
+    (re.compile(r'^[ \t]*(?:[-*_][ \t]*){3,}$', re.M), ' '),                # horizontal rules
+    (re.compile(r'^[ \t]{0,3}(?:#{1,6}|>+|[-*+]|\d+[.)])[ \t]+', re.M), ''),  # block markers
+    (re.compile(r'(\*{1,3}|~~)(?=\S)(.+?)(?<=\S)\1'), r'\2'),               # emphasis
+    (re.compile(r'(?<!\w)(_{1,3})(?=\S)(.+?)(?<=\S)\1(?!\w)'), r'\2'),
+    (_TAG_RE, ' '),
+    (re.compile(r'\|'), ' '),
+)
+
+
+def _md_to_text(md_content, max_chars=None):
+    """Reduce markdown to plain text without running the full markdown pipeline.
+
+    When ``max_chars`` is given, only the head of the source is processed
+    (markup can take several source characters per character of text), and
+    the result is cut with some slack before the whitespace pass, so long
+    chapters don't pay for text that gets truncated anyway.
+    """
+    text = md_content if max_chars is None else md_content[:max_chars * 4]
+    for pattern, replacement in _MD_TEXT_RULES:
+        text = pattern.sub(replacement, text)
     text = unescape(text)
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
+    if max_chars is not None:
+        text = text[:max_chars * 2]
+    return _WS_RE.sub(' ', text).strip()
+
+
+def _encode_entry(entry):
+    """Serialize one index entry compactly, with orjson when it's installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(entry).decode('utf-8')
+    return json.dumps(entry, ensure_ascii=False, separators=(',', ':'))
+
+
+def _chapter_source_path(content_dir, novel_slug, chapter_id, lang):
+    """Return the markdown file a chapter is loaded from, or None if there isn't one.
+
+    Mirrors the generator's lookup: the language folder first, then the
+    root chapters folder.
+    """
+    chapters_dir = os.path.join(content_dir, novel_slug, 'chapters')
+    for path in (os.path.join(chapters_dir, lang, f'{chapter_id}.md'),
+                 os.path.join(chapters_dir, f'{chapter_id}.md')):
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def load_excerpt_cache(cache_file, max_excerpt_chars):
+    """Load cached excerpts as {entry id: [mtime_ns, size, text]}.
+
+    The cache is dropped when it was built for a different excerpt length
+    or by a different version of the excerpt extraction.
+    """
+    if not cache_file:
+        return {}
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+        if (payload.get('version') != EXCERPT_CACHE_VERSION
+                or payload.get('max_excerpt_chars') != max_excerpt_chars):
+            return {}
+        return payload.get('excerpts', {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def persist_excerpt_cache(cache_file, max_excerpt_chars, excerpts):
+    """Write the excerpt cache atomically so an interrupted build can't corrupt it."""
+    if not cache_file:
+        return
+    tmp_file = f'{cache_file}.tmp'
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'version': EXCERPT_CACHE_VERSION,
+                       'max_excerpt_chars': max_excerpt_chars,
+                       'excerpts': excerpts},
+                      f, ensure_ascii=False)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"[WARNING] Could not write search excerpt cache: {e}")
+
+
+def _index_chapter(task):
+    """Build the search index entry for one chapter in one language.
+
+    Returns (entry, cache_record); entry is None when the chapter is excluded
+    and cache_record is None when there is no source file to key it on.
+    Module-level so ProcessPoolExecutor can pickle it; ``task`` carries the
+    loader and skip functions, which therefore have to be module-level too.
+    """
+    (novel_slug, novel_title, lang, chapter, content_dir, cached,
+     load_chapter_content_fn, should_skip_fn,
+     include_drafts, include_scheduled, max_excerpt_chars) = task
+    chapter_id = chapter.get('id', '')
+    try:
+        md_content, metadata = load_chapter_content_fn(novel_slug, chapter_id, lang)
+    except Exception:
+        return None, None
+
+    # Skip password-protected and hidden chapters; the isdisjoint test settles
+    # the common case where neither key is present without any lookups
+    if not metadata.keys().isdisjoint(_SKIP_KEYS) and (metadata.get('password') or metadata.get('hidden')):
+        return None, None
+
+    # Metadata is always re-checked: scheduled chapters go live without their file changing
+    if should_skip_fn(metadata, include_drafts, include_scheduled):
+        return None, None
+
+    chapter_title = metadata.get('title', chapter.get('title', chapter_id))
+    tags = metadata.get('tags', []) or []
+    published = str(metadata.get('published', ''))
+
+    cache_record = None
+    source_path = _chapter_source_path(content_dir, novel_slug, chapter_id, lang)
+    if source_path is not None:
+        try:
+            st = os.stat(source_path)
+            cache_record = [st.st_mtime_ns, st.st_size, None]
+        except OSError:
+            pass
+
+    if cached and cache_record and cached[:2] == cache_record[:2]:
+        excerpt = cached[2]
+    else:
+        # Plain text straight from the markdown; rendering it to HTML
+        # only to strip the tags again costs more than the excerpt is worth
+        excerpt = _md_to_text(md_content, max_excerpt_chars)[:max_excerpt_chars]
+    if cache_record:
+        cache_record[2] = excerpt
+
+    entry = {
+        'id': f'{novel_slug}/{lang}/{chapter_id}',
+        'title': chapter_title,
+        'story': novel_title,
+        'storySlug': novel_slug,
+        'language': lang,
+        'tags': tags,
+        'published': published,
+        'url': f'{novel_slug}/{lang}/{chapter_id}/',
+        'text': excerpt,
+    }
+    return entry, cache_record
 
 
 def generate_search_index(all_novels_data, content_dir, load_chapter_content_fn,
-                          should_skip_fn, convert_md_fn,
-                          include_drafts=False, include_scheduled=False,
-                          max_excerpt_chars=2000):
+                          should_skip_fn, include_drafts=False, include_scheduled=False,
+                          max_excerpt_chars=2000, cache_file=None, out_fp=None,
+                          list_chapter_languages_fn=None):
     """Generate search_index.json for client-side search.
 
+    Larger sites are indexed across CPU cores; entries keep the order of the
+    novels, chapters and languages either way. With ``cache_file``, excerpts
+    of chapters whose source file is unchanged (same mtime and size) are
+    reused from the previous build. With ``out_fp``, entries are written to
+    it as a JSON array as they are produced instead of being collected.
+
     Args:
         all_novels_data: List of novel data dicts (with slug, title, arcs, etc.)
         content_dir: Path to content directory
-        load_chapter_content_fn: Function(novel_slug, chapter_id, lang) -> (md, metadata)
-        should_skip_fn: Function(metadata, include_drafts, include_scheduled) -> bool
-        convert_md_fn: Function(markdown_str) -> html_str
+        load_chapter_content_fn: Function(novel_slug, chapter_id, lang) -> (md, metadata).
+            Must be picklable (module-level) for the parallel path.
+        should_skip_fn: Function(metadata, include_drafts, include_scheduled) -> bool.
+            Must be picklable (module-level) for the parallel path.
         include_drafts: Whether to include draft chapters
         include_scheduled: Whether to include scheduled chapters
         max_excerpt_chars: Max characters for text excerpt
+        cache_file: Optional path of the JSON excerpt cache
+        out_fp: Optional text file to stream the index into
+        list_chapter_languages_fn: Optional Function(novel_slug, chapter_id) -> languages
+            with a translation file. When given, other languages are only
+            indexed where a translation exists (the primary language always is).
 
     Returns:
-        List of search index entries (dicts)
+        List of search index entries (dicts), or the number of entries
+        written when ``out_fp`` is given
     """
-    index = []
+    cached_excerpts = load_excerpt_cache(cache_file, max_excerpt_chars)
+    tasks = []
 
     for novel in all_novels_data:
         novel_slug = novel.get('slug', '')
         novel_title = novel.get('title', '')
         primary_lang = novel.get('primary_language', 'en')
 
-        # Determine available languages
-        languages = [primary_lang]
+        # Determine available languages (primary first, no duplicates)
         lang_config = novel.get('languages', {})
         if isinstance(lang_config, dict):
-            for lang in lang_config:
-                if lang != primary_lang:
-                    languages.append(lang)
-
-        all_chapters = []
-        for arc in novel.get('arcs', []):
-            all_chapters.extend(arc.get('chapters', []))
+            languages = tuple(dict.fromkeys([primary_lang, *lang_config]))
+        else:
+            languages = (primary_lang,)
 
+        all_chapters = chain.from_iterable(arc.get('chapters', []) for arc in novel.get('arcs', []))
         for chapter in all_chapters:
             chapter_id = chapter.get('id', '')
+            chapter_languages = languages
+            if list_chapter_languages_fn is not None and len(languages) > 1:
+                translated = set(list_chapter_languages_fn(novel_slug, chapter_id))
+                chapter_languages = [lang for lang in languages
+                                     if lang == primary_lang or lang in translated]
+            for lang in chapter_languages:
+                cached = cached_excerpts.get(f'{novel_slug}/{lang}/{chapter_id}')
+                tasks.append((novel_slug, novel_title, lang, chapter, content_dir, cached,
+                              load_chapter_content_fn, should_skip_fn,
+                              include_drafts, include_scheduled, max_excerpt_chars))
 
-            for lang in languages:
-                try:
-                    md_content, metadata = load_chapter_content_fn(novel_slug, chapter_id, lang)
-                except Exception:
-                    continue
-
-                if should_skip_fn(metadata, include_drafts, include_scheduled):
-                    continue
-
-                # Skip password-protected chapters
-                if metadata.get('password'):
-                    continue
-
-                # Skip hidden chapters
-                if metadata.get('hidden'):
-                    continue
-
-                chapter_title = metadata.get('title', chapter.get('title', chapter_id))
-                tags = metadata.get('tags', []) or []
-                published = str(metadata.get('published', ''))
-
-                # Convert markdown to HTML, then strip to plain text
-                try:
-                    html_content = convert_md_fn(md_content)
-                    text_content = strip_html(html_content)
-                except Exception:
-                    text_content = strip_html(md_content)
-
-                # Truncate excerpt
-                excerpt = text_content[:max_excerpt_chars]
-
-                entry = {
-                    'id': f'{novel_slug}/{lang}/{chapter_id}',
-                    'title': chapter_title,
-                    'story': novel_title,
-                    'storySlug': novel_slug,
-                    'language': lang,
-                    'tags': tags,
-                    'published': published,
-                    'url': f'{novel_slug}/{lang}/{chapter_id}/',
-                    'text': excerpt,
-                }
+    index = []
+    count = 0
+    excerpts = {}
+    if out_fp is not None:
+        out_fp.write('[')
+    with ExitStack() as stack:
+        if len(tasks) < PARALLEL_INDEX_MIN_TASKS:
+            results = map(_index_chapter, tasks)
+        else:
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=os.cpu_count()))
+            results = executor.map(_index_chapter, tasks, chunksize=16)
 
+        for entry, cache_record in results:
+            if entry is None:
+                continue
+            if out_fp is None:
                 index.append(entry)
+            else:
+                # Framed as a JSON array, one entry in memory at a time
+                if count:
+                    out_fp.write(',')
+                out_fp.write(_encode_entry(entry))
+            count += 1
+            if cache_record:
+                excerpts[entry['id']] = cache_record
+
+    if cache_file and excerpts != cached_excerpts:
+        persist_excerpt_cache(cache_file, max_excerpt_chars, excerpts)
 
+    if out_fp is not None:
+        out_fp.write(']')
+        return count
     return index
@@ -0,0 +1,37 @@
+"""Memoized YAML loading for per-story data files (glossary, characters)."""
+import os
+
+import yaml
+
+# libyaml's C loader when PyYAML was built with it; same safe semantics either way
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Parsed files keyed on path; each entry is (mtime_ns, size, data) so edits are re-read
+_YAML_CACHE = {}
+
+
+def load_yaml_file(path):
+    """Parse a YAML file, reusing the previous result while its mtime and size are unchanged.
+
+    The returned data is shared between callers and must not be mutated.
+
+    Returns:
+        Parsed YAML data, or None if the file does not exist
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    cached = _YAML_CACHE.get(path)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.load(f, Loader=_Loader)
+
+    _YAML_CACHE[path] = (stat.st_mtime_ns, stat.st_size, data)
+    return data
@@ -2,31 +2,71 @@
 (function() {
     'use strict';
 
-    function sha256(str) {
-        var msgBuffer = new TextEncoder().encode(str);
-        return crypto.subtle.digest('SHA-256', msgBuffer).then(function(hashBuffer) {
-            var hashArray = Array.from(new Uint8Array(hashBuffer));
-            return hashArray.map(function(b) { return b.toString(16).padStart(2, '0'); }).join('');
+    // Must match PASSWORD_KDF_ITERATIONS in generate.py
+    var KDF_ITERATIONS = 200000;
+
+    function toHex(buffer) {
+        return Array.from(new Uint8Array(buffer)).map(function(b) { return b.toString(16).padStart(2, '0'); }).join('');
+    }
+
+    function hmacSha256(keyBytes, label) {
+        return crypto.subtle.importKey('raw', keyBytes, { name: 'HMAC', hash: 'SHA-256' }, false, ['sign']).then(function(key) {
+            return crypto.subtle.sign('HMAC', key, new TextEncoder().encode(label));
         });
     }
 
-    function xorDecrypt(encryptedBase64, password) {
-        return sha256(password).then(function(hashHex) {
-            var key = new Uint8Array(hashHex.match(/.{1,2}/g).map(function(byte) { return parseInt(byte, 16); }));
-            var encrypted = Uint8Array.from(atob(encryptedBase64), function(c) { return c.charCodeAt(0); });
+    // Payloads are "aes-ctr-v2:" + base64(salt + counter block + ciphertext) or
+    // "xor-v2:" + base64(salt + ciphertext); the salt is always the first 16 bytes
+    function parsePayload(encryptedContent) {
+        var scheme = encryptedContent.slice(0, encryptedContent.indexOf(':'));
+        var bytes = Uint8Array.from(atob(encryptedContent.slice(scheme.length + 1)), function(c) { return c.charCodeAt(0); });
+        return { scheme: scheme, salt: bytes.slice(0, 16), body: bytes.slice(16) };
+    }
 
-            var decrypted = new Uint8Array(encrypted.length);
-            for (var i = 0; i < encrypted.length; i++) {
-                decrypted[i] = encrypted[i] ^ key[i % key.length];
-            }
+    // Same derivation as derive_password_keys in generate.py: PBKDF2 master key,
+    // then HMAC with separate labels for the encryption key and the verification hash
+    function deriveKeys(password, salt) {
+        return crypto.subtle.importKey('raw', new TextEncoder().encode(password), 'PBKDF2', false, ['deriveBits']).then(function(baseKey) {
+            return crypto.subtle.deriveBits({ name: 'PBKDF2', salt: salt, iterations: KDF_ITERATIONS, hash: 'SHA-256' }, baseKey, 256);
+        }).then(function(masterKey) {
+            return Promise.all([
+                hmacSha256(masterKey, 'wngen chapter encryption'),
+                hmacSha256(masterKey, 'wngen chapter verification')
+            ]);
+        }).then(function(keys) {
+            return { encryptionKey: new Uint8Array(keys[0]), verificationHash: toHex(keys[1]).substring(0, 32) };
+        });
+    }
+
+    function aesCtrDecrypt(body, key) {
+        return crypto.subtle.importKey('raw', key, { name: 'AES-CTR' }, false, ['decrypt']).then(function(aesKey) {
+            return crypto.subtle.decrypt({ name: 'AES-CTR', counter: body.slice(0, 16), length: 128 }, aesKey, body.slice(16));
+        });
+    }
 
-            return new TextDecoder().decode(decrypted);
+    // Keystream blocks are SHA-256(key + 32-bit big-endian block counter)
+    function xorDecrypt(body, key) {
+        var digests = [];
+        for (var i = 0; i * 32 < body.length; i++) {
+            var block = new Uint8Array(key.length + 4);
+            block.set(key);
+            new DataView(block.buffer).setUint32(key.length, i);
+            digests.push(crypto.subtle.digest('SHA-256', block));
+        }
+        return Promise.all(digests).then(function(blocks) {
+            var keystream = blocks.map(function(block) { return new Uint8Array(block); });
+            var decrypted = new Uint8Array(body.length);
+            for (var j = 0; j < body.length; j++) {
+                decrypted[j] = body[j] ^ keystream[j >> 5][j & 31];
+            }
+            return decrypted;
         });
     }
 
-    function verifyPassword(password, passwordHash) {
-        return sha256(password).then(function(hash) {
-            return hash.substring(0, 16) === passwordHash;
+    function decryptContent(payload, key) {
+        var decrypted = payload.scheme === 'aes-ctr-v2' ? aesCtrDecrypt(payload.body, key) : xorDecrypt(payload.body, key);
+        return decrypted.then(function(bytes) {
+            return new TextDecoder().decode(bytes);
         });
     }
 
@@ -52,11 +92,12 @@
         errorMsg.style.display = 'none';
         loadingMsg.style.display = 'block';
 
-        verifyPassword(password, passwordHash).then(function(isValid) {
+        var payload = parsePayload(encryptedContent);
+        deriveKeys(password, payload.salt).then(function(keys) {
             loadingMsg.style.display = 'none';
 
-            if (isValid) {
-                xorDecrypt(encryptedContent, password).then(function(decryptedContent) {
+            if (keys.verificationHash === passwordHash) {
+                decryptContent(payload, keys.encryptionKey).then(function(decryptedContent) {
                     document.getElementById('chapter-content-wrapper').innerHTML = decryptedContent;
                     document.getElementById('password-protection-form').style.display = 'none';
 
@@ -5,26 +5,42 @@ Launch with:  python gradio_studio.py [--port PORT] [--share]
 import argparse
 import os
 import sys
-import secrets
+import time
+from collections import OrderedDict
 
 # Add studio and generator to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'studio'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'generator'))
 
-import gradio as gr
-import yaml
 
-from panels import (
-    list_stories, list_chapters,
-    load_site_config, save_site_config,
-    load_story_config, save_story_config,
-    load_authors_config, save_authors_config,
-    get_content_dir, get_generator_dir,
-)
-from editor import load_chapter, save_chapter, preview_markdown
-from builder import run_build, run_preview_server
+def import_ui_modules():
+    """Import gradio, yaml and the studio modules into this module's namespace.
 
+    Deferred until the UI is built so `--help`, argument errors and the
+    auth check don't pay for importing gradio.
+    """
+    global gr, yaml
+    global list_stories, list_chapters, load_site_config, save_site_config
+    global load_story_config, save_story_config, load_authors_config, save_authors_config
+    global get_content_dir, get_generator_dir
+    global load_chapter, save_chapter, preview_markdown, run_build, run_preview_server
 
+    import gradio as gr
+    import yaml
+
+    from panels import (
+        list_stories, list_chapters,
+        load_site_config, save_site_config,
+        load_story_config, save_story_config,
+        load_authors_config, save_authors_config,
+        get_content_dir, get_generator_dir,
+    )
+    from editor import load_chapter, save_chapter, preview_markdown
+    from builder import run_build, run_preview_server
+
+
+# Well-known sample passwords that must not be used for a real deployment
+_PLACEHOLDER_PASSWORDS = frozenset({'changeme123'})
 
 
 def resolve_auth_credentials():
@@ -40,7 +56,7 @@ def resolve_auth_credentials():
     if len(password) < 8:
         raise ValueError('WNSG_STUDIO_PASSWORD must be at least 8 characters long.')
 
-    if secrets.compare_digest(password.lower(), 'changeme123'):
+    if password.lower() in _PLACEHOLDER_PASSWORDS:
         raise ValueError('WNSG_STUDIO_PASSWORD must not use the default placeholder value.')
 
     return [(user, password)]
@@ -49,9 +65,48 @@ def resolve_auth_credentials():
 # Helpers
 # ------------------------------------------------------------------
 
+# Every tab builds its story dropdown at startup, so share one content scan
+# between them for a few seconds; explicit refreshes and saves bust it.
+STORIES_CACHE_TTL = 5.0
+_stories_cache = {'t': 0.0, 'v': None}
+
+
+def cached_stories():
+    """Return list_stories(), rescanning at most once per STORIES_CACHE_TTL."""
+    now = time.monotonic()
+    if _stories_cache['v'] is None or now - _stories_cache['t'] > STORIES_CACHE_TTL:
+        _stories_cache['v'] = list_stories()
+        _stories_cache['t'] = now
+    return _stories_cache['v']
+
+
+def invalidate_stories_cache():
+    """Force the next cached_stories() call to rescan the content directory."""
+    _stories_cache['v'] = None
+
+
+# Recent preview renders keyed on the markdown text; change events re-send
+# unchanged text (caret moves, undo/redo) and the converter dominates latency
+PREVIEW_CACHE_SIZE = 16
+_preview_cache = OrderedDict()
+
+
+def cached_preview(md_text):
+    """Return preview_markdown(md_text), reusing one of the last few renders."""
+    html = _preview_cache.get(md_text)
+    if html is not None:
+        _preview_cache.move_to_end(md_text)
+        return html
+    html = preview_markdown(md_text)
+    _preview_cache[md_text] = html
+    if len(_preview_cache) > PREVIEW_CACHE_SIZE:
+        _preview_cache.popitem(last=False)
+    return html
+
+
 def stories_dropdown_choices():
     """Return list of (display, slug) tuples for story dropdown."""
-    return [(s['title'], s['slug']) for s in list_stories()]
+    return [(s['title'], s['slug']) for s in cached_stories()]
 
 
 def chapters_dropdown_choices(story_slug, language='en'):
@@ -64,20 +119,18 @@ def chapters_dropdown_choices(story_slug, language='en'):
 
 def stories_table_data(status_filter='all'):
     """Return stories as list of lists for Dataframe display."""
-    stories = list_stories()
-    if status_filter and status_filter != 'all':
-        stories = [s for s in stories if s['status'] == status_filter]
-    return [[s['title'], s['slug'], s['status'], s['description'][:80]] for s in stories]
+    show_all = not status_filter or status_filter == 'all'
+    return [[s['title'], s['slug'], s['status'], s['description'][:80]]
+            for s in cached_stories() if show_all or s['status'] == status_filter]
 
 
 def chapters_table_data(story_slug, status_filter='all', language='en'):
     """Return chapters as list of lists for Dataframe display."""
     if not story_slug:
         return []
-    chs = list_chapters(story_slug, language)
-    if status_filter and status_filter != 'all':
-        chs = [c for c in chs if c['status'] == status_filter]
-    return [[c['id'], c['title'], c['status'], c['published'], ', '.join(c['tags'])] for c in chs]
+    show_all = not status_filter or status_filter == 'all'
+    return [[c['id'], c['title'], c['status'], c['published'], ', '.join(c['tags']) if c['tags'] else '']
+            for c in list_chapters(story_slug, language) if show_all or c['status'] == status_filter]
 
 
 # ------------------------------------------------------------------
@@ -122,10 +175,14 @@ def build_stories_tab():
         def refresh_stories(sf):
             return stories_table_data(sf)
 
+        def reload_stories(sf):
+            invalidate_stories_cache()
+            return stories_table_data(sf)
+
         def refresh_chapters(slug, sf, lang):
             return chapters_table_data(slug, sf, lang)
 
-        refresh_btn.click(refresh_stories, inputs=[status_filter], outputs=[stories_df])
+        refresh_btn.click(reload_stories, inputs=[status_filter], outputs=[stories_df])
         status_filter.change(refresh_stories, inputs=[status_filter], outputs=[stories_df])
         story_select.change(refresh_chapters, inputs=[story_select, ch_status_filter, lang_select], outputs=[chapters_df])
         ch_status_filter.change(refresh_chapters, inputs=[story_select, ch_status_filter, lang_select], outputs=[chapters_df])
@@ -200,10 +257,12 @@ def build_editor_tab():
         def on_preview(md_text):
             if not md_text:
                 return '<p><em>Nothing to preview.</em></p>'
-            return preview_markdown(md_text)
+            return cached_preview(md_text)
 
         preview_btn.click(on_preview, inputs=[md_editor], outputs=[preview_html])
-        md_editor.change(on_preview, inputs=[md_editor], outputs=[preview_html])
+        # While typing, drop queued renders and only run for the latest text
+        md_editor.change(on_preview, inputs=[md_editor], outputs=[preview_html],
+                         trigger_mode='always_last')
 
 
 # ------------------------------------------------------------------
@@ -267,6 +326,7 @@ def build_config_tab():
             try:
                 data = yaml.safe_load(yaml_text) or {}
                 save_story_config(slug, data)
+                invalidate_stories_cache()
                 return 'Story config saved.'
             except Exception as e:
                 return f'Error: {e}'
@@ -391,15 +451,14 @@ def build_assets_tab():
                 return []
             content_dir = get_content_dir()
             images_dir = os.path.join(content_dir, slug, 'images')
-            if not os.path.isdir(images_dir):
+            # scandir entries carry their type, so each file costs one stat (for its size)
+            try:
+                with os.scandir(images_dir) as it:
+                    entries = [e for e in it if e.is_file()]
+            except OSError:
                 return []
-            rows = []
-            for fname in sorted(os.listdir(images_dir)):
-                fpath = os.path.join(images_dir, fname)
-                if os.path.isfile(fpath):
-                    size_kb = round(os.path.getsize(fpath) / 1024, 1)
-                    rows.append([fname, size_kb, fpath])
-            return rows
+            entries.sort(key=lambda e: e.name)
+            return [[e.name, round(e.stat().st_size / 1024, 1), e.path] for e in entries]
 
         def upload_asset(slug, file):
             if not slug:
@@ -411,7 +470,9 @@ def build_assets_tab():
             os.makedirs(images_dir, exist_ok=True)
             dest = os.path.join(images_dir, os.path.basename(file.name))
             import shutil
-            shutil.copy2(file.name, dest)
+            # Contents only: a fresh upload has no metadata worth keeping, and
+            # copyfile takes the kernel fast path (sendfile/CopyFile) where available
+            shutil.copyfile(file.name, dest)
             return f'Uploaded to {dest}', list_assets(slug)
 
         asset_story.change(list_assets, inputs=[asset_story], outputs=[asset_list])
@@ -423,6 +484,7 @@ def build_assets_tab():
 # ------------------------------------------------------------------
 
 def create_app():
+    import_ui_modules()
     with gr.Blocks(
         title='Web Novel Studio',
         theme=gr.themes.Soft(),
@@ -448,12 +510,11 @@ if __name__ == '__main__':
                         help='Require auth using WNSG_STUDIO_USER/WNSG_STUDIO_PASSWORD env vars')
     args = parser.parse_args()
 
-    app = create_app()
-
     auth_credentials = None
     if args.require_auth or args.share:
         auth_credentials = resolve_auth_credentials()
         if auth_credentials is None and args.share:
             raise ValueError('Refusing to start with --share without credentials. Set WNSG_STUDIO_USER and WNSG_STUDIO_PASSWORD.')
 
+    app = create_app()
     app.launch(server_port=args.port, share=args.share, auth=auth_credentials)
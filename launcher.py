@@ -9,6 +9,18 @@ import os
 import sys
 import subprocess
 import ctypes
+import runpy
+
+from launcher_deps import unsatisfied_requirements
+
+# Bind MessageBoxW once with its real signature; None off Windows
+try:
+    from ctypes import wintypes
+    _MessageBoxW = ctypes.WinDLL('user32', use_last_error=True).MessageBoxW
+    _MessageBoxW.argtypes = (wintypes.HWND, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.UINT)
+    _MessageBoxW.restype = ctypes.c_int
+except (AttributeError, OSError, ValueError):
+    _MessageBoxW = None
 
 APP_DIR = os.path.dirname(os.path.abspath(sys.argv[0] if not getattr(sys, 'frozen', False)
                                            else sys.executable))
@@ -25,7 +37,10 @@ def is_admin():
 
 def show_msg(title, text, icon=0x40):
     """Show a Windows message box.  icon: 0x10=error, 0x30=warn, 0x40=info."""
-    ctypes.windll.user32.MessageBoxW(0, text, title, icon)
+    if _MessageBoxW is None:
+        print(f'{title}: {text}')
+        return
+    _MessageBoxW(None, text, title, icon)
 
 
 def install_dependencies():
@@ -44,7 +59,11 @@ def install_dependencies():
                 continue
             core_deps.append(line)
 
-    cmd = [sys.executable, '-m', 'pip', 'install', '--upgrade'] + core_deps
+    core_deps = unsatisfied_requirements(core_deps)
+    if not core_deps:
+        return True, 'All requirements already satisfied.'
+
+    cmd = [sys.executable, '-m', 'pip', 'install', '--disable-pip-version-check', '--no-input'] + core_deps
     try:
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
         if result.returncode != 0:
@@ -81,9 +100,7 @@ def launch_app():
 
     # Execute main.py in-process so the app window appears
     try:
-        with open(MAIN_SCRIPT, 'r', encoding='utf-8') as f:
-            code = f.read()
-        exec(compile(code, MAIN_SCRIPT, 'exec'), {'__name__': '__main__', '__file__': MAIN_SCRIPT})
+        runpy.run_path(MAIN_SCRIPT, run_name='__main__')
     except SystemExit:
         pass
     except Exception as e:
@@ -0,0 +1,44 @@
+"""Dependency checks shared by the launchers (launcher.py, launcher_studio.py)."""
+
+import re
+from importlib.metadata import PackageNotFoundError, version
+
+try:
+    from packaging.requirements import InvalidRequirement, Requirement
+except ImportError:
+    Requirement = None
+
+# pip's comment rule: '#' at the start of a line or after whitespace (keeps URL fragments)
+_COMMENT_RE = re.compile(r'(^|\s+)#.*$')
+
+
+def unsatisfied_requirements(requirements):
+    """Return the requirement lines the current environment doesn't already satisfy.
+
+    Checks installed versions against each pin so pip only runs for what is
+    actually missing or outdated.  Comments and blank lines are dropped, and
+    lines whose environment marker doesn't apply here are skipped.  Without
+    ``packaging`` every remaining line is returned and pip decides as before.
+    """
+    lines = [_COMMENT_RE.sub('', line).strip() for line in requirements]
+    lines = [line for line in lines if line]
+    if Requirement is None:
+        return lines
+
+    missing = []
+    for line in lines:
+        try:
+            req = Requirement(line)
+        except InvalidRequirement:
+            missing.append(line)
+            continue
+        if req.marker is not None and not req.marker.evaluate():
+            continue
+        try:
+            installed = version(req.name)
+        except PackageNotFoundError:
+            missing.append(line)
+            continue
+        if not req.specifier.contains(installed, prereleases=True):
+            missing.append(line)
+    return missing
@@ -10,6 +10,17 @@ import ctypes
 import webbrowser
 import time
 
+from launcher_deps import unsatisfied_requirements
+
+# Bind MessageBoxW once with its real signature; None off Windows
+try:
+    from ctypes import wintypes
+    _MessageBoxW = ctypes.WinDLL('user32', use_last_error=True).MessageBoxW
+    _MessageBoxW.argtypes = (wintypes.HWND, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.UINT)
+    _MessageBoxW.restype = ctypes.c_int
+except (AttributeError, OSError, ValueError):
+    _MessageBoxW = None
+
 APP_DIR = os.path.dirname(os.path.abspath(sys.argv[0] if not getattr(sys, 'frozen', False)
                                            else sys.executable))
 REQUIREMENTS = os.path.join(APP_DIR, 'requirements.txt')
@@ -17,7 +28,10 @@ STUDIO_SCRIPT = os.path.join(APP_DIR, 'gradio_studio.py')
 
 
 def show_msg(title, text, icon=0x40):
-    ctypes.windll.user32.MessageBoxW(0, text, title, icon)
+    if _MessageBoxW is None:
+        print(f'{title}: {text}')
+        return
+    _MessageBoxW(None, text, title, icon)
 
 
 def install_dependencies():
@@ -25,7 +39,18 @@ def install_dependencies():
     if not os.path.isfile(REQUIREMENTS):
         return True, 'requirements.txt not found — skipping install.'
 
-    cmd = [sys.executable, '-m', 'pip', 'install', '--upgrade', '-r', REQUIREMENTS]
+    deps = []
+    with open(REQUIREMENTS, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                deps.append(line)
+
+    deps = unsatisfied_requirements(deps)
+    if not deps:
+        return True, 'All requirements already satisfied.'
+
+    cmd = [sys.executable, '-m', 'pip', 'install', '--disable-pip-version-check', '--no-input'] + deps
     try:
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
         if result.returncode != 0:
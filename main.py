@@ -2,6 +2,10 @@
 
 import sys
 import os
+import functools
+
+if sys.platform == "win32":
+    import winreg
 
 # Ensure the app package is importable
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -11,13 +15,15 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QIcon, QPalette, QColor
 
 
-from app.main_window import MainWindow
-
-
+@functools.lru_cache(maxsize=1)
 def _is_windows_dark_mode() -> bool:
-    """Detect whether Windows is set to dark mode via registry."""
+    """Detect whether Windows is set to dark mode via registry.
+
+    Read once per session; the theme is applied at startup only.
+    """
+    if sys.platform != "win32":
+        return False
     try:
-        import winreg
         key = winreg.OpenKey(
             winreg.HKEY_CURRENT_USER,
             r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize",
@@ -29,8 +35,9 @@ def _is_windows_dark_mode() -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1)
 def _dark_palette() -> QPalette:
-    """Create a dark QPalette."""
+    """Create the dark QPalette (built once, then shared)."""
     p = QPalette()
     p.setColor(QPalette.ColorRole.Window, QColor(45, 45, 45))
     p.setColor(QPalette.ColorRole.WindowText, QColor(212, 212, 212))
@@ -54,9 +61,56 @@ def _dark_palette() -> QPalette:
     return p
 
 
-def _base_stylesheet(dark: bool) -> str:
-    if dark:
-        return """
+# Stylesheets are fixed for the session; keep them as constants so startup
+# only picks one. Individual widgets are styled here by object name rather
+# than with their own setStyleSheet calls, so the whole tree is polished once.
+_WIDGET_QSS = """
+            QLabel#welcomeTitle {
+                font-size: 28px;
+                font-weight: bold;
+            }
+            QLabel#welcomeSubtitle {
+                font-size: 14px;
+                color: #666;
+            }
+            QPushButton#newBtn {
+                font-size: 15px;
+                background-color: #0078d4;
+                color: white;
+                border: none;
+                border-radius: 6px;
+            }
+            QPushButton#newBtn:hover { background-color: #106ebe; }
+            QPushButton#openBtn {
+                font-size: 15px;
+                background-color: palette(button);
+                color: palette(button-text);
+                border: 1px solid palette(mid);
+                border-radius: 6px;
+            }
+            QPushButton#openBtn:hover { background-color: palette(midlight); }
+            QPushButton#buildBtn, QPushButton#serveBtn {
+                font-size: 14px; color: white;
+                border: none; border-radius: 6px; padding: 0 20px;
+            }
+            QPushButton#buildBtn { background-color: #28a745; }
+            QPushButton#buildBtn:hover { background-color: #218838; }
+            QPushButton#serveBtn { background-color: #0078d4; }
+            QPushButton#serveBtn:hover { background-color: #106ebe; }
+            QPushButton#buildBtn:disabled, QPushButton#serveBtn:disabled { background-color: #999; }
+            QPushButton#publishBtn {
+                font-size: 14px;
+                background-color: #28a745;
+                color: white;
+                border: none;
+                border-radius: 6px;
+                padding: 0 24px;
+            }
+            QPushButton#publishBtn:hover { background-color: #218838; }
+            QPushButton#publishBtn:disabled { background-color: #666; color: #aaa; }
+        """
+
+_DARK_QSS = """
             QMainWindow {
                 font-family: "Segoe UI", sans-serif;
             }
@@ -66,7 +120,8 @@ def _base_stylesheet(dark: bool) -> str:
                 color: #d4d4d4;
                 border: 1px solid #3c3c3c;
             }
-            QTreeWidget::item:selected {
+            QTreeWidget::item:selected, QListWidget::item:selected,
+            QMenuBar::item:selected, QMenu::item:selected {
                 background-color: #094771;
             }
             QPlainTextEdit#buildConsole {
@@ -120,32 +175,20 @@ def _base_stylesheet(dark: bool) -> str:
                 color: #d4d4d4;
                 border: 1px solid #3c3c3c;
             }
-            QListWidget::item:selected {
-                background-color: #094771;
-            }
             QMenuBar {
                 background-color: #2d2d2d;
                 color: #d4d4d4;
             }
-            QMenuBar::item:selected {
-                background-color: #094771;
-            }
             QMenu {
                 background-color: #2d2d2d;
                 color: #d4d4d4;
                 border: 1px solid #3c3c3c;
             }
-            QMenu::item:selected {
-                background-color: #094771;
-            }
             QToolBar {
                 background-color: #2d2d2d;
                 border: none;
                 spacing: 4px;
             }
-            QDockWidget {
-                color: #d4d4d4;
-            }
             QDockWidget::title {
                 background-color: #2d2d2d;
                 padding: 4px;
@@ -154,18 +197,15 @@ def _base_stylesheet(dark: bool) -> str:
                 background-color: #007acc;
                 color: white;
             }
-            QCheckBox {
-                color: #d4d4d4;
-            }
-            QLabel {
+            QDockWidget, QCheckBox, QLabel {
                 color: #d4d4d4;
             }
             QSplitter::handle {
                 background-color: #3c3c3c;
             }
-        """
-    else:
-        return """
+        """ + _WIDGET_QSS
+
+_LIGHT_QSS = """
             QMainWindow {
                 font-family: "Segoe UI", sans-serif;
             }
@@ -194,7 +234,11 @@ def _base_stylesheet(dark: bool) -> str:
                 background-color: #0078d4;
                 color: white;
             }
-        """
+        """ + _WIDGET_QSS
+
+
+def _base_stylesheet(dark: bool) -> str:
+    return _DARK_QSS if dark else _LIGHT_QSS
 
 
 def main():
@@ -211,7 +255,8 @@ def main():
     # Use Fusion style for cross-platform consistency
     app.setStyle(QStyleFactory.create("Fusion"))
 
-    # Detect dark mode and apply theme
+    # Detect dark mode and apply theme. This is the only stylesheet assignment
+    # and it happens before any widget exists, so nothing gets polished twice
     dark = _is_windows_dark_mode()
     if dark:
         app.setPalette(_dark_palette())
@@ -220,6 +265,10 @@ def main():
     # Store theme flag for widgets that need it
     app.setProperty("dark_mode", dark)
 
+    # Imported here so the window module's widget/service imports run after
+    # QApplication is up instead of delaying it at startup
+    from app.main_window import MainWindow
+
     window = MainWindow()
     window.show()
 
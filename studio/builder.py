@@ -1,83 +1,303 @@
-"""Build integration — runs generate.py as a subprocess."""
-import os
-import subprocess
-import threading
-
-
-def get_generate_script():
-    """Get the path to generate.py."""
-    return os.path.join(os.path.dirname(os.path.dirname(__file__)), 'generator', 'generate.py')
-
-
-def run_build(clean=False, include_drafts=False, include_scheduled=False,
-              no_epub=False, optimize_images=False, no_minify=False, incremental=False):
-    """Run the site generator and return (success, output).
-
-    Returns:
-        Tuple of (bool, str) — success flag and combined stdout/stderr.
-    """
-    script = get_generate_script()
-    cmd = ['python', script]
-
-    if clean:
-        cmd.append('--clean')
-    if include_drafts:
-        cmd.append('--include-drafts')
-    if include_scheduled:
-        cmd.append('--include-scheduled')
-    if no_epub:
-        cmd.append('--no-epub')
-    if optimize_images:
-        cmd.append('--optimize-images')
-    if no_minify:
-        cmd.append('--no-minify')
-    if incremental:
-        cmd.append('--incremental')
-
-    try:
-        result = subprocess.run(
-            cmd,
-            cwd=os.path.dirname(script),
-            capture_output=True,
-            text=True,
-            timeout=300,
-        )
-        output = result.stdout
-        if result.stderr:
-            output += '\n--- STDERR ---\n' + result.stderr
-        return result.returncode == 0, output
-    except subprocess.TimeoutExpired:
-        return False, 'Build timed out after 5 minutes.'
-    except Exception as e:
-        return False, f'Build failed: {e}'
-
-
-def run_build_async(callback, **kwargs):
-    """Run build in a background thread, calling callback(success, output) when done."""
-    def _worker():
-        success, output = run_build(**kwargs)
-        callback(success, output)
-
-    t = threading.Thread(target=_worker, daemon=True)
-    t.start()
-    return t
-
-
-def run_preview_server(port=8080):
-    """Start a preview server (generate.py --serve) and return the process.
-
-    Returns:
-        subprocess.Popen or None on error.
-    """
-    script = get_generate_script()
-    try:
-        proc = subprocess.Popen(
-            ['python', script, '--serve', str(port)],
-            cwd=os.path.dirname(script),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-        return proc
-    except Exception:
-        return None
+"""Build integration — runs generate.py in a reusable worker process."""
+import atexit
+import io
+import multiprocessing
+import multiprocessing.util
+import os
+import queue
+import signal
+import subprocess
+import sys
+import threading
+import time
+import traceback
+
+# Resolved once; the studio's location doesn't change while it runs
+_STUDIO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_GENERATE_SCRIPT = os.path.join(_STUDIO_ROOT, 'generator', 'generate.py')
+
+BUILD_TIMEOUT = 300
+
+# Long-lived build worker (process, jobs queue, results queue). It imports the
+# generator once, so repeated builds skip interpreter start-up and the
+# generator's imports. Builds share one output directory, so they run one at a time.
+_build_worker = None
+_worker_lock = threading.Lock()
+
+# Merged build output, reused from build to build; only touched under _worker_lock
+_output = io.StringIO()
+
+
+def get_generate_script():
+    """Get the path to generate.py."""
+    return _GENERATE_SCRIPT
+
+
+def _build_flags(clean, include_drafts, include_scheduled, no_epub,
+                 optimize_images, no_minify, incremental):
+    """Return the generate.py command-line flags for a set of build options."""
+    flags = []
+    if clean:
+        flags.append('--clean')
+    if include_drafts:
+        flags.append('--include-drafts')
+    if include_scheduled:
+        flags.append('--include-scheduled')
+    if no_epub:
+        flags.append('--no-epub')
+    if optimize_images:
+        flags.append('--optimize-images')
+    if no_minify:
+        flags.append('--no-minify')
+    if incremental:
+        flags.append('--incremental')
+    return flags
+
+
+def _forward_lines(read_fd, results):
+    with open(read_fd, encoding='utf-8', errors='replace') as reader:
+        for line in reader:
+            results.put(('line', line))
+
+
+def _run_build_job(generate, options, results):
+    """Run one build inside the worker, streaming its output to ``results``.
+
+    stdout and stderr are merged into one pipe at the file-descriptor level,
+    so processes the generator starts (chapter render pools) are captured
+    as well. Each line is sent as ('line', text); the caller sends 'done'.
+    """
+    read_fd, write_fd = os.pipe()
+    forwarder = threading.Thread(target=_forward_lines, args=(read_fd, results))
+    forwarder.start()
+
+    saved_streams = sys.stdout, sys.stderr
+    saved_fds = []
+    success = True
+    try:
+        for fd in (1, 2):
+            try:
+                saved_fds.append((fd, os.dup(fd)))
+                os.dup2(write_fd, fd)
+            except OSError:
+                pass  # no console handle to redirect (pythonw)
+        sys.stdout = sys.stderr = open(write_fd, 'w', encoding='utf-8', errors='replace',
+                                       buffering=1)
+        try:
+            if options.pop('clean'):
+                generate.clean_build_directory()
+            generate.build_site(**options)
+        except SystemExit as e:
+            success = e.code in (None, 0)
+        except Exception:
+            traceback.print_exc()
+            success = False
+    finally:
+        if sys.stdout not in saved_streams:
+            sys.stdout.close()  # closes write_fd
+        sys.stdout, sys.stderr = saved_streams
+        for fd, saved in saved_fds:
+            os.dup2(saved, fd)
+            os.close(saved)
+        # Every write end is closed now, so the forwarder sees EOF
+        forwarder.join()
+
+    return success
+
+
+def _build_worker_main(jobs, results):
+    """Worker process loop: import the generator once, then build on request."""
+    if hasattr(os, 'setpgrp'):
+        # Own process group, so a timed-out build can be killed with its render pool
+        os.setpgrp()
+    generator_dir = os.path.dirname(_GENERATE_SCRIPT)
+    # The generator resolves content/templates/build relative to its own folder
+    os.chdir(generator_dir)
+    sys.path.insert(0, generator_dir)
+    sys.argv = [_GENERATE_SCRIPT]
+    import generate
+
+    while True:
+        options = jobs.get()
+        if options is None:
+            return
+        results.put(('done', _run_build_job(generate, options, results)))
+
+
+def _start_worker():
+    global _build_worker
+    # Not a daemon: the generator renders chapters in its own process pool
+    jobs = multiprocessing.Queue()
+    results = multiprocessing.Queue()
+    proc = multiprocessing.Process(target=_build_worker_main, args=(jobs, results),
+                                   name='wnsg-build-worker')
+    proc.start()
+    _build_worker = (proc, jobs, results)
+    return _build_worker
+
+
+def _kill_worker(proc):
+    """Kill the worker along with the processes the generator started in it."""
+    if os.name == 'nt':
+        subprocess.run(['taskkill', '/F', '/T', '/PID', str(proc.pid)],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                       creationflags=subprocess.CREATE_NO_WINDOW)
+    else:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except OSError:
+            pass  # the worker hasn't made its own group yet
+    proc.kill()
+    proc.join()
+
+
+def _stop_worker(timeout=5):
+    global _build_worker
+    if _build_worker is None:
+        return
+    proc, jobs, _ = _build_worker
+    _build_worker = None
+    if proc.is_alive():
+        jobs.put(None)
+        proc.join(timeout)
+        if proc.is_alive():
+            _kill_worker(proc)
+
+
+# Registered after multiprocessing.util is imported, so it runs before
+# multiprocessing's exit handler, which would otherwise wait forever on the idle worker
+atexit.register(_stop_worker)
+
+
+def _reset_output():
+    _output.seek(0)
+    _output.truncate()
+    return _output
+
+
+def _run_build_subprocess(flags, line_callback=None):
+    """Fallback: run generate.py in a fresh interpreter, streaming its output.
+
+    Called with _worker_lock held.
+    """
+    script = get_generate_script()
+    try:
+        proc = subprocess.Popen(
+            [sys.executable, script] + flags,
+            cwd=os.path.dirname(script),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+    except Exception as e:
+        return False, f'Build failed: {e}'
+
+    # Reading the pipe blocks, so the timeout kills the process instead
+    timed_out = threading.Event()
+
+    def _kill():
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(BUILD_TIMEOUT, _kill)
+    timer.start()
+    output = _reset_output()
+    try:
+        for line in proc.stdout:
+            output.write(line)
+            if line_callback:
+                line_callback(line)
+        proc.wait()
+    finally:
+        timer.cancel()
+        proc.stdout.close()
+    if timed_out.is_set():
+        return False, 'Build timed out after 5 minutes.'
+    return proc.returncode == 0, output.getvalue()
+
+
+def run_build(clean=False, include_drafts=False, include_scheduled=False,
+              no_epub=False, optimize_images=False, no_minify=False, incremental=False,
+              line_callback=None):
+    """Run the site generator and return (success, output).
+
+    Builds go to a long-lived worker process; a fresh generate.py
+    subprocess is used if the worker can't be started. If given,
+    ``line_callback(line)`` is called with each output line as it arrives.
+
+    Returns:
+        Tuple of (bool, str) — success flag and combined stdout/stderr.
+    """
+    options = {
+        'clean': clean,
+        'include_drafts': include_drafts,
+        'include_scheduled': include_scheduled,
+        'no_epub': no_epub,
+        'optimize_images': optimize_images,
+        'no_minify': no_minify,
+        'incremental': incremental,
+    }
+
+    with _worker_lock:
+        try:
+            proc, jobs, results = (_build_worker if _build_worker and _build_worker[0].is_alive()
+                                   else _start_worker())
+        except Exception:
+            return _run_build_subprocess(_build_flags(**options), line_callback)
+
+        jobs.put(options)
+        deadline = time.monotonic() + BUILD_TIMEOUT
+        output = _reset_output()
+        while True:
+            try:
+                kind, payload = results.get(timeout=1)
+            except queue.Empty:
+                if not proc.is_alive():
+                    _stop_worker()
+                    return False, f'Build failed: build worker exited with code {proc.exitcode}.'
+                if time.monotonic() > deadline:
+                    # A hung build can't be interrupted in-process; replace the worker
+                    _kill_worker(proc)
+                    _stop_worker()
+                    return False, 'Build timed out after 5 minutes.'
+                continue
+            if kind == 'done':
+                return payload, output.getvalue()
+            output.write(payload)
+            if line_callback:
+                line_callback(payload)
+
+
+def run_build_async(callback, line_callback=None, **kwargs):
+    """Run build in a background thread, calling callback(success, output) when done.
+
+    ``line_callback(line)``, if given, receives each output line as the build runs.
+    """
+    def _worker():
+        success, output = run_build(line_callback=line_callback, **kwargs)
+        callback(success, output)
+
+    t = threading.Thread(target=_worker, daemon=True)
+    t.start()
+    return t
+
+
+def run_preview_server(port=8080):
+    """Start a preview server (generate.py --serve) and return the process.
+
+    Returns:
+        subprocess.Popen or None on error.
+    """
+    script = get_generate_script()
+    try:
+        proc = subprocess.Popen(
+            [sys.executable, script, '--serve', str(port)],
+            cwd=os.path.dirname(script),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        return proc
+    except Exception:
+        return None
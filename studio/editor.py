@@ -1,10 +1,24 @@
 """Chapter editor with live markdown preview."""
+import functools
+import hashlib
 import os
+import re
 import sys
-import yaml
 
-# Add generator to path for importing convert_markdown_to_html
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'generator'))
+# Opening '---' line, front matter, closing '---' line, body
+_FM_RE = re.compile(r'\A---[^\n]*\n(.*?)^---[ \t]*(?:\n|\Z)(.*)', re.DOTALL | re.MULTILINE)
+
+# Last save per chapter file: path -> (mtime_ns, size, content digest). A save
+# with identical content is skipped unless the file changed on disk since.
+_last_saved = {}
+
+
+def _bootstrap_generator_path():
+    """Make the generator importable; safe to call more than once."""
+    from panels import get_generator_dir
+    generator_dir = get_generator_dir()
+    if generator_dir not in sys.path:
+        sys.path.insert(0, generator_dir)
 
 
 def load_chapter(story_slug, chapter_id, language='en'):
@@ -20,19 +34,19 @@ def load_chapter(story_slug, chapter_id, language='en'):
     lang_path = os.path.join(content_dir, story_slug, 'chapters', language, f'{chapter_id}.md')
     default_path = os.path.join(content_dir, story_slug, 'chapters', f'{chapter_id}.md')
 
-    filepath = lang_path if os.path.exists(lang_path) else default_path
-
-    if not os.path.exists(filepath):
+    for filepath in (lang_path, default_path):
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                content = f.read()
+            break
+        except FileNotFoundError:
+            continue
+    else:
         return '', ''
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Split front matter and body
-    if content.startswith('---'):
-        parts = content.split('---', 2)
-        if len(parts) >= 3:
-            return parts[1].strip(), parts[2].strip()
+    m = _FM_RE.match(content)
+    if m:
+        return m.group(1).strip(), m.group(2).strip()
 
     return '', content
 
@@ -53,11 +67,25 @@ def save_chapter(story_slug, chapter_id, front_matter_str, markdown_body, langua
 
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
 
-    content = f'---\n{front_matter_str}\n---\n\n{markdown_body}'
-
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
+    data = f'---\n{front_matter_str}\n---\n\n{markdown_body}'.encode('utf-8')
+    digest = hashlib.blake2b(data, digest_size=16).digest()
 
+    try:
+        st = os.stat(filepath)
+        if _last_saved.get(filepath) == (st.st_mtime_ns, st.st_size, digest):
+            return filepath
+    except FileNotFoundError:
+        pass
+
+    # Binary write skips newline translation; the rename means a reader
+    # (or a crash) never sees a half-written chapter
+    tmp_path = filepath + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, filepath)
+
+    st = os.stat(filepath)
+    _last_saved[filepath] = (st.st_mtime_ns, st.st_size, digest)
     return filepath
 
 
@@ -67,10 +95,27 @@ def preview_markdown(markdown_text):
     Returns:
         HTML string
     """
+    return _markdown_converter()(markdown_text)
+
+
+@functools.lru_cache(maxsize=None)
+def _markdown_converter():
+    """Resolve the preview converter on first use and keep it.
+
+    Deferred rather than done at import: importing the generator is the
+    slowest part of the studio's start-up.
+    """
+    _bootstrap_generator_path()
     try:
         from generate import convert_markdown_to_html
-        return convert_markdown_to_html(markdown_text)
+        return convert_markdown_to_html
     except ImportError:
-        # Fallback: basic markdown conversion
-        import markdown
-        return markdown.markdown(markdown_text, extensions=['footnotes', 'tables', 'attr_list'])
+        return _basic_markdown_to_html
+
+
+# convert_markdown_to_html keeps its own cache; this covers the fallback path
+@functools.lru_cache(maxsize=32)
+def _basic_markdown_to_html(markdown_text):
+    """Fallback: basic markdown conversion."""
+    import markdown
+    return markdown.markdown(markdown_text, extensions=['footnotes', 'tables', 'attr_list'])
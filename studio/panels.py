@@ -1,16 +1,136 @@
 """Panels for story listing and chapter management."""
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import yaml
 
+# libyaml's C loader/dumper when PyYAML was built with it; same safe semantics either way
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+# Resolved once; the studio's location doesn't change while it runs
+_STUDIO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_GENERATOR_DIR = os.path.join(_STUDIO_ROOT, 'generator')
+_CONTENT_DIR = os.path.join(_GENERATOR_DIR, 'content')
+
+# Sorted directory listings keyed on path; each entry is (dir mtime_ns, entries),
+# so a listing is only redone after files are added, removed or renamed
+_LISTING_CACHE = {}
+
+# Parsed files keyed on path; each entry is ((mtime_ns, size), data), so
+# unchanged configs and chapters cost a stat instead of an open and a parse.
+# Least recently used entries are dropped past PARSED_CACHE_SIZE; the lock
+# covers list_chapters' header threads.
+PARSED_CACHE_SIZE = 4096
+_PARSED_CACHE = OrderedDict()
+_PARSED_CACHE_LOCK = threading.Lock()
+
+# Chapter headers are read on a thread pool once this many of a folder's
+# chapters are not cached; below that, pool start-up costs more than the
+# overlapped I/O saves
+PARALLEL_HEADER_MIN_FILES = 32
+HEADER_READ_WORKERS = 8
+
+# Front matter longer than this is treated as missing, so a stray opening
+# '---' never makes a listing read a whole chapter body
+FRONT_MATTER_MAX_CHARS = 64 * 1024
+
 
 def get_content_dir():
     """Get the content directory path."""
-    return os.path.join(os.path.dirname(os.path.dirname(__file__)), 'generator', 'content')
+    return _CONTENT_DIR
 
 
 def get_generator_dir():
     """Get the generator directory path."""
-    return os.path.join(os.path.dirname(os.path.dirname(__file__)), 'generator')
+    return _GENERATOR_DIR
+
+
+def _scandir_sorted(path):
+    """Return (name, is_dir) pairs for path sorted by name.
+
+    Uses os.scandir so entry types come from the directory listing rather
+    than a stat per entry; reused while the directory's mtime is unchanged.
+    """
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _LISTING_CACHE.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    with os.scandir(path) as it:
+        entries = sorted((entry.name, entry.is_dir()) for entry in it)
+    _LISTING_CACHE[path] = (mtime_ns, entries)
+    return entries
+
+
+def _cached_parse(path):
+    """Return (stat key, cached data or None) for path, without parsing it."""
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    with _PARSED_CACHE_LOCK:
+        cached = _PARSED_CACHE.get(path)
+        if cached is not None and cached[0] == key:
+            _PARSED_CACHE.move_to_end(path)
+            return key, cached[1]
+    return key, None
+
+
+def _parse_cached(path, parse):
+    """Return parse(path), reused while the file's mtime and size are unchanged.
+
+    The result is shared between calls and must not be mutated.
+    """
+    key, data = _cached_parse(path)
+    if data is not None:
+        return data
+    data = parse(path)
+    with _PARSED_CACHE_LOCK:
+        _PARSED_CACHE[path] = (key, data)
+        _PARSED_CACHE.move_to_end(path)
+        if len(_PARSED_CACHE) > PARSED_CACHE_SIZE:
+            _PARSED_CACHE.popitem(last=False)
+    return data
+
+
+def _read_yaml(path):
+    """Parse a whole YAML file, treating an empty file as {}."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=_Loader) or {}
+
+
+def read_front_matter(filepath):
+    """Parse a chapter's YAML front matter without reading its body.
+
+    Stops at the closing ``---`` line, so long chapters cost no more than
+    short ones.  Returns {} when there is no (well-formed) front matter.
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        # Probe before readline(): a body-only chapter may open with a huge line
+        if f.read(3) != '---':
+            return {}
+        f.readline()
+        lines = []
+        size = 0
+        for line in f:
+            if line.rstrip() == '---':
+                break
+            size += len(line)
+            if size > FRONT_MATTER_MAX_CHARS:
+                return {}
+            lines.append(line)
+        else:
+            return {}  # never closed
+    try:
+        return yaml.load(''.join(lines), Loader=_Loader) or {}
+    except yaml.YAMLError:
+        return {}
+
+
+def _chapter_header(filepath):
+    return _parse_cached(filepath, read_front_matter)
 
 
 def list_stories():
@@ -25,17 +145,20 @@ def list_stories():
     if not os.path.exists(content_dir):
         return stories
 
-    for slug in sorted(os.listdir(content_dir)):
-        config_path = os.path.join(content_dir, slug, 'config.yaml')
-        if os.path.isfile(config_path):
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f) or {}
-            stories.append({
-                'slug': slug,
-                'title': config.get('title', slug),
-                'status': config.get('status', 'unknown'),
-                'description': config.get('description', ''),
-            })
+    for slug, is_dir in _scandir_sorted(content_dir):
+        if not is_dir:
+            continue
+        try:
+            # The cache's stat doubles as the existence check
+            config = _parse_cached(os.path.join(content_dir, slug, 'config.yaml'), _read_yaml)
+        except FileNotFoundError:
+            continue
+        stories.append({
+            'slug': slug,
+            'title': config.get('title', slug),
+            'status': config.get('status', 'unknown'),
+            'description': config.get('description', ''),
+        })
 
     return stories
 
@@ -57,25 +180,23 @@ def list_chapters(story_slug, language='en'):
     if not os.path.isdir(search_dir):
         return chapters
 
-    for fname in sorted(os.listdir(search_dir)):
-        if not fname.endswith('.md'):
-            continue
+    fnames = [fname for fname, is_dir in _scandir_sorted(search_dir)
+              if not is_dir and fname.endswith('.md')]
+    filepaths = [os.path.join(search_dir, fname) for fname in fnames]
+    headers = [_cached_parse(path)[1] for path in filepaths]
+    misses = [i for i, metadata in enumerate(headers) if metadata is None]
+    if len(misses) >= PARALLEL_HEADER_MIN_FILES:
+        # Overlaps per-file open/read latency; map() keeps the sorted order
+        with ThreadPoolExecutor(max_workers=HEADER_READ_WORKERS) as executor:
+            parsed = executor.map(_chapter_header, [filepaths[i] for i in misses])
+            for i, metadata in zip(misses, parsed):
+                headers[i] = metadata
+    else:
+        for i in misses:
+            headers[i] = _chapter_header(filepaths[i])
+
+    for fname, metadata in zip(fnames, headers):
         chapter_id = fname[:-3]
-        filepath = os.path.join(search_dir, fname)
-
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Parse front matter
-        metadata = {}
-        if content.startswith('---'):
-            parts = content.split('---', 2)
-            if len(parts) >= 3:
-                try:
-                    metadata = yaml.safe_load(parts[1]) or {}
-                except yaml.YAMLError:
-                    pass
-
         chapters.append({
             'id': chapter_id,
             'title': metadata.get('title', chapter_id),
@@ -90,46 +211,46 @@ def list_chapters(story_slug, language='en'):
 def load_site_config():
     """Load the site config."""
     config_path = os.path.join(get_generator_dir(), 'site_config.yaml')
-    if os.path.exists(config_path):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f) or {}
-    return {}
+    try:
+        return _read_yaml(config_path)
+    except FileNotFoundError:
+        return {}
 
 
 def save_site_config(config_data):
     """Save the site config."""
     config_path = os.path.join(get_generator_dir(), 'site_config.yaml')
     with open(config_path, 'w', encoding='utf-8') as f:
-        yaml.dump(config_data, f, default_flow_style=False, allow_unicode=True)
+        yaml.dump(config_data, f, Dumper=_Dumper, default_flow_style=False, allow_unicode=True)
 
 
 def load_story_config(story_slug):
     """Load a story config."""
     config_path = os.path.join(get_content_dir(), story_slug, 'config.yaml')
-    if os.path.exists(config_path):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f) or {}
-    return {}
+    try:
+        return _read_yaml(config_path)
+    except FileNotFoundError:
+        return {}
 
 
 def save_story_config(story_slug, config_data):
     """Save a story config."""
     config_path = os.path.join(get_content_dir(), story_slug, 'config.yaml')
     with open(config_path, 'w', encoding='utf-8') as f:
-        yaml.dump(config_data, f, default_flow_style=False, allow_unicode=True)
+        yaml.dump(config_data, f, Dumper=_Dumper, default_flow_style=False, allow_unicode=True)
 
 
 def load_authors_config():
     """Load the authors config."""
     config_path = os.path.join(get_generator_dir(), 'authors.yaml')
-    if os.path.exists(config_path):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f) or {}
-    return {}
+    try:
+        return _read_yaml(config_path)
+    except FileNotFoundError:
+        return {}
 
 
 def save_authors_config(config_data):
     """Save the authors config."""
     config_path = os.path.join(get_generator_dir(), 'authors.yaml')
     with open(config_path, 'w', encoding='utf-8') as f:
-        yaml.dump(config_data, f, default_flow_style=False, allow_unicode=True)
+        yaml.dump(config_data, f, Dumper=_Dumper, default_flow_style=False, allow_unicode=True)
@@ -39,3 +39,55 @@ def test_build_cache_persist_and_match(tmp_path, monkeypatch):
     assert payload["fingerprint"] == fp
     assert gen.should_skip_build(fp)
     assert not gen.should_skip_build("different")
+
+
+def test_build_fingerprint_tracks_nested_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    chapters = tmp_path / "content" / "novel" / "chapters"
+    chapters.mkdir(parents=True)
+    chapter = chapters / "chapter-1.md"
+    chapter.write_text("hello", encoding="utf-8")
+
+    from generator import generate as gen
+
+    fp1 = gen.compute_build_fingerprint()
+    assert gen.compute_build_fingerprint() == fp1
+
+    chapter.write_text("hello, world", encoding="utf-8")
+    assert gen.compute_build_fingerprint() != fp1
+
+
+def test_link_scan_reuses_unchanged_pages(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    build_dir = tmp_path / "build"
+    build_dir.mkdir()
+    (build_dir / "about.html").write_text('<a href="index.html">Home</a>', encoding="utf-8")
+    index = build_dir / "index.html"
+    index.write_text('<a href="about.html">About</a>', encoding="utf-8")
+
+    from generator import generate as gen
+
+    monkeypatch.setattr(gen, "BUILD_DIR", str(build_dir))
+    monkeypatch.setattr(gen, "LINK_SCAN_CACHE_FILE", str(tmp_path / "link-scan-cache.json"))
+    monkeypatch.setattr(gen, "_BROKEN_LINKS_REPORT", str(tmp_path / "broken_links_report.md"))
+    monkeypatch.setattr(gen, "load_site_config", lambda: {})
+
+    parsed = []
+    scan_html_files = gen.scan_html_files
+
+    def recording_scan(worker, html_files):
+        parsed.append(sorted(html_file.name for html_file in html_files))
+        return scan_html_files(worker, html_files)
+
+    monkeypatch.setattr(gen, "scan_html_files", recording_scan)
+
+    gen.check_broken_links()
+    gen.check_broken_links()
+    index.write_text('<a href="about.html">About</a> <a href="missing.html">Gone</a>',
+                     encoding="utf-8")
+    gen.check_broken_links()
+
+    assert parsed == [["about.html", "index.html"], [], ["index.html"]]
+    cache = json.loads((tmp_path / "link-scan-cache.json").read_text(encoding="utf-8"))
+    assert ["Internal Link", "missing.html"] in cache["pages"]["index.html"]["references"]
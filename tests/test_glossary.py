@@ -0,0 +1,17 @@
+from generator.modules import glossary
+
+
+def test_auto_link_terms_matches_escaped_terms():
+    glossary_data = {'terms': [{'term': 'Q&A', 'definition': 'Questions and answers'}]}
+
+    html = glossary.auto_link_terms('<p>The Q&amp;A session.</p>', glossary_data)
+
+    assert 'class="glossary-linked-term"' in html
+    assert 'session.' in html
+
+
+def test_auto_link_terms_leaves_unrelated_html_alone():
+    glossary_data = {'terms': [{'term': 'Mana', 'definition': 'Magic energy'}]}
+    html_content = '<p>Nothing to see here.</p>'
+
+    assert glossary.auto_link_terms(html_content, glossary_data) == html_content
@@ -0,0 +1,40 @@
+from importlib.metadata import version
+
+import pytest
+
+pytest.importorskip("packaging")
+
+from launcher_deps import unsatisfied_requirements
+
+PYTEST_VERSION = version("pytest")
+
+
+def test_satisfied_pin_is_skipped():
+    assert unsatisfied_requirements([f"pytest=={PYTEST_VERSION}"]) == []
+    assert unsatisfied_requirements(["pytest>=1.0"]) == []
+
+
+def test_missing_package_is_returned():
+    assert unsatisfied_requirements(["wngen-no-such-package==1.0"]) == ["wngen-no-such-package==1.0"]
+
+
+def test_version_mismatch_is_returned():
+    assert unsatisfied_requirements(["pytest<1.0"]) == ["pytest<1.0"]
+
+
+def test_env_marker_that_does_not_apply_is_skipped():
+    skipped = 'wngen-no-such-package==1.0; platform_system == "NoSuchOS"'
+    applies = 'wngen-no-such-package==1.0; python_version >= "3"'
+    assert unsatisfied_requirements([skipped]) == []
+    assert unsatisfied_requirements([applies]) == [applies]
+
+
+def test_comments_and_blank_lines_are_ignored():
+    requirements = [
+        "# Core dependencies",
+        "",
+        "   ",
+        "pytest>=1.0  # test runner",
+        "wngen-no-such-package==1.0  # not installed",
+    ]
+    assert unsatisfied_requirements(requirements) == ["wngen-no-such-package==1.0"]
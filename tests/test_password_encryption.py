@@ -0,0 +1,56 @@
+import base64
+import hashlib
+
+import pytest
+
+from generator import generate as gen
+
+CONTENT = '<div class="chapter-content">\nSecret chapter — ünïcode text.\n</div>'
+
+
+def _split_payload(payload):
+    scheme, _, encoded = payload.partition(':')
+    raw = base64.b64decode(encoded)
+    return scheme, raw[:16], raw[16:]
+
+
+def test_aes_payload_round_trip(monkeypatch):
+    pytest.importorskip('cryptography')
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+    monkeypatch.setattr(gen, 'CRYPTOGRAPHY_AVAILABLE', True)
+
+    payload, verification_hash = gen.encrypt_content_with_password(CONTENT, 'hunter2')
+
+    scheme, salt, body = _split_payload(payload)
+    assert scheme == 'aes-ctr-v2'
+    key, expected_hash = gen.derive_password_keys('hunter2', salt)
+    assert verification_hash == expected_hash
+    decryptor = Cipher(algorithms.AES(key), modes.CTR(body[:16])).decryptor()
+    assert (decryptor.update(body[16:]) + decryptor.finalize()).decode('utf-8') == CONTENT
+
+
+def test_xor_fallback_payload_round_trip(monkeypatch):
+    monkeypatch.setattr(gen, 'CRYPTOGRAPHY_AVAILABLE', False)
+
+    payload, verification_hash = gen.encrypt_content_with_password(CONTENT, 'hunter2')
+
+    scheme, salt, body = _split_payload(payload)
+    assert scheme == 'xor-v2'
+    key, expected_hash = gen.derive_password_keys('hunter2', salt)
+    assert verification_hash == expected_hash
+    keystream = b''.join(hashlib.sha256(key + i.to_bytes(4, 'big')).digest()
+                         for i in range(len(body) // 32 + 1))
+    assert bytes(b ^ k for b, k in zip(body, keystream)).decode('utf-8') == CONTENT
+
+
+def test_verification_hash_is_salted_and_separate_from_key(monkeypatch):
+    monkeypatch.setattr(gen, 'CRYPTOGRAPHY_AVAILABLE', False)
+
+    payload_a, hash_a = gen.encrypt_content_with_password(CONTENT, 'hunter2')
+    payload_b, hash_b = gen.encrypt_content_with_password(CONTENT, 'hunter2')
+
+    assert _split_payload(payload_a)[1] != _split_payload(payload_b)[1]
+    assert hash_a != hash_b
+    key, _ = gen.derive_password_keys('hunter2', _split_payload(payload_a)[1])
+    assert bytes.fromhex(hash_a) not in key
+    assert hash_a != hashlib.sha256(b'hunter2').hexdigest()[:len(hash_a)]
@@ -0,0 +1,26 @@
+from generator.modules import search
+
+
+def test_excerpt_keeps_angle_brackets_in_prose():
+    md = ('I <3 you, said Alice.\n\nShe walked home.\n\n'
+          'The sign read: North -> Castle.\n\nEnd.')
+    assert search._md_to_text(md) == ('I <3 you, said Alice. She walked home. '
+                                      'The sign read: North -> Castle. End.')
+    assert search._md_to_text('If x < 5 and y > 3 then run.') == 'If x < 5 and y > 3 then run.'
+
+
+def test_excerpt_strips_inline_html_tags():
+    md = 'A <span class="note">quiet</span> line<br>\nand <em>more</em> here.'
+    assert search._md_to_text(md) == 'A quiet line and more here.'
+
+
+def test_excerpt_cache_round_trip_and_version(tmp_path, monkeypatch):
+    cache_file = str(tmp_path / 'search-cache.json')
+    excerpts = {'novel/en/chapter-1': [1, 2, 'Hello']}
+
+    search.persist_excerpt_cache(cache_file, 2000, excerpts)
+    assert search.load_excerpt_cache(cache_file, 2000) == excerpts
+    assert search.load_excerpt_cache(cache_file, 500) == {}
+
+    monkeypatch.setattr(search, 'EXCERPT_CACHE_VERSION', search.EXCERPT_CACHE_VERSION + 1)
+    assert search.load_excerpt_cache(cache_file, 2000) == {}